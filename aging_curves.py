@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+에이징 커브 모듈
+연속 두 시즌 기록의 차이(paired-season delta)를 경력 연차별로 평균 내어 누적하는 방식으로
+지표별 경력 연차 곡선을 전체 기록에 대해 한 번에 계산하고, 작은 조회용 배열로 저장/로드
+(생년월일 컬럼이 저장되면 같은 방식으로 나이별 곡선도 계산)
+"""
+
+import argparse
+import logging
+import os
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from config import (
+    AGING_CURVES_PATH, AGING_MAX_CAREER_YEARS, AGING_MIN_AGE, AGING_MAX_AGE, AGING_MIN_PAIRS,
+    AGING_PLAYING_TIME_COLUMNS, BATTING_METRICS, PITCHING_METRICS,
+)
+
+logger = logging.getLogger(__name__)
+
+AGING_METRICS = {
+    'batter': BATTING_METRICS,
+    'pitcher': PITCHING_METRICS,
+}
+
+
+def _delta_curve(keys, pair_mask, deltas, weights, n_bins, min_pairs):
+    """
+    시즌 쌍의 앞 시즌 구간(key)별 가중 평균 차이를 누적하여 (구간 × 지표) 곡선을 만듭니다.
+    표본이 min_pairs 미만인 구간의 차이는 0으로 두어 곡선이 평평하게 이어지도록 합니다.
+    """
+    from_keys = keys[:-1][pair_mask]
+    pair_deltas = deltas[pair_mask]
+    pair_weights = weights[pair_mask]
+    n_steps = n_bins - 1
+
+    counts = np.bincount(from_keys, minlength=n_bins)[:n_steps]
+    weight_sum = np.bincount(from_keys, weights=pair_weights, minlength=n_bins)[:n_steps]
+    mean_delta = np.column_stack([
+        np.bincount(from_keys, weights=pair_weights * pair_deltas[:, j], minlength=n_bins)[:n_steps]
+        for j in range(pair_deltas.shape[1])
+    ]) / np.maximum(weight_sum, 1e-12)[:, None]
+    mean_delta[counts < min_pairs] = 0.0
+
+    curve = np.vstack([np.zeros((1, pair_deltas.shape[1])), np.cumsum(mean_delta, axis=0)])
+    return curve.astype(np.float32), counts.astype(np.int32)
+
+
+def compute_aging_curves(df: pd.DataFrame, metrics: List[str], player_type: str,
+                         max_career_years: int = AGING_MAX_CAREER_YEARS, min_pairs: int = AGING_MIN_PAIRS) -> Dict:
+    """
+    지표별 경력 연차(및 나이) 곡선을 한 번의 벡터 연산으로 계산합니다.
+
+    같은 선수의 연속 시즌 (t, t+1) 쌍마다 지표 차이를 구하고, 두 시즌 출전량의 조화 평균으로 가중하여
+    t 시즌의 경력 연차별로 평균 낸 뒤 누적합니다. curve[c]는 첫 시즌 대비 c년차의 평균 변화량입니다.
+
+    Args:
+        df: 선수 시즌 기록 데이터 (PlayerID, Season, 지표 컬럼, 선택적으로 BirthDate)
+        metrics: 곡선을 계산할 지표 리스트
+        player_type: 'batter' 또는 'pitcher' (출전량 가중 컬럼 선택)
+        max_career_years: 경력 연차 상한 (이후 연차는 마지막 연차로 묶음)
+        min_pairs: 구간 평균에 필요한 최소 시즌 쌍 수
+
+    Returns:
+        metrics, career(연차 × 지표 float32 배열), career_pairs, age/age_pairs(생년월일이 없으면 None) 딕셔너리
+    """
+    data = df.sort_values(['PlayerID', 'Season'])
+    values = data[metrics].to_numpy(dtype=float)
+    player_ids = data['PlayerID'].to_numpy()
+    seasons = data['Season'].to_numpy()
+
+    # 같은 선수의 바로 다음 시즌 쌍만 사용 (길이 n - 1의 쌍 배열)
+    pair_mask = (player_ids[1:] == player_ids[:-1]) & (seasons[1:] - seasons[:-1] == 1)
+    deltas = values[1:] - values[:-1]
+
+    playing_time = data[AGING_PLAYING_TIME_COLUMNS[player_type]].to_numpy(dtype=float).sum(axis=1)
+    before, after = playing_time[:-1], playing_time[1:]
+    weights = 2 * before * after / np.maximum(before + after, 1e-12)
+
+    first_season = data.groupby('PlayerID', sort=False)['Season'].transform('min').to_numpy()
+    career = np.minimum(seasons - first_season, max_career_years - 1)
+    career_curve, career_pairs = _delta_curve(career, pair_mask, deltas, weights, max_career_years, min_pairs)
+
+    age_curve, age_pairs = None, None
+    if 'BirthDate' in data.columns:
+        birth_year = pd.to_datetime(data['BirthDate'], errors='coerce').dt.year.to_numpy(dtype=float)
+        known = ~np.isnan(birth_year)
+        age = np.clip(np.nan_to_num(seasons - birth_year), AGING_MIN_AGE, AGING_MAX_AGE).astype(np.int64) - AGING_MIN_AGE
+        age_curve, age_pairs = _delta_curve(age, pair_mask & known[1:] & known[:-1], deltas, weights,
+                                            AGING_MAX_AGE - AGING_MIN_AGE + 1, min_pairs)
+
+    return {
+        'metrics': list(metrics),
+        'career': career_curve,
+        'career_pairs': career_pairs,
+        'age': age_curve,
+        'age_pairs': age_pairs,
+    }
+
+
+def aging_delta(curves: Dict, metrics: List[str], career, steps) -> np.ndarray:
+    """
+    경력 연차 career인 선수들이 steps년 뒤 겪을 평균 변화량을 (선수, 지표, 기간) 배열로 조회합니다.
+    곡선이 없는 지표는 0입니다.
+    """
+    career = np.asarray(career)
+    table = curves['career']
+    last = len(table) - 1
+    columns = [curves['metrics'].index(m) if m in curves['metrics'] else -1 for m in metrics]
+    padded = np.hstack([table, np.zeros((len(table), 1), dtype=table.dtype)])  # -1 열 = 0
+
+    start = np.minimum(career, last)
+    end = np.minimum(career[:, None] + np.asarray(steps)[None, :], last)
+    return (padded[end][:, :, columns] - padded[start][:, None, columns]).transpose(0, 2, 1)
+
+
+def save_aging_curves(curves_by_type: Dict[str, Dict], data_versions: Dict[str, str], path: str = AGING_CURVES_PATH):
+    """선수 유형별 곡선을 하나의 압축 npz 파일로 저장합니다."""
+    arrays = {}
+    for player_type, curves in curves_by_type.items():
+        arrays[f'{player_type}_metrics'] = np.array(curves['metrics'])
+        arrays[f'{player_type}_version'] = np.array(data_versions[player_type])
+        for name in ('career', 'career_pairs', 'age', 'age_pairs'):
+            if curves[name] is not None:
+                arrays[f'{player_type}_{name}'] = curves[name]
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    np.savez_compressed(path, **arrays)
+
+
+def load_aging_curves(player_type: str, data_version: str, path: str = AGING_CURVES_PATH) -> Optional[Dict]:
+    """저장된 곡선을 로드합니다. 파일이 없거나 데이터 버전이 다르면 None을 반환합니다."""
+    if not os.path.exists(path):
+        return None
+    try:
+        with np.load(path) as stored:
+            if f'{player_type}_version' not in stored or str(stored[f'{player_type}_version']) != data_version:
+                return None
+            return {
+                'metrics': stored[f'{player_type}_metrics'].tolist(),
+                **{name: stored[f'{player_type}_{name}'] if f'{player_type}_{name}' in stored else None
+                   for name in ('career', 'career_pairs', 'age', 'age_pairs')},
+            }
+    except (OSError, ValueError) as e:
+        logger.warning(f"에이징 커브 로드 실패 ({path}): {e}")
+        return None
+
+
+def resolve_aging_curves(df: pd.DataFrame, player_type: str, data_version: str, path: str = AGING_CURVES_PATH) -> Dict:
+    """저장된 곡선이 현재 데이터 버전과 같으면 그대로 사용하고, 아니면 df로 계산합니다."""
+    curves = load_aging_curves(player_type, data_version, path)
+    if curves is None:
+        curves = compute_aging_curves(df, AGING_METRICS[player_type], player_type)
+    return curves
+
+
+def precompute_aging_curves(path: str = AGING_CURVES_PATH) -> Dict[str, Dict]:
+    """타자/투수 전체 기록으로 곡선을 계산하여 저장합니다. 데이터 업데이트 후 호출됩니다."""
+    from forecast_batch import load_stats_frame
+    from utils import compute_data_version
+
+    curves_by_type, data_versions = {}, {}
+    for player_type, metrics in AGING_METRICS.items():
+        df = load_stats_frame(player_type)
+        curves_by_type[player_type] = compute_aging_curves(df, metrics, player_type)
+        data_versions[player_type] = compute_data_version(df)
+    save_aging_curves(curves_by_type, data_versions, path)
+    logger.info(f"에이징 커브 저장 완료: {path}")
+    return curves_by_type
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description='지표별 에이징 커브 사전 계산')
+    parser.add_argument('--output', default=AGING_CURVES_PATH, help='저장 경로 (기본값: data/aging_curves.npz)')
+    args = parser.parse_args()
+
+    for player_type, curves in precompute_aging_curves(args.output).items():
+        table = pd.DataFrame(curves['career'], columns=curves['metrics'])
+        table.index.name = '경력 연차'
+        print(f"\n[{player_type}] 첫 시즌 대비 평균 변화량 (시즌 쌍 수: {int(curves['career_pairs'].sum())})")
+        print(table.round(3).to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+AI 분석 보고서 사전 생성 모듈
+세션 간 누적된 선수 검색 통계에서 많이 검색된 선수를 골라, 언어별 분석 보고서를 미리 생성하여
+보고서 캐시에 저장 (데이터 업데이트 후 실행되어 자주 요청되는 보고서를 바로 표시할 수 있게 함)
+"""
+
+import argparse
+import logging
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from config import (
+    AI_PREGENERATE_TOP_N, AI_PREGENERATE_LANGUAGES, AI_PREGENERATE_MAX_REQUESTS,
+    BATTING_METRICS, PITCHING_METRICS,
+)
+
+logger = logging.getLogger(__name__)
+
+# 선수 유형 -> (보고서 선수 유형, 리그 평균 지표) (검색 화면과 같은 조합)
+REPORT_PLAYER_TYPES = {
+    'batter': ("타자", BATTING_METRICS),
+    'pitcher': ("투수", PITCHING_METRICS),
+}
+
+
+def player_report_prompt(analyzer, df: pd.DataFrame, league_averages: pd.DataFrame,
+                         player_type: str, player_id: int, player_name: str, language: str) -> Optional[str]:
+    """
+    검색 화면의 선수 기준 조회와 같은 입력(PlayerID로 선택한 기록)으로 보고서 프롬프트를 만듭니다. (기록이 없으면 None)
+    같은 프롬프트여야 사전 생성한 보고서가 화면 요청의 캐시 키와 일치합니다.
+    """
+    player_data = df[df['PlayerID'] == player_id].sort_values(by='Season')
+    if player_data.empty:
+        return None
+    return analyzer.build_player_prompt(
+        player_name, player_data, league_averages, REPORT_PLAYER_TYPES[player_type][0], language
+    )
+
+
+def pregenerate_reports(top_n: int = AI_PREGENERATE_TOP_N, languages: List[str] = AI_PREGENERATE_LANGUAGES,
+                        max_requests: int = AI_PREGENERATE_MAX_REQUESTS, analyzer=None, store=None) -> Dict:
+    """
+    누적 검색 상위 top_n명의 보고서를 언어별로 생성하여 보고서 캐시에 저장합니다.
+
+    검색 횟수가 많은 선수부터, 선수마다 languages 순으로 처리하며 이미 캐시에 있는 보고서는 건너뜁니다.
+    모델 호출(실패 포함)이 max_requests에 도달하면 중단합니다.
+
+    Args:
+        top_n: 대상 선수 수 (타자/투수 합산 검색 순위)
+        languages: 앱 언어 코드 목록 ("ko", "en", "ja")
+        max_requests: 1회 실행당 최대 모델 호출 수
+        analyzer: 사용할 PlayerAnalysisAI (없으면 새로 생성)
+        store: 검색 통계 저장소 (없으면 기본 경로의 SearchStatsStore)
+
+    Returns:
+        대상 선수 수, 생성/캐시 적중/실패 수, 사용한 요청 수, 예산 소진 여부 딕셔너리
+    """
+    from forecast_batch import load_stats_frame
+    from player_analysis_ai import PlayerAnalysisAI, REPORT_LANGUAGES
+    from search_stats import SearchStatsStore
+    from utils import calculate_league_averages, compute_data_version
+
+    store = store or SearchStatsStore()
+    popular = store.top_players(top_n)
+    summary = {'players': len(popular), 'generated': 0, 'cached': 0, 'failed': 0, 'requests': 0,
+               'budget_exhausted': False}
+    if not popular:
+        logger.info("누적 검색 기록이 없어 사전 생성할 보고서가 없습니다.")
+        return summary
+
+    analyzer = analyzer or PlayerAnalysisAI()
+    frames = {}
+    for player_type, player_id, player_name, count in popular:
+        if player_type not in frames:
+            df = load_stats_frame(player_type)
+            league_averages = calculate_league_averages(df, REPORT_PLAYER_TYPES[player_type][1])
+            frames[player_type] = (df, league_averages, compute_data_version(df))
+        df, league_averages, data_version = frames[player_type]
+
+        for lang in languages:
+            prompt = player_report_prompt(analyzer, df, league_averages, player_type, player_id, player_name,
+                                          REPORT_LANGUAGES[lang])
+            if prompt is None:
+                break
+            if analyzer.get_cached_report(prompt, data_version) is not None:
+                summary['cached'] += 1
+                continue
+            if summary['requests'] >= max_requests:
+                summary['budget_exhausted'] = True
+                logger.info(f"요청 예산({max_requests}회)을 모두 사용하여 사전 생성을 중단합니다.")
+                return summary
+
+            summary['requests'] += 1
+            try:
+                report = analyzer.generate_report(prompt, data_version)
+            except Exception as e:
+                report = None
+                logger.warning(f"보고서 생성 실패 ({player_name}, {lang}): {e}")
+            if report is None:
+                summary['failed'] += 1
+            else:
+                summary['generated'] += 1
+                logger.info(f"보고서 사전 생성: {player_name} ({player_type}, 검색 {count}회, {lang})")
+    return summary
+
+
+def refresh_ai_reports() -> Optional[Dict]:
+    """데이터 업데이트 후 호출됩니다. AI 분석을 사용할 수 없으면 건너뜁니다."""
+    from player_analysis_ai import is_ai_analysis_available
+
+    if not is_ai_analysis_available():
+        logger.info("AI 분석을 사용할 수 없어 보고서 사전 생성을 건너뜁니다.")
+        return None
+    summary = pregenerate_reports()
+    logger.info(f"AI 보고서 사전 생성 완료: {summary}")
+    return summary
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description='많이 검색된 선수의 AI 분석 보고서 사전 생성')
+    parser.add_argument('--top-n', type=int, default=AI_PREGENERATE_TOP_N,
+                        help=f'대상 선수 수 (기본값: {AI_PREGENERATE_TOP_N})')
+    parser.add_argument('--languages', nargs='+', choices=['ko', 'en', 'ja'], default=list(AI_PREGENERATE_LANGUAGES),
+                        help='생성 언어 (기본값: ko en ja)')
+    parser.add_argument('--max-requests', type=int, default=AI_PREGENERATE_MAX_REQUESTS,
+                        help=f'최대 모델 호출 수 (기본값: {AI_PREGENERATE_MAX_REQUESTS})')
+    args = parser.parse_args()
+
+    summary = pregenerate_reports(args.top_n, args.languages, args.max_requests)
+    print(f"대상 {summary['players']}명 · 생성 {summary['generated']}건 · 캐시 적중 {summary['cached']}건 · "
+          f"실패 {summary['failed']}건 · 요청 {summary['requests']}/{args.max_requests}회"
+          + (" (예산 소진)" if summary['budget_exhausted'] else ""))
+
+
+if __name__ == "__main__":
+    main()
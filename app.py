@@ -16,9 +16,11 @@ import time
 import datetime
 from home import run_home
 from search import run_search
-from predict import run_predict
+from predict import run_predict, get_forecast_cache, get_forecast_pool
 from trend import run_trend
 from compare import run_compare
+from team import run_team
+from leaderboard import run_leaderboard
 from data_status import show_data_status
 from PIL import Image
 from utils import set_chart_style, load_logo_image # load_logo_image 추가
@@ -30,6 +32,9 @@ from config import MLB_LOGO_PATH, DEFAULT_LANGUAGE, DEFAULT_CHART_THEME
 set_chart_style()
 metric_tracker = init_metrics()
 
+# Prophet 워커 풀을 앱 시작 시 띄워 첫 예측 요청 전에 워커를 준비
+get_forecast_pool()
+
 @timing_decorator
 def main():
     """MLB 선수 분석 대시보드 메인 함수"""
@@ -95,9 +100,11 @@ def main():
                 get_text("search_records", st.session_state.lang), 
                 get_text("compare_players", st.session_state.lang),
                 get_text("predict_records", st.session_state.lang),
+                get_text("team_projection", st.session_state.lang),
+                get_text("projection_leaderboard", st.session_state.lang),
                 "📊 " + get_text("data_status", st.session_state.lang)
             ],
-            icons=["house", "activity", "search", "people", "magic", "database"],
+            icons=["house", "activity", "search", "people", "magic", "trophy", "bar-chart", "database"],
             menu_icon="cast",
             default_index=0,
             orientation="vertical",  # 메뉴 세로 방향으로 변경
@@ -119,6 +126,8 @@ def main():
         get_text("search_records", lang): run_search,
         get_text("compare_players", lang): run_compare,
         get_text("predict_records", lang): run_predict,
+        get_text("team_projection", lang): run_team,
+        get_text("projection_leaderboard", lang): run_leaderboard,
         "📊 " + get_text("data_status", lang): show_data_status,
     }
 
@@ -131,7 +140,10 @@ def main():
         metrics = metric_tracker.get_summary()
         st.write(f"총 페이지뷰: {metrics['total_page_views']}")
         st.write(f"평균 응답시간: {metrics['avg_response_time']:.2f} ms")
+        st.write(f"평균 차트 전송량: {metrics['avg_chart_bytes'] / 1024:.1f} KB ({metrics['chart_count']}개)")
         st.write(f"에러 수: {metrics['error_count']}")
+        cache_stats = get_forecast_cache().stats()
+        st.write(f"예측 캐시 적중/실패: {cache_stats['hits']}/{cache_stats['misses']} ({cache_stats['entries']}개)")
 
 if __name__ == "__main__":
     main()
@@ -5,8 +5,9 @@ import logging
 from datetime import datetime
 import os
 from config import LOG_DIR # 설정 파일에서 로그 디렉토리 경로 가져오기
+from search_stats import SearchStatsStore
 
-__all__ = ['MetricTracker', 'timing_decorator', 'init_metrics']
+__all__ = ['MetricTracker', 'timing_decorator', 'init_metrics', 'get_search_stats_store']
 
 # 로그 설정
 # log_dir = "logs" # 기존 코드 주석 처리 또는 삭제
@@ -23,6 +24,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger('mlb_stats_app')
 
+
+@st.cache_resource(show_spinner=False)
+def get_search_stats_store():
+    """모든 세션이 공유하는 누적 선수 검색 통계 저장소를 반환합니다."""
+    return SearchStatsStore()
+
+
 class MetricTracker:
     """애플리케이션 메트릭을 추적하는 클래스"""
     
@@ -32,8 +40,11 @@ class MetricTracker:
             "player_searches": {},
             "season_selections": {},
             "response_times": [],
+            "chart_payloads": [],
             "errors": []
         }
+        # 같은 선택이 유지된 채 다시 실행(rerun)될 때 중복으로 세지 않도록 마지막 검색을 기억
+        self._last_search = None
         
     def log_page_view(self, page_name):
         """페이지 뷰 로깅"""
@@ -43,13 +54,18 @@ class MetricTracker:
             self.metrics["page_views"][page_name] = 1
         logger.info(f"Page view: {page_name}")
         
-    def log_player_search(self, player_name):
-        """선수 검색 로깅"""
+    def log_player_search(self, player_name, player_type=None, player_id=None):
+        """선수 검색 로깅 (player_type과 player_id를 주면 세션 간 누적 검색 통계에도 기록)"""
         if player_name and player_name != "":  # 빈 문자열 필터링
+            if (player_type, player_id, player_name) == self._last_search:
+                return
+            self._last_search = (player_type, player_id, player_name)
             if player_name in self.metrics["player_searches"]:
                 self.metrics["player_searches"][player_name] += 1
             else:
                 self.metrics["player_searches"][player_name] = 1
+            if player_type is not None and player_id is not None:
+                get_search_stats_store().record(player_type, player_id, player_name)
             logger.info(f"Player searched: {player_name}")
             
     def log_season_selection(self, season):
@@ -71,6 +87,15 @@ class MetricTracker:
         })
         logger.info(f"Response time for {operation}: {time_ms:.2f} ms")
         
+    def log_chart_payload(self, chart_name, num_bytes):
+        """차트 전송량(직렬화된 figure 바이트 수) 로깅"""
+        self.metrics.setdefault("chart_payloads", []).append({
+            "chart": chart_name,
+            "bytes": num_bytes,
+            "timestamp": datetime.now().isoformat()
+        })
+        logger.info(f"Chart payload for {chart_name}: {num_bytes / 1024:.1f} KB")
+        
     def log_error(self, error_type, error_message, detail=None):
         """오류 로깅"""
         error_data = {
@@ -92,6 +117,8 @@ class MetricTracker:
             "top_players": sorted(self.metrics["player_searches"].items(), key=lambda x: x[1], reverse=True)[:10],
             "popular_seasons": sorted(self.metrics["season_selections"].items(), key=lambda x: x[1], reverse=True)[:5],
             "avg_response_time": sum([r["time_ms"] for r in self.metrics["response_times"]]) / max(len(self.metrics["response_times"]), 1),
+            "avg_chart_bytes": sum([c["bytes"] for c in self.metrics.get("chart_payloads", [])]) / max(len(self.metrics.get("chart_payloads", [])), 1),
+            "chart_count": len(self.metrics.get("chart_payloads", [])),
             "error_count": len(self.metrics["errors"])
         }
         
@@ -30,6 +30,22 @@ def is_season_active():
     now = datetime.now()
     return MLB_SEASON_START_MONTH <= now.month <= MLB_SEASON_END_MONTH
 
+def refresh_forecasts():
+    """데이터 업데이트 후 예측 테이블 사전 계산 및 AI 보고서 사전 생성"""
+    try:
+        from forecast_batch import run_all
+        for summary in run_all():
+            logger.info(f"예측 사전 계산 완료: {summary}")
+    except Exception as e:
+        logger.error(f"예측 사전 계산 실패: {e}")
+
+    # 많이 검색된 선수의 AI 보고서 사전 생성 (새 데이터 버전 기준)
+    try:
+        from ai_pregenerate import refresh_ai_reports
+        refresh_ai_reports()
+    except Exception as e:
+        logger.error(f"AI 보고서 사전 생성 실패: {e}")
+
 def update_data_job():
     """스케줄된 데이터 업데이트 작업"""
     logger.info("스케줄된 데이터 업데이트 시작")
@@ -44,6 +60,7 @@ def update_data_job():
             processor = PyBaseballDataProcessor()
             processor.update_data(start_year=current_year, end_year=current_year)
             logger.info("PyBaseball을 사용한 데이터 업데이트 성공")
+            refresh_forecasts()
             return True
         except Exception as e:
             logger.warning(f"PyBaseball 업데이트 실패: {e}")
@@ -54,6 +71,7 @@ def update_data_job():
             processor = MLBDataProcessor()
             processor.update_data(start_year=current_year, end_year=current_year)
             logger.info("MLB API를 사용한 데이터 업데이트 성공")
+            refresh_forecasts()
             return True
         except Exception as e:
             logger.error(f"MLB API 업데이트도 실패: {e}")
@@ -2,9 +2,13 @@ import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-from utils import load_data, load_pitcher_data, get_plotly_config, apply_theme_to_figure, display_player_image
+from utils import (
+    load_data, load_pitcher_data, apply_theme_to_figure, display_player_image,
+    get_data_version, get_player_name_index, get_cached_figure, get_chart_labels, localize_figure, show_chart,
+    show_table,
+)
 from i18n import get_text, get_metric_names_dict
-from config import BATTER_METRIC_NAMES, PITCHER_METRIC_NAMES
+from config import BATTER_METRIC_NAMES, PITCHER_METRIC_NAMES, METRIC_PRECISION
 
 
 def create_radar_chart(players_data, player_names, metrics, theme="plotly_white"):
@@ -150,7 +154,8 @@ def run_compare(lang):
         horizontal=True
     )
 
-    if data_type == get_text("batter", lang):
+    player_type = 'batter' if data_type == get_text("batter", lang) else 'pitcher'
+    if player_type == 'batter':
         df = load_data()
         stats_options = get_metric_names_dict(list(BATTER_METRIC_NAMES.keys()), lang)
     else:
@@ -168,30 +173,33 @@ def run_compare(lang):
         horizontal=True
     )
 
-    # 선수 선택
-    player_names = sorted(df['PlayerName'].unique())
+    # 선수 선택 (동명이인을 구분하도록 PlayerID로 선택하고 표시 이름으로 보여줌)
+    name_index = get_player_name_index(player_type, get_data_version(player_type))
+    player_options = name_index.sorted_ids()
 
     if comparison_mode == "2명 비교":
         col1, col2 = st.columns(2)
         with col1:
-            player1 = st.selectbox(get_text("select_player_1", lang), player_names, index=0)
+            player1 = st.selectbox(get_text("select_player_1", lang), player_options, index=0, format_func=name_index.label)
         with col2:
-            player2 = st.selectbox(get_text("select_player_2", lang), player_names, index=min(1, len(player_names)-1))
+            player2 = st.selectbox(get_text("select_player_2", lang), player_options,
+                                   index=min(1, len(player_options)-1), format_func=name_index.label)
 
-        selected_players = [player1, player2]
+        selected_ids = [player1, player2]
 
         if player1 == player2:
             st.warning(get_text("select_different_players", lang))
             return
     else:
-        selected_players = st.multiselect(
+        selected_ids = st.multiselect(
             "비교할 선수 선택 (2-5명)",
-            player_names,
-            default=player_names[:2] if len(player_names) >= 2 else player_names,
-            max_selections=5
+            player_options,
+            default=player_options[:2],
+            max_selections=5,
+            format_func=name_index.label
         )
 
-        if len(selected_players) < 2:
+        if len(selected_ids) < 2:
             st.warning("비교를 위해 최소 2명의 선수를 선택해주세요.")
             return
 
@@ -208,16 +216,22 @@ def run_compare(lang):
         return
 
     # 선수 데이터 로드
-    players_data = []
-    for player in selected_players:
-        player_data = df[df['PlayerName'] == player]
+    selected_players, players_data = [], []
+    for player_id in selected_ids:
+        player_data = df[df['PlayerID'] == player_id]
         if not player_data.empty:
+            selected_players.append(name_index.label(player_id))
             players_data.append(player_data)
 
     if len(players_data) < 2:
         st.warning("선택한 선수들의 데이터가 부족합니다.")
         return
 
+    # 차트 캐시 키: 데이터 버전, 선수 ID, 지표, 테마 (언어별 레이블은 덮어쓰기)
+    data_version = get_data_version(player_type)
+    player_ids = tuple(int(player_data.iloc[0]['PlayerID']) for player_data in players_data)
+    labels = get_chart_labels(selected_stats, lang)
+
     # 선수 프로필 표시
     st.subheader("📊 선수 프로필")
     cols = st.columns(len(selected_players))
@@ -237,27 +251,28 @@ def run_compare(lang):
         st.subheader("통계 비교 (평균)")
 
         with st.spinner('막대 차트 생성 중...'):
-            fig = create_comparison_bar_chart(players_data, selected_players, selected_stats, theme)
-            st.plotly_chart(fig, use_container_width=True, config=get_plotly_config())
-
-        # 통계 테이블
-        summary_data = []
-        for player, player_data in zip(selected_players, players_data):
-            row = {'선수': player}
-            for stat in selected_stats:
-                row[stats_options[stat]] = round(player_data[stat].mean(), 2)
-            summary_data.append(row)
-
-        summary_df = pd.DataFrame(summary_data)
-        st.dataframe(summary_df, use_container_width=True)
+            fig = get_cached_figure(create_comparison_bar_chart, (data_version, player_ids, tuple(selected_stats), theme),
+                                    players_data, selected_players, selected_stats, theme)
+            fig = localize_figure(fig, labels)
+            show_chart(fig, "compare_bar")
+
+        # 통계 테이블 (누적 기록의 평균은 소수 첫째 자리까지)
+        summary_df = pd.DataFrame({
+            'PlayerName': selected_players,
+            **{stat: [player_data[stat].mean() for player_data in players_data] for stat in selected_stats},
+        })
+        show_table(summary_df, lang, labels=stats_options,
+                   precision={stat: 1 for stat in selected_stats if METRIC_PRECISION.get(stat) == 0})
 
     with tab2:
         st.subheader("능력치 레이더 차트")
         st.info("💡 각 지표는 선수의 커리어 평균값으로 표시됩니다.")
 
         with st.spinner('레이더 차트 생성 중...'):
-            fig = create_radar_chart(players_data, selected_players, selected_stats, theme)
-            st.plotly_chart(fig, use_container_width=True, config=get_plotly_config())
+            fig = get_cached_figure(create_radar_chart, (data_version, player_ids, tuple(selected_stats), theme),
+                                    players_data, selected_players, selected_stats, theme)
+            fig = localize_figure(fig, labels)
+            show_chart(fig, "compare_radar")
 
     with tab3:
         st.subheader("시즌별 추이 비교")
@@ -270,8 +285,10 @@ def run_compare(lang):
         )
 
         with st.spinner('시즌별 차트 생성 중...'):
-            fig = create_season_comparison_chart(players_data, selected_players, trend_metric, theme)
-            st.plotly_chart(fig, use_container_width=True, config=get_plotly_config())
+            fig = get_cached_figure(create_season_comparison_chart, (data_version, player_ids, trend_metric, theme),
+                                    players_data, selected_players, trend_metric, theme)
+            fig = localize_figure(fig, labels, title=f"시즌별 {labels[trend_metric]} 비교")
+            show_chart(fig, "compare_season")
 
     with tab4:
         st.subheader("상세 데이터")
@@ -279,7 +296,7 @@ def run_compare(lang):
         for player, player_data in zip(selected_players, players_data):
             with st.expander(f"📋 {player} 상세 기록"):
                 display_data = player_data[['Season'] + selected_stats].sort_values('Season', ascending=False)
-                st.dataframe(display_data, use_container_width=True, height=300)
+                show_table(display_data, lang, labels=stats_options, height=300)
 
     # 차트 사용 안내
     st.markdown("---")
@@ -39,17 +39,112 @@ API_RATE_LIMIT_DELAY = 0.2
 AI_MODEL_NAME = "gemini-2.5-pro"
 AI_TEMPERATURE = 0.3
 AI_MAX_TOKENS = 20000
+# AI 보고서 캐시: 프롬프트/모델/온도/데이터 버전별로 생성된 보고서를 보관 (만료 시간, 총 크기 상한)
+AI_REPORT_CACHE_PATH = os.path.join(DATA_DIR, "ai_reports.sqlite")
+AI_REPORT_CACHE_TTL_SECONDS = 7 * 24 * 3600
+AI_REPORT_CACHE_MAX_BYTES = 32 * 1024 * 1024
+# AI 프롬프트: 선수 기록/리그 평균 블록의 추정 토큰 상한, 토큰 추정용 토큰당 문자 수,
+# 상한 초과 시 그대로 보내는 최고 시즌 수와 최근 시즌 수 (나머지는 기간별 평균으로 묶음)
+AI_PROMPT_TOKEN_BUDGET = 500
+AI_PROMPT_CHARS_PER_TOKEN = 2.0
+AI_PROMPT_PEAK_SEASONS = 3
+AI_PROMPT_RECENT_SEASONS = 3
+# AI 보고서 사전 생성: 누적 검색 통계 경로, 대상 인원(검색 상위 N명), 생성 언어, 1회 실행당 최대 모델 호출 수
+SEARCH_STATS_DB_PATH = os.path.join(DATA_DIR, "search_stats.sqlite")
+AI_PREGENERATE_TOP_N = 10
+AI_PREGENERATE_LANGUAGES = ("ko", "en", "ja")
+AI_PREGENERATE_MAX_REQUESTS = 30
 
 # === Chart settings ===
 DEFAULT_CHART_THEME = "plotly_white"
 DEFAULT_CHART_HEIGHT = 500
 
+# 차트 캐시: 데이터 버전/선수/지표/테마별로 보관하는 figure 수 상한
+FIGURE_CACHE_MAX_ENTRIES = 256
+# 차트 전송 최적화: 값 반올림 소수 자릿수, WebGL(Scattergl)로 전환하는 trace당 점 수
+CHART_DECIMALS = 4
+CHART_WEBGL_THRESHOLD = 1000
+# 선 차트 다운샘플링(LTTB): trace당 표시 점 수 상한 (초과 시 전체 해상도 보기 토글 표시)
+CHART_POINT_BUDGET = 2000
+
 # === Language settings ===
 DEFAULT_LANGUAGE = "ko"
 
 # === Caching settings ===
 CACHE_TTL_SECONDS = 3600
 
+# === Forecast settings ===
+FORECAST_DB_PATH = os.path.join(DATA_DIR, "forecasts.sqlite")
+FORECAST_MIN_SEASONS = 3
+FORECAST_MAX_PERIODS = 10
+FORECAST_BATCH_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+FORECAST_INTERVAL_WIDTH = 0.8
+DEFAULT_FORECAST_ENGINE = "prophet"
+# Prophet 예측 모드: fast는 불확실성 샘플링 없이 MAP 학습 후 해석적 구간, accurate는 전체 샘플링
+FORECAST_MODES = ("accurate", "fast")
+DEFAULT_FORECAST_MODE = "accurate"
+PROPHET_UNCERTAINTY_SAMPLES = 1000
+FORECAST_CACHE_PATH = os.path.join(DATA_DIR, "forecast_cache.sqlite")
+FORECAST_CACHE_MAX_BYTES = 64 * 1024 * 1024
+BACKTEST_DIR = os.path.join(BASE_DIR, "backtests")
+# 예측 요청 하나가 동시에 사용할 수 있는 최대 워커 수
+FORECAST_REQUEST_CONCURRENCY = min(4, os.cpu_count() or 1)
+# Prophet 워커 풀: 프로세스 수, 대기열 상한(대기 + 실행), 학습 1건의 대기 제한 시간
+FORECAST_POOL_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+FORECAST_POOL_MAX_QUEUE = 32
+FORECAST_POOL_TIMEOUT_SECONDS = 60
+
+# Marcel 예측 엔진: 최근 시즌 가중치, 리그 평균 회귀 가중치, 연간 수렴 비율
+MARCEL_WEIGHTS = (5, 4, 3)
+MARCEL_REGRESSION_WEIGHT = 2.0
+MARCEL_DECAY = 0.9
+
+# 리그 공유 모델: 경력 연차 곡선 길이, 선수 효과 계산 시 최근 시즌 가중치 감소 비율
+POOLED_MAX_CAREER_YEARS = 20
+POOLED_RECENCY_DECAY = 0.8
+
+# 시즌 시뮬레이터: 기본 시뮬레이션 횟수와 시드, 리그 비율 회귀량(가중 PA),
+# 출전 기회 추정(직전/전전 시즌 PA 비율 + 유형별 기본값), 요약 백분위, 한 번에 뽑는 선수 수
+SIM_DEFAULT_RUNS = 10000
+SIM_SEED = 42
+SIM_REGRESSION_PA = 1200
+SIM_PLAYING_TIME_WEIGHTS = (0.5, 0.1)
+SIM_PLAYING_TIME_BASE = {'batter': 200, 'pitcher': 100}
+SIM_PERCENTILES = (10, 50, 90)
+SIM_CHUNK_SIZE = 64
+
+# 팀 예측: 시즌 중 이적 선수의 팀 표기, 경기당 팀 타석 수, 피타고리안 지수, 시즌 경기 수
+TEAM_TRADED_LABEL = "- - -"
+TEAM_PA_PER_GAME = 38.0
+PYTHAG_EXPONENT = 1.83
+SEASON_GAMES = 162
+
+# 에이징 커브: 저장 경로, 경력 연차 상한, 나이 범위, 구간별 최소 시즌 쌍 수, 시즌 쌍 가중치에 쓰는 출전량 컬럼
+AGING_CURVES_PATH = os.path.join(DATA_DIR, "aging_curves.npz")
+AGING_MAX_CAREER_YEARS = 20
+AGING_MIN_AGE = 18
+AGING_MAX_AGE = 45
+AGING_MIN_PAIRS = 20
+AGING_PLAYING_TIME_COLUMNS = {
+    'batter': ['Hits', 'Walks', 'StrikeOuts'],
+    'pitcher': ['InningsPitched'],
+}
+
+# 예측 리더보드: 기준 기록으로 쓰는 최근 시즌 수, 낮을수록 좋은 지표, 기본 표시 인원
+LEADERBOARD_BASELINE_SEASONS = 3
+LOWER_IS_BETTER_METRICS = ['EarnedRunAverage', 'Whip', 'Losses']
+LEADERBOARD_TOP_N = 20
+
+# 표 표시: 지표별 소수 자릿수 (여기 없는 실수 컬럼은 TABLE_DEFAULT_PRECISION, 정수 컬럼은 0)
+METRIC_PRECISION = {
+    'Season': 0,
+    'BattingAverage': 3, 'OnBasePercentage': 3, 'SluggingPercentage': 3, 'OPS': 3,
+    'EarnedRunAverage': 2, 'Whip': 2, 'InningsPitched': 1,
+    'GamesPlayed': 0, 'AtBats': 0, 'Runs': 0, 'Hits': 0, 'HomeRuns': 0, 'RBIs': 0, 'StolenBases': 0,
+    'Walks': 0, 'StrikeOuts': 0, 'Wins': 0, 'Losses': 0, 'HitsAllowed': 0, 'HomeRunsAllowed': 0, 'Saves': 0,
+}
+TABLE_DEFAULT_PRECISION = 3
+
 # === Metric definitions ===
 BATTING_METRICS = [
     'BattingAverage', 'OnBasePercentage', 'SluggingPercentage', 'OPS',
@@ -11,6 +11,7 @@ from datetime import datetime, timedelta
 import os
 from config import BATTER_STATS_FILE, PITCHER_STATS_FILE
 from i18n import get_text
+from utils import show_chart
 
 def show_data_status(lang="ko"):
     """데이터 상태 대시보드"""
@@ -112,7 +113,7 @@ def show_data_status(lang="ko"):
         hovermode='x unified'
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    show_chart(fig, "data_status_season_counts", config=None)
     
     # 최신 데이터 하이라이트
     st.header("🏆 최신 시즌 하이라이트")
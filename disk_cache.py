@@ -0,0 +1,143 @@
+"""
+SQLite 기반 디스크 캐시 모듈
+재시작이나 여러 워커 프로세스 사이에서도 유지되는 캐시로,
+전체 크기 기준 LRU 삭제와 선택적 만료 시간(TTL), 적중/실패 카운터를 지원
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_accessed ON cache_entries (accessed_at);
+CREATE TABLE IF NOT EXISTS cache_counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+
+def make_cache_key(*parts) -> str:
+    """키 구성 요소들을 하나의 고정 길이 문자열 키로 변환합니다."""
+    return hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()
+
+
+class DiskCache:
+    """
+    SQLite 파일에 pickle로 값을 저장하는 캐시
+
+    Args:
+        db_path: 캐시 DB 파일 경로
+        max_bytes: 저장 값의 총 크기 상한 (초과 시 가장 오래 사용하지 않은 항목부터 삭제)
+        ttl_seconds: 항목 만료 시간 (None이면 만료 없음)
+    """
+
+    def __init__(self, db_path: str, max_bytes: int, ttl_seconds: Optional[float] = None):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        # 스레드/프로세스마다 별도 연결을 사용하도록 호출 시점에 연결하고, 트랜잭션 후 닫습니다.
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _count(self, conn: sqlite3.Connection, name: str, amount: int = 1):
+        conn.execute(
+            "INSERT INTO cache_counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, amount)
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        """키에 해당하는 값을 반환합니다. 없거나 만료되었으면 None을 반환합니다."""
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                row = conn.execute("SELECT value, created_at FROM cache_entries WHERE key = ?", (key,)).fetchone()
+                if row is not None and self.ttl_seconds is not None and now - row[1] > self.ttl_seconds:
+                    conn.execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+                    row = None
+                if row is None:
+                    self._count(conn, 'misses')
+                    return None
+                conn.execute("UPDATE cache_entries SET accessed_at = ? WHERE key = ?", (now, key))
+                self._count(conn, 'hits')
+            return pickle.loads(row[0])
+        except (sqlite3.Error, pickle.UnpicklingError) as e:
+            logger.warning(f"캐시 조회 실패 ({self.db_path}): {e}")
+            return None
+
+    def set(self, key: str, value: Any):
+        """값을 저장하고, 총 크기가 상한을 넘으면 LRU 순서로 항목을 삭제합니다."""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache_entries (key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                    (key, sqlite3.Binary(blob), len(blob), now, now)
+                )
+                self._evict(conn)
+        except sqlite3.Error as e:
+            logger.warning(f"캐시 저장 실패 ({self.db_path}): {e}")
+
+    def _evict(self, conn: sqlite3.Connection):
+        if self.ttl_seconds is not None:
+            conn.execute("DELETE FROM cache_entries WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache_entries").fetchone()[0]
+        excess = total - self.max_bytes
+        if excess <= 0:
+            return
+
+        evicted = []
+        for key, size in conn.execute("SELECT key, size FROM cache_entries ORDER BY accessed_at").fetchall():
+            evicted.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM cache_entries WHERE key = ?", evicted)
+        self._count(conn, 'evictions', len(evicted))
+
+    def stats(self) -> Dict[str, int]:
+        """항목 수, 총 크기, 적중/실패/삭제 횟수를 반환합니다."""
+        with self._connect() as conn:
+            entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries").fetchone()
+            counters = dict(conn.execute("SELECT name, value FROM cache_counters").fetchall())
+        return {
+            'entries': entries,
+            'bytes': size,
+            'hits': counters.get('hits', 0),
+            'misses': counters.get('misses', 0),
+            'evictions': counters.get('evictions', 0),
+        }
+
+    def clear(self):
+        """모든 항목과 카운터를 삭제합니다."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM cache_entries")
+            conn.execute("DELETE FROM cache_counters")
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+예측 엔진 롤링 오리진 백테스트 스크립트
+기준 시즌(origin)마다 그 시즌까지의 기록만으로 학습하여 이후 시즌을 예측하고 실제 기록과 비교하여
+엔진별·지표별·예측 기간별 정확도(MAE, MAPE, 구간 포함률)와 처리 속도(초당 학습 수, p50/p95 지연)를
+측정하고 JSON 결과 파일로 저장
+"""
+
+import argparse
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from functools import partial
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from config import FORECAST_MIN_SEASONS, FORECAST_BATCH_WORKERS, BACKTEST_DIR
+from forecast_batch import PLAYER_TYPES, load_stats_frame, get_eligible_series, _forecast_series
+from utils import compute_data_version
+from aging_curves import compute_aging_curves
+
+logger = logging.getLogger(__name__)
+
+PREDICTION_COLUMNS = ['origin', 'PlayerID', 'metric', 'step', 'yhat', 'yhat_lower', 'yhat_upper']
+
+
+def get_origins(df: pd.DataFrame, n_origins: int) -> List[int]:
+    """다음 시즌 실제 기록이 존재하는 최근 n_origins개의 기준 시즌을 반환합니다."""
+    last_season = int(df['Season'].max())
+    first_season = int(df['Season'].min())
+    return list(range(max(first_season, last_season - n_origins), last_season))
+
+
+def origin_split(df: pd.DataFrame, origin: int, metrics: List[str], horizon: int,
+                 min_seasons: int = FORECAST_MIN_SEASONS):
+    """
+    기준 시즌까지의 학습 데이터와 이후 horizon 시즌의 실제 기록을 분리합니다.
+    기준 시즌에 출전했고 그때까지 min_seasons 이상 기록이 있는 선수만 대상으로 합니다.
+
+    Returns:
+        (학습 데이터, origin/PlayerID/metric/step/y 컬럼의 실제 기록)
+    """
+    history = df[df['Season'] <= origin]
+    season_counts = history.groupby('PlayerID')['Season'].transform('size')
+    played_origin = history.groupby('PlayerID')['Season'].transform('max') == origin
+    train = history[(season_counts >= min_seasons) & played_origin]
+
+    future = df[(df['Season'] > origin) & (df['Season'] <= origin + horizon) & df['PlayerID'].isin(train['PlayerID'])]
+    truth = future.melt(id_vars=['PlayerID', 'Season'], value_vars=metrics, var_name='metric', value_name='y')
+    truth['step'] = truth['Season'] - origin
+    truth['origin'] = origin
+    truth = truth.drop_duplicates(['PlayerID', 'metric', 'step'])
+    return train, truth[['origin', 'PlayerID', 'metric', 'step', 'y']]
+
+
+def _timed_forecast_series(player_id, metric, seasons, values, periods, mode):
+    """워커 프로세스에서 Prophet 예측 1회를 수행하고 (예측 행, 소요 시간)을 반환합니다."""
+    start_time = time.perf_counter()
+    rows = _forecast_series(player_id, metric, seasons, values, periods, mode)
+    return rows, time.perf_counter() - start_time
+
+
+def _backtest_prophet(splits: List[Dict], metrics: List[str], horizon: int, executor, mode: str = 'accurate') -> Dict:
+    """Prophet으로 모든 기준 시즌의 시계열을 프로세스 풀에서 학습합니다. (시계열당 학습 1회)"""
+    futures = {}
+    for split in splits:
+        for s in split['series']:
+            future = executor.submit(_timed_forecast_series, s['player_id'], s['metric'], s['seasons'], s['values'], horizon, mode)
+            futures[future] = split['origin']
+
+    records, latencies, failed = [], [], 0
+    for idx, future in enumerate(as_completed(futures), start=1):
+        try:
+            rows, elapsed = future.result()
+        except Exception as e:
+            failed += 1
+            logger.warning(f"Prophet 학습 실패: {e}")
+            continue
+        latencies.append(elapsed)
+        records.extend((futures[future], pid, metric, step, yhat, lo, hi) for pid, metric, step, _, yhat, lo, hi in rows)
+        if idx % 500 == 0:
+            logger.info(f"  진행: {idx}/{len(futures)}")
+
+    return {'predictions': pd.DataFrame(records, columns=PREDICTION_COLUMNS), 'latencies': latencies, 'failed': failed}
+
+
+def _backtest_marcel(splits: List[Dict], metrics: List[str], horizon: int, executor, aging: bool = True) -> Dict:
+    """
+    Marcel로 기준 시즌마다 전체 선수를 한 번의 벡터 연산으로 예측합니다.
+    aging이면(실시간 엔진과 동일) 그 시즌까지의 전체 기록으로 에이징 커브를 계산하여 경력 연차 보정을 더합니다.
+    """
+    from predict import marcel_project
+
+    frames, latencies = [], []
+    for split in splits:
+        keys = pd.MultiIndex.from_tuples([(s['player_id'], s['metric']) for s in split['series']])
+        start_time = time.perf_counter()
+        curves = compute_aging_curves(split['history'], metrics, split['player_type']) if aging else None
+        projections = marcel_project(split['train'], metrics, periods=horizon, aging=curves)
+        latencies.append(time.perf_counter() - start_time)
+
+        projections = projections[pd.MultiIndex.from_frame(projections[['PlayerID', 'metric']]).isin(keys)]
+        frames.append(projections.assign(origin=split['origin'])[PREDICTION_COLUMNS])
+
+    return {'predictions': pd.concat(frames, ignore_index=True), 'latencies': latencies, 'failed': 0}
+
+
+def _backtest_pooled(splits: List[Dict], metrics: List[str], horizon: int, executor) -> Dict:
+    """
+    리그 공유 모델을 기준 시즌마다 그 시즌까지의 전체 기록으로 한 번 학습하고 계수로 예측합니다.
+    에이징 커브도 같은 기록으로 계산하여 사용합니다.
+    """
+    from pooled_model import fit_pooled_model, pooled_project
+
+    frames, latencies = [], []
+    for split in splits:
+        keys = pd.MultiIndex.from_tuples([(s['player_id'], s['metric']) for s in split['series']])
+        start_time = time.perf_counter()
+        curves = compute_aging_curves(split['history'], metrics, split['player_type'])
+        projections = pooled_project(fit_pooled_model(split['history'], metrics, aging=curves), periods=horizon)
+        latencies.append(time.perf_counter() - start_time)
+
+        projections = projections[pd.MultiIndex.from_frame(projections[['PlayerID', 'metric']]).isin(keys)]
+        frames.append(projections.assign(origin=split['origin'])[PREDICTION_COLUMNS])
+
+    return {'predictions': pd.concat(frames, ignore_index=True), 'latencies': latencies, 'failed': 0}
+
+
+# 백테스트 엔진 레지스트리: 이름 -> 실행 함수 (splits, metrics, horizon, executor) -> 결과
+BACKTEST_ENGINES = {
+    'prophet': _backtest_prophet,
+    'prophet_fast': partial(_backtest_prophet, mode='fast'),
+    'marcel': _backtest_marcel,
+    'marcel_raw': partial(_backtest_marcel, aging=False),
+    'pooled': _backtest_pooled,
+}
+
+
+def _score_frame(frame: pd.DataFrame) -> Dict:
+    """오차 컬럼이 계산된 예측/실제 비교 데이터의 요약 지표를 계산합니다."""
+    return {
+        'mae': float(frame['abs_error'].mean()),
+        'mape': float(frame['ape'].mean()) if frame['ape'].notna().any() else None,
+        'coverage': float(frame['covered'].mean()),
+        'n': int(len(frame)),
+    }
+
+
+def score_predictions(predictions: pd.DataFrame, truth: pd.DataFrame) -> Dict:
+    """예측을 실제 기록과 비교하여 지표별 전체/예측 기간별 MAE, MAPE, 구간 포함률을 계산합니다."""
+    merged = predictions.merge(truth, on=['origin', 'PlayerID', 'metric', 'step'])
+    merged['abs_error'] = (merged['yhat'] - merged['y']).abs()
+    # 실제값이 0이면 MAPE에서 제외
+    merged['ape'] = merged['abs_error'] / merged['y'].abs().where(merged['y'] != 0)
+    merged['covered'] = (merged['y'] >= merged['yhat_lower']) & (merged['y'] <= merged['yhat_upper'])
+
+    return {
+        metric: {
+            'overall': _score_frame(group),
+            'by_horizon': {int(step): _score_frame(g) for step, g in group.groupby('step')},
+        }
+        for metric, group in merged.groupby('metric')
+    }
+
+
+def run_backtest(player_type: str, engines: List[str], n_origins: int = 5, horizon: int = 3,
+                 sample: int = 200, workers: int = FORECAST_BATCH_WORKERS, seed: int = 42) -> Dict:
+    """
+    롤링 오리진 백테스트를 실행합니다.
+
+    Args:
+        player_type: 'batter' 또는 'pitcher'
+        engines: 비교할 엔진 이름 목록 (BACKTEST_ENGINES의 키)
+        n_origins: 기준 시즌 수 (최근 시즌부터)
+        horizon: 최대 예측 기간 (년)
+        sample: 기준 시즌마다 평가할 시계열 수 (0이면 전체, 모든 엔진에 같은 표본 사용)
+        workers: 프로세스 풀 크기
+        seed: 표본 추출 시드
+
+    Returns:
+        백테스트 설정과 엔진별 정확도/처리 속도 결과
+    """
+    _, metrics = PLAYER_TYPES[player_type]
+    metrics = list(metrics.keys())
+    df = load_stats_frame(player_type)
+    rng = np.random.default_rng(seed)
+
+    splits, truths = [], []
+    for origin in get_origins(df, n_origins):
+        train, truth = origin_split(df, origin, metrics, horizon)
+        series = get_eligible_series(train, metrics)
+        if sample and len(series) > sample:
+            series = [series[i] for i in sorted(rng.choice(len(series), sample, replace=False))]
+        splits.append({'origin': origin, 'player_type': player_type, 'train': train,
+                       'history': df[df['Season'] <= origin], 'series': series})
+        truths.append(truth)
+    truth = pd.concat(truths, ignore_index=True)
+
+    total_series = sum(len(split['series']) for split in splits)
+    logger.info(f"[{player_type}] 기준 시즌 {[s['origin'] for s in splits]}, 예측 기간 {horizon}년, 시계열 {total_series}개")
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for engine in engines:
+            start_time = time.perf_counter()
+            outcome = BACKTEST_ENGINES[engine](splits, metrics, horizon, executor)
+            seconds = time.perf_counter() - start_time
+
+            fits = total_series - outcome['failed']
+            latencies_ms = np.asarray(outcome['latencies']) * 1000
+            results[engine] = {
+                'fits': fits,
+                'failed': outcome['failed'],
+                'seconds': seconds,
+                'fits_per_second': fits / seconds if seconds > 0 else None,
+                'latency_ms': {
+                    'calls': int(len(latencies_ms)),
+                    'p50': float(np.percentile(latencies_ms, 50)) if len(latencies_ms) else None,
+                    'p95': float(np.percentile(latencies_ms, 95)) if len(latencies_ms) else None,
+                },
+                'metrics': score_predictions(outcome['predictions'], truth),
+            }
+            logger.info(f"[{player_type}/{engine}] 학습 {fits}개, {seconds:.2f}초")
+
+    return {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'player_type': player_type,
+        'data_version': compute_data_version(df),
+        'origins': [split['origin'] for split in splits],
+        'horizon': horizon,
+        'sample': sample,
+        'workers': workers,
+        'seed': seed,
+        'series': total_series,
+        'engines': results,
+    }
+
+
+def print_report(report: Dict):
+    """엔진별 백테스트 결과를 표 형태로 출력합니다."""
+    print(f"\n[{report['player_type']}] 기준 시즌 {report['origins']}, 예측 기간 {report['horizon']}년, "
+          f"시계열 {report['series']}개 (데이터 버전 {report['data_version']})")
+    for engine, result in report['engines'].items():
+        latency = result['latency_ms']
+        print(f"\n[{engine}] 학습 {result['fits']}개 (실패 {result['failed']}), {result['seconds']:.2f}초, "
+              f"초당 {result['fits_per_second']:.1f}회, 지연 p50 {latency['p50']:.2f} ms / p95 {latency['p95']:.2f} ms "
+              f"(호출 {latency['calls']}회)")
+        print(f"  {'지표':<20}{'기간':>6}{'MAE':>10}{'MAPE':>10}{'포함률':>10}{'N':>8}")
+        for metric, score in result['metrics'].items():
+            for step, s in score['by_horizon'].items():
+                mape = f"{s['mape']:.2%}" if s['mape'] is not None else '-'
+                print(f"  {metric:<20}{step:>6}{s['mae']:>10.4f}{mape:>10}{s['coverage']:>10.2%}{s['n']:>8}")
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    logging.getLogger('cmdstanpy').setLevel(logging.WARNING)
+
+    parser = argparse.ArgumentParser(description='예측 엔진 롤링 오리진 백테스트')
+    parser.add_argument('--player-type', choices=list(PLAYER_TYPES), default='batter', help='선수 유형 (기본값: batter)')
+    parser.add_argument('--engines', nargs='+', choices=list(BACKTEST_ENGINES), default=list(BACKTEST_ENGINES),
+                        help='비교할 엔진 (기본값: 전체)')
+    parser.add_argument('--origins', type=int, default=5, help='기준 시즌 수 (기본값: 5)')
+    parser.add_argument('--horizon', type=int, default=3, help='최대 예측 기간 (년, 기본값: 3)')
+    parser.add_argument('--sample', type=int, default=200, help='기준 시즌별 표본 시계열 수 (0이면 전체, 기본값: 200)')
+    parser.add_argument('--workers', type=int, default=FORECAST_BATCH_WORKERS, help='프로세스 풀 크기')
+    parser.add_argument('--seed', type=int, default=42, help='표본 추출 시드 (기본값: 42)')
+    parser.add_argument('--output', help='결과 JSON 경로 (기본값: backtests/backtest_<유형>_<시각>.json)')
+    args = parser.parse_args()
+
+    report = run_backtest(args.player_type, args.engines, n_origins=args.origins, horizon=args.horizon,
+                          sample=args.sample, workers=args.workers, seed=args.seed)
+    print_report(report)
+
+    output = args.output or os.path.join(
+        BACKTEST_DIR, f"backtest_{args.player_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
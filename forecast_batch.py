@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""
+예측 결과 일괄 사전 계산 모듈
+데이터 업데이트 후 모든 선수/지표의 예측을 미리 계산하여 예측 테이블(SQLite)에 저장하고,
+예측 페이지에서 학습 없이 즉시 조회할 수 있도록 지원
+"""
+
+import argparse
+import hashlib
+import logging
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from config import (
+    BATTER_STATS_FILE, PITCHER_STATS_FILE, FORECAST_DB_PATH, FORECAST_MIN_SEASONS,
+    FORECAST_MAX_PERIODS, FORECAST_BATCH_WORKERS, FORECAST_MODES, DEFAULT_FORECAST_MODE,
+    PREDICT_BATTER_METRICS, PREDICT_PITCHER_METRICS,
+)
+from utils import read_stats_csv, compute_data_version
+from aging_curves import precompute_aging_curves, resolve_aging_curves
+
+logger = logging.getLogger(__name__)
+
+# 선수 유형별 데이터 파일과 예측 대상 지표
+PLAYER_TYPES = {
+    'batter': (BATTER_STATS_FILE, PREDICT_BATTER_METRICS),
+    'pitcher': (PITCHER_STATS_FILE, PREDICT_PITCHER_METRICS),
+}
+
+# 사전 계산을 지원하는 예측 엔진
+ENGINES = ['prophet', 'marcel', 'pooled']
+
+# Prophet 예측 모드 (fast 모드 결과는 별도 엔진 키로 저장)
+MODES = list(FORECAST_MODES)
+
+# 엔진별 최소 시즌 수 (리그 공유 모델은 시즌 수와 관계없이 모든 선수를 예측)
+ENGINE_MIN_SEASONS = {'pooled': 1}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS forecasts (
+    player_type TEXT NOT NULL,
+    engine TEXT NOT NULL,
+    player_id INTEGER NOT NULL,
+    metric TEXT NOT NULL,
+    data_version TEXT NOT NULL,
+    step INTEGER NOT NULL,
+    ds TEXT NOT NULL,
+    yhat REAL,
+    yhat_lower REAL,
+    yhat_upper REAL,
+    PRIMARY KEY (player_type, engine, player_id, metric, data_version, step)
+);
+CREATE TABLE IF NOT EXISTS forecast_runs (
+    player_type TEXT NOT NULL,
+    engine TEXT NOT NULL,
+    data_version TEXT NOT NULL,
+    fitted INTEGER NOT NULL,
+    failed INTEGER NOT NULL,
+    elapsed_seconds REAL NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (player_type, engine, data_version)
+);
+CREATE TABLE IF NOT EXISTS forecast_series (
+    player_type TEXT NOT NULL,
+    engine TEXT NOT NULL,
+    player_id INTEGER NOT NULL,
+    metric TEXT NOT NULL,
+    series_hash TEXT NOT NULL,
+    PRIMARY KEY (player_type, engine, player_id, metric)
+);
+"""
+
+# 시계열 단위로 학습하여 바뀐 시계열만 다시 학습할 수 있는 엔진 (리그 전체를 쓰는 엔진은 항상 전체 계산)
+INCREMENTAL_ENGINES = ['prophet']
+
+
+def engine_key(engine: str, mode: str = DEFAULT_FORECAST_MODE) -> str:
+    """예측 테이블의 엔진 키를 반환합니다. Prophet fast 모드는 'prophet_fast'로 구분하여 저장합니다."""
+    return f"{engine}_fast" if engine == 'prophet' and mode == 'fast' else engine
+
+
+def _connect(db_path: str = FORECAST_DB_PATH) -> sqlite3.Connection:
+    """예측 테이블 DB에 연결하고 스키마를 준비합니다."""
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=30)
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def load_stats_frame(player_type: str) -> pd.DataFrame:
+    """Streamlit 없이 선수 유형에 해당하는 기록 데이터를 로드합니다."""
+    file_path, _ = PLAYER_TYPES[player_type]
+    return read_stats_csv(file_path)
+
+
+def series_fingerprint(seasons, values) -> str:
+    """(시즌, 값) 시계열의 지문을 계산합니다."""
+    payload = np.asarray(seasons, dtype=np.int64).tobytes() + np.asarray(values, dtype=float).tobytes()
+    return hashlib.sha1(payload).hexdigest()[:16]
+
+
+def fit_fingerprint(series_hash: str, periods: int) -> str:
+    """저장된 예측의 학습 지문 (시계열 지문 + 예측 기간, 기간이 바뀌면 다시 학습해야 하므로 함께 비교)"""
+    return f"{series_hash}:{periods}"
+
+
+def get_eligible_series(df: pd.DataFrame, metrics: List[str], min_seasons: int = FORECAST_MIN_SEASONS) -> List[Dict]:
+    """최소 시즌 수를 충족하는 모든 (선수, 지표) 시계열 목록을 반환합니다."""
+    season_counts = df.groupby('PlayerID')['Season'].transform('size')
+    eligible = df[season_counts >= min_seasons].sort_values(['PlayerID', 'Season'])
+
+    series = []
+    for player_id, group in eligible.groupby('PlayerID', sort=False):
+        seasons = group['Season'].to_numpy()
+        for metric in metrics:
+            if metric not in group.columns:
+                continue
+            values = group[metric].to_numpy(dtype=float)
+            series.append({
+                'player_id': int(player_id),
+                'metric': metric,
+                'seasons': seasons,
+                'values': values,
+                'series_hash': series_fingerprint(seasons, values),
+            })
+    return series
+
+
+def _forecast_series(player_id, metric, seasons, values, periods, mode=DEFAULT_FORECAST_MODE):
+    """워커 프로세스에서 단일 시계열의 Prophet 예측을 수행합니다."""
+    # 워커마다 한 번만 임포트되며, Prophet/cmdstanpy 로그는 경고 이상만 출력
+    logging.getLogger('cmdstanpy').setLevel(logging.WARNING)
+    logging.getLogger('prophet').setLevel(logging.WARNING)
+    from predict import fit_prophet_forecast
+
+    df_metric = pd.DataFrame({
+        'ds': pd.to_datetime(pd.Series(seasons).astype(str), format='%Y'),
+        'y': values,
+    })
+    forecast = fit_prophet_forecast(df_metric, periods=periods, mode=mode)
+    future = forecast[forecast['ds'] > df_metric['ds'].max()]
+
+    return [
+        (player_id, metric, step, row.ds.strftime('%Y-%m-%d'), float(row.yhat), float(row.yhat_lower), float(row.yhat_upper))
+        for step, row in enumerate(future.itertuples(index=False), start=1)
+    ]
+
+
+def _prophet_rows(series: List[Dict], periods: int, workers: int, mode: str = DEFAULT_FORECAST_MODE):
+    """Prophet 예측을 프로세스 풀에서 계산하여 (행 목록, 실패 수)를 반환합니다."""
+    rows, failed = [], 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_forecast_series, s['player_id'], s['metric'], s['seasons'], s['values'], periods, mode): s
+            for s in series
+        }
+        for idx, future in enumerate(as_completed(futures), start=1):
+            s = futures[future]
+            try:
+                rows.extend(future.result())
+            except Exception as e:
+                failed += 1
+                logger.warning(f"예측 실패 (선수: {s['player_id']}, 지표: {s['metric']}): {e}")
+            if idx % 500 == 0:
+                logger.info(f"  진행: {idx}/{len(series)}")
+    return rows, failed
+
+
+def _marcel_rows(df: pd.DataFrame, series: List[Dict], metrics: List[str], periods: int, aging: Dict = None):
+    """Marcel 예측을 전체 선수에 대해 한 번에 계산하여 (행 목록, 실패 수)를 반환합니다."""
+    from predict import marcel_project
+
+    eligible = {(s['player_id'], s['metric']) for s in series}
+    projections = marcel_project(df, metrics, periods=periods, aging=aging)
+    projections = projections[[key in eligible for key in zip(projections['PlayerID'], projections['metric'])]]
+    columns = ['PlayerID', 'metric', 'step', 'ds', 'yhat', 'yhat_lower', 'yhat_upper']
+    projections = projections.assign(ds=projections['ds'].dt.strftime('%Y-%m-%d'))
+    rows = list(zip(*(projections[col].tolist() for col in columns)))
+    return rows, 0
+
+
+def _pooled_rows(df: pd.DataFrame, metrics: List[str], periods: int, aging: Dict = None):
+    """리그 공유 모델을 한 번 학습하고 전체 선수 예측을 (행 목록, 실패 수)로 반환합니다."""
+    from pooled_model import fit_pooled_model, pooled_project
+
+    projections = pooled_project(fit_pooled_model(df, metrics, aging=aging), periods=periods)
+    columns = ['PlayerID', 'metric', 'step', 'ds', 'yhat', 'yhat_lower', 'yhat_upper']
+    projections = projections.assign(ds=projections['ds'].dt.strftime('%Y-%m-%d'))
+    rows = list(zip(*(projections[col].tolist() for col in columns)))
+    return rows, 0
+
+
+def precompute_forecasts(
+    player_type: str,
+    engine: str = 'prophet',
+    workers: int = FORECAST_BATCH_WORKERS,
+    periods: int = FORECAST_MAX_PERIODS,
+    force: bool = False,
+    mode: str = DEFAULT_FORECAST_MODE,
+    db_path: str = FORECAST_DB_PATH,
+) -> Dict:
+    """
+    선수 유형의 모든 적격 선수/지표 예측을 프로세스 풀에서 계산하여 저장합니다.
+    이전 실행의 학습 지문이 있으면 Prophet 엔진은 시계열이나 예측 기간이 바뀐 시계열만 다시 학습합니다.
+
+    Args:
+        player_type: 'batter' 또는 'pitcher'
+        engine: 예측 엔진 ('prophet', 'marcel', 'pooled')
+        workers: 프로세스 풀 크기
+        periods: 저장할 최대 예측 기간 (년)
+        force: 이미 계산된 데이터 버전이라도 모든 시계열을 다시 계산할지 여부
+        mode: Prophet 예측 모드 ('accurate' 또는 'fast', 다른 엔진은 무시)
+        db_path: 예측 테이블 DB 경로
+
+    Returns:
+        실행 요약 (데이터 버전, 학습 수, 실패 수, 변경 없어 건너뛴 학습 수, 소요 시간)
+    """
+    _, metrics = PLAYER_TYPES[player_type]
+    df = load_stats_frame(player_type)
+    data_version = compute_data_version(df)
+    fit_engine, engine = engine, engine_key(engine, mode)
+
+    with _connect(db_path) as conn:
+        done = conn.execute(
+            "SELECT fitted, failed FROM forecast_runs WHERE player_type = ? AND engine = ? AND data_version = ?",
+            (player_type, engine, data_version)
+        ).fetchone()
+        stored_periods = conn.execute(
+            "SELECT MAX(step) FROM forecasts WHERE player_type = ? AND engine = ? AND data_version = ?",
+            (player_type, engine, data_version)
+        ).fetchone()[0]
+    # 같은 데이터 버전이라도 예측 기간이 다르면 다시 계산
+    if done and stored_periods == periods and not force:
+        logger.info(f"[{player_type}/{engine}] 데이터 버전 {data_version}의 예측이 이미 존재하여 건너뜁니다.")
+        return {'player_type': player_type, 'engine': engine, 'data_version': data_version,
+                'fitted': 0, 'failed': 0, 'skipped_fits': 0, 'skipped': True}
+
+    series = get_eligible_series(df, list(metrics.keys()), ENGINE_MIN_SEASONS.get(fit_engine, FORECAST_MIN_SEASONS))
+
+    # 저장된 학습 지문(시계열 지문 + 예측 기간)과 비교하여 바뀐 시계열만 다시 학습
+    # (Prophet 모드는 엔진 키로 구분되어 저장되므로 지문에 넣지 않음)
+    with _connect(db_path) as conn:
+        stored = {
+            (player_id, metric): series_hash
+            for player_id, metric, series_hash in conn.execute(
+                "SELECT player_id, metric, series_hash FROM forecast_series WHERE player_type = ? AND engine = ?",
+                (player_type, engine)
+            )
+        }
+    incremental = fit_engine in INCREMENTAL_ENGINES and bool(stored) and not force
+    if incremental:
+        to_fit = [s for s in series
+                  if stored.get((s['player_id'], s['metric'])) != fit_fingerprint(s['series_hash'], periods)]
+    else:
+        to_fit = series
+    skipped_fits = len(series) - len(to_fit)
+    logger.info(f"[{player_type}/{engine}] 예측 대상 시계열 {len(series)}개 중 {len(to_fit)}개 학습, "
+                f"{skipped_fits}개 변경 없음 (워커 {workers}개, 데이터 버전 {data_version})")
+
+    start_time = time.time()
+    if fit_engine == 'marcel':
+        aging = resolve_aging_curves(df, player_type, data_version)
+        rows, failed = _marcel_rows(df, series, list(metrics.keys()), periods, aging)
+    elif fit_engine == 'pooled':
+        aging = resolve_aging_curves(df, player_type, data_version)
+        rows, failed = _pooled_rows(df, list(metrics.keys()), periods, aging)
+    else:
+        rows, failed = _prophet_rows(to_fit, periods, workers, mode)
+    elapsed = time.time() - start_time
+
+    fitted_keys = {(row[0], row[1]) for row in rows}
+    current_keys = {(s['player_id'], s['metric']) for s in series}
+    with _connect(db_path) as conn:
+        if incremental:
+            # 다시 학습한 시계열과 더 이상 대상이 아닌 시계열의 예측만 교체하고 나머지는 새 데이터 버전으로 유지
+            stale_keys = {(s['player_id'], s['metric']) for s in to_fit} | (set(stored) - current_keys)
+            stale = [(player_type, engine, *key) for key in stale_keys]
+            conn.executemany(
+                "DELETE FROM forecasts WHERE player_type = ? AND engine = ? AND player_id = ? AND metric = ?", stale
+            )
+            conn.executemany(
+                "DELETE FROM forecast_series WHERE player_type = ? AND engine = ? AND player_id = ? AND metric = ?", stale
+            )
+            conn.execute("UPDATE forecasts SET data_version = ? WHERE player_type = ? AND engine = ?",
+                         (data_version, player_type, engine))
+        else:
+            conn.execute("DELETE FROM forecasts WHERE player_type = ? AND engine = ?", (player_type, engine))
+            conn.execute("DELETE FROM forecast_series WHERE player_type = ? AND engine = ?", (player_type, engine))
+
+        conn.executemany(
+            "INSERT INTO forecasts (player_type, engine, player_id, metric, step, ds, yhat, yhat_lower, yhat_upper, data_version) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(player_type, engine, *row, data_version) for row in rows]
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO forecast_series (player_type, engine, player_id, metric, series_hash) VALUES (?, ?, ?, ?, ?)",
+            [(player_type, engine, s['player_id'], s['metric'], fit_fingerprint(s['series_hash'], periods))
+             for s in to_fit if (s['player_id'], s['metric']) in fitted_keys]
+        )
+        conn.execute("DELETE FROM forecast_runs WHERE player_type = ? AND engine = ?", (player_type, engine))
+        conn.execute(
+            "INSERT INTO forecast_runs VALUES (?, ?, ?, ?, ?, ?, datetime('now'))",
+            (player_type, engine, data_version, len(to_fit) - failed, failed, elapsed)
+        )
+
+    logger.info(f"[{player_type}/{engine}] 예측 {len(to_fit) - failed}개 저장, 변경 없음 {skipped_fits}개 건너뜀, "
+                f"실패 {failed}개 ({elapsed:.1f}초)")
+    return {'player_type': player_type, 'engine': engine, 'data_version': data_version,
+            'fitted': len(to_fit) - failed, 'failed': failed, 'skipped_fits': skipped_fits,
+            'elapsed_seconds': elapsed, 'skipped': False}
+
+
+def load_forecast(
+    player_type: str,
+    player_id,
+    metric: str,
+    data_version: str,
+    periods: int,
+    engine: str = 'prophet',
+    db_path: str = FORECAST_DB_PATH,
+) -> Optional[pd.DataFrame]:
+    """
+    사전 계산된 예측을 조회합니다. 없으면 None을 반환합니다.
+
+    Returns:
+        ds, yhat, yhat_lower, yhat_upper 컬럼의 미래 시점 예측 데이터프레임
+    """
+    if not os.path.exists(db_path):
+        return None
+    try:
+        with sqlite3.connect(db_path, timeout=5) as conn:
+            forecast = pd.read_sql_query(
+                "SELECT ds, yhat, yhat_lower, yhat_upper FROM forecasts "
+                "WHERE player_type = ? AND engine = ? AND player_id = ? AND metric = ? AND data_version = ? AND step <= ? "
+                "ORDER BY step",
+                conn,
+                params=(player_type, engine, int(player_id), metric, data_version, periods)
+            )
+    except Exception as e:
+        logger.warning(f"사전 계산 예측 조회 실패: {e}")
+        return None
+
+    if len(forecast) < periods:
+        return None
+    forecast['ds'] = pd.to_datetime(forecast['ds'])
+    return forecast
+
+
+def load_forecast_table(
+    player_type: str,
+    data_version: str,
+    engine: str = 'prophet',
+    step: int = 1,
+    db_path: str = FORECAST_DB_PATH,
+) -> Optional[pd.DataFrame]:
+    """
+    한 번의 조회로 선수 유형/엔진의 전체 선수·지표 예측 중 step 시점을 가져옵니다. 없으면 None을 반환합니다.
+
+    Returns:
+        PlayerID, metric, yhat, yhat_lower, yhat_upper 컬럼의 데이터프레임
+    """
+    if not os.path.exists(db_path):
+        return None
+    try:
+        with sqlite3.connect(db_path, timeout=5) as conn:
+            table = pd.read_sql_query(
+                "SELECT player_id AS PlayerID, metric, yhat, yhat_lower, yhat_upper FROM forecasts "
+                "WHERE player_type = ? AND engine = ? AND data_version = ? AND step = ?",
+                conn,
+                params=(player_type, engine, data_version, step)
+            )
+    except Exception as e:
+        logger.warning(f"사전 계산 예측 테이블 조회 실패: {e}")
+        return None
+    return table if not table.empty else None
+
+
+def run_all(engines: List[str] = ENGINES, workers: int = FORECAST_BATCH_WORKERS, force: bool = False,
+            mode: str = DEFAULT_FORECAST_MODE) -> List[Dict]:
+    """타자/투수 에이징 커브와 전체 예측을 엔진별로 사전 계산합니다. 데이터 업데이트 후 호출됩니다."""
+    precompute_aging_curves()
+    return [
+        precompute_forecasts(player_type, engine=engine, workers=workers, force=force, mode=mode)
+        for player_type in PLAYER_TYPES
+        for engine in engines
+    ]
+
+
+def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    parser = argparse.ArgumentParser(description='선수 예측 일괄 사전 계산 스크립트')
+    parser.add_argument(
+        '--player-type',
+        choices=['batter', 'pitcher', 'all'],
+        default='all',
+        help='사전 계산할 선수 유형 (기본값: all)'
+    )
+    parser.add_argument(
+        '--engine',
+        choices=ENGINES + ['all'],
+        default='all',
+        help='사전 계산할 예측 엔진 (기본값: all)'
+    )
+    parser.add_argument(
+        '--mode',
+        choices=MODES,
+        default=DEFAULT_FORECAST_MODE,
+        help=f'Prophet 예측 모드 (fast: 해석적 구간, accurate: 불확실성 샘플링, 기본값: {DEFAULT_FORECAST_MODE})'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=FORECAST_BATCH_WORKERS,
+        help=f'프로세스 풀 크기 (기본값: {FORECAST_BATCH_WORKERS})'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='같은 데이터 버전이라도 다시 계산'
+    )
+
+    args = parser.parse_args()
+
+    engines = ENGINES if args.engine == 'all' else [args.engine]
+    player_types = list(PLAYER_TYPES) if args.player_type == 'all' else [args.player_type]
+
+    try:
+        precompute_aging_curves()
+        for player_type in player_types:
+            for engine in engines:
+                precompute_forecasts(player_type, engine=engine, workers=args.workers, force=args.force, mode=args.mode)
+    except Exception as e:
+        logger.error(f"예측 사전 계산 실패: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
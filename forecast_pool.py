@@ -0,0 +1,193 @@
+"""
+예측 워커 풀 모듈
+Prophet을 미리 로드해 둔 장기 실행 프로세스 풀에 예측 학습을 제출하고,
+대기열 상한(입장 제어), 요청별 시간 제한, 세션 종료 시 취소, 대기 순번 조회를 지원
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from typing import Callable, Dict, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class ForecastPoolError(RuntimeError):
+    """워커 풀이 요청을 처리하지 못한 경우의 기본 예외"""
+
+
+class ForecastQueueFullError(ForecastPoolError):
+    """대기열이 가득 차서 요청을 받을 수 없는 경우"""
+
+
+class ForecastTimeoutError(ForecastPoolError):
+    """요청이 제한 시간 안에 끝나지 않은 경우"""
+
+
+class ForecastWorkerError(ForecastPoolError):
+    """워커 프로세스가 비정상 종료되어 요청이 실패한 경우 (풀은 새 워커로 다시 시작됨)"""
+
+
+def _warm_worker():
+    """워커 프로세스 시작 시 Prophet을 임포트하고 작은 시계열을 한 번 학습하여 Stan 모델을 준비합니다."""
+    from predict import fit_prophet_forecast
+    logging.getLogger('cmdstanpy').setLevel(logging.WARNING)
+    logging.getLogger('prophet').setLevel(logging.WARNING)
+
+    warmup = pd.DataFrame({'ds': pd.to_datetime(['2020', '2021', '2022']), 'y': [1.0, 2.0, 3.0]})
+    try:
+        fit_prophet_forecast(warmup, periods=1, mode='fast')
+    except Exception as e:
+        logger.warning(f"예측 워커 준비 실패: {e}")
+
+
+def _pool_fit(seasons, values, periods, mode):
+    """워커 프로세스에서 한 시계열의 Prophet 예측을 수행합니다."""
+    from predict import fit_prophet_forecast
+
+    df_metric = pd.DataFrame({
+        'ds': pd.to_datetime(pd.Series(seasons).astype(str), format='%Y'),
+        'y': values,
+    })
+    forecast = fit_prophet_forecast(df_metric, periods=periods, mode=mode)
+    return forecast[['ds', 'yhat', 'yhat_lower', 'yhat_upper']]
+
+
+def _noop():
+    return None
+
+
+class ForecastPool:
+    """
+    Prophet 예측용 장기 실행 프로세스 풀
+
+    Args:
+        workers: 워커 프로세스 수
+        max_queue: 대기 + 실행 중인 요청 수 상한 (넘으면 ForecastQueueFullError)
+        session_probe: 세션 ID가 아직 활성 상태인지 확인하는 함수 (없으면 자동 취소 안 함)
+        reap_interval: 비활성 세션의 요청을 정리하는 주기 (초)
+    """
+
+    def __init__(self, workers: int, max_queue: int,
+                 session_probe: Optional[Callable[[str], bool]] = None, reap_interval: float = 5.0):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._tickets = OrderedDict()  # future -> session_id (제출 순서 유지)
+        self._executor = self._start_executor()
+
+        if session_probe is not None:
+            reaper = threading.Thread(
+                target=self._reap_inactive_sessions, args=(session_probe, reap_interval),
+                name='forecast-pool-reaper', daemon=True
+            )
+            reaper.start()
+
+    def _start_executor(self) -> ProcessPoolExecutor:
+        executor = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=get_context('spawn'), initializer=_warm_worker
+        )
+        # 첫 요청이 워커 기동 비용을 내지 않도록 미리 모든 워커를 띄움
+        for _ in range(self.workers):
+            executor.submit(_noop)
+        return executor
+
+    def _restart_if_broken(self):
+        """
+        워커가 비정상 종료되어 깨진 실행기를 새 실행기로 교체합니다. (호출자가 잠금을 보유)
+        같은 고장이 여러 요청에서 보고되어도 깨진 실행기만 교체하므로 한 번만 다시 시작합니다.
+        """
+        try:
+            self._executor.submit(_noop)
+        except BrokenProcessPool:
+            logger.warning("예측 워커가 비정상 종료되어 워커 풀을 다시 시작합니다.")
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = self._start_executor()
+
+    def submit(self, session_id: Optional[str], seasons, values, periods: int, mode: str):
+        """예측 학습을 제출하고 Future를 반환합니다. 대기열이 가득 차면 ForecastQueueFullError를 발생시킵니다."""
+        with self._lock:
+            if len(self._tickets) >= self.max_queue:
+                raise ForecastQueueFullError(f"예측 대기열이 가득 찼습니다. ({self.max_queue}개)")
+            try:
+                future = self._executor.submit(_pool_fit, seasons, values, periods, mode)
+            except BrokenProcessPool:
+                self._restart_if_broken()
+                future = self._executor.submit(_pool_fit, seasons, values, periods, mode)
+            self._tickets[future] = session_id
+        future.add_done_callback(self._forget)
+        return future
+
+    def _forget(self, future):
+        with self._lock:
+            self._tickets.pop(future, None)
+
+    def result(self, future, timeout: float):
+        """
+        결과를 기다립니다. 제한 시간을 넘기면 아직 시작 전인 요청은 취소하고 ForecastTimeoutError를 발생시킵니다.
+        워커가 비정상 종료되면 풀을 새 워커로 다시 시작한 뒤 ForecastWorkerError를 발생시킵니다.
+        """
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise ForecastTimeoutError(f"예측이 {timeout:.0f}초 안에 끝나지 않았습니다.")
+        except BrokenProcessPool:
+            with self._lock:
+                self._restart_if_broken()
+            raise ForecastWorkerError("예측 워커가 비정상 종료되었습니다.")
+
+    def queue_position(self, session_id: Optional[str]) -> Optional[int]:
+        """
+        세션의 대기 순번을 반환합니다.
+        0이면 학습 중, 1 이상이면 앞에 대기 중인 요청 수 + 1, 요청이 없으면 None입니다.
+        """
+        with self._lock:
+            tickets = list(self._tickets.items())
+        waiting = [sid for future, sid in tickets if not future.running() and not future.done()]
+        if session_id in waiting:
+            return waiting.index(session_id) + 1
+        if any(sid == session_id for _, sid in tickets):
+            return 0
+        return None
+
+    def cancel_session(self, session_id: Optional[str]) -> int:
+        """세션의 시작 전 요청을 모두 취소하고 취소한 수를 반환합니다."""
+        with self._lock:
+            futures = [future for future, sid in self._tickets.items() if sid == session_id]
+        cancelled = sum(future.cancel() for future in futures)
+        if cancelled:
+            logger.info(f"세션 {session_id}의 예측 요청 {cancelled}개 취소")
+        return cancelled
+
+    def _reap_inactive_sessions(self, session_probe: Callable[[str], bool], interval: float):
+        while True:
+            time.sleep(interval)
+            with self._lock:
+                session_ids = {sid for sid in self._tickets.values() if sid is not None}
+            for session_id in session_ids:
+                try:
+                    active = session_probe(session_id)
+                except Exception:
+                    active = True
+                if not active:
+                    self.cancel_session(session_id)
+
+    def stats(self) -> Dict[str, int]:
+        """워커 수와 대기/실행 중인 요청 수를 반환합니다."""
+        with self._lock:
+            futures = list(self._tickets)
+        running = sum(future.running() for future in futures)
+        return {'workers': self.workers, 'running': running, 'waiting': len(futures) - running, 'max_queue': self.max_queue}
+
+    def shutdown(self):
+        """풀을 종료합니다. 대기 중인 요청은 취소됩니다."""
+        with self._lock:
+            executor = self._executor
+        executor.shutdown(wait=False, cancel_futures=True)
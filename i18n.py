@@ -11,6 +11,8 @@ KO = {
     "search_records": "기록 조회",
     "predict_records": "기록 예측",
     "compare_players": "선수 비교",
+    "team_projection": "팀 예측",
+    "projection_leaderboard": "예측 리더보드",
 
     # 선수 비교 페이지
     "select_data_type": "데이터 종류 선택",
@@ -82,6 +84,7 @@ KO = {
     "predict_title": "MLB 선수 기록 예측",
     "player_option": "선수 및 옵션 선택",
     "prediction_tab": "기록 예측",
+    "simulation_tab": "시즌 시뮬레이션",
     "prediction_result": "예측 결과",
     "prediction_warning": "의 최근 2개년(2022, 2023) 시즌 데이터가 없어 예측이 불가능합니다.",
     "search_player_name": "선수 이름 검색",
@@ -178,6 +181,12 @@ KO = {
     "metric_Losses": "패수",
     "metric_InningsPitched": "이닝",
     "metric_HitsAllowed": "피안타",
+    "metric_GamesPlayed": "경기",
+    "metric_AtBats": "타수",
+    "metric_Runs": "득점",
+    "metric_HomeRunsAllowed": "피홈런",
+    "metric_Saves": "세이브",
+    "metric_QualifyingInnings": "규정 이닝",
 
     # 기타
     "loading": "로딩 중...",
@@ -203,6 +212,8 @@ EN = {
     "search_records": "Search Records",
     "predict_records": "Predict Records",
     "compare_players": "Compare Players",
+    "team_projection": "Team Projections",
+    "projection_leaderboard": "Projection Leaderboard",
 
     # Compare Players Page
     "select_data_type": "Select Data Type",
@@ -274,6 +285,7 @@ EN = {
     "predict_title": "MLB Player Records Prediction",
     "player_option": "Select Player and Options",
     "prediction_tab": "Records Prediction",
+    "simulation_tab": "Season Simulation",
     "prediction_result": "Prediction Results",
     "prediction_warning": " does not have recent data (2022, 2023) required for prediction.",
     "search_player_name": "Search player name",
@@ -370,6 +382,12 @@ EN = {
     "metric_Losses": "Losses",
     "metric_InningsPitched": "Innings Pitched",
     "metric_HitsAllowed": "Hits Allowed",
+    "metric_GamesPlayed": "Games",
+    "metric_AtBats": "At Bats",
+    "metric_Runs": "Runs",
+    "metric_HomeRunsAllowed": "Home Runs Allowed",
+    "metric_Saves": "Saves",
+    "metric_QualifyingInnings": "Qualifying Innings",
 
     # Other
     "loading": "Loading...",
@@ -395,6 +413,8 @@ JA = {
     "search_records": "記録検索",
     "predict_records": "記録予測",
     "compare_players": "選手比較",
+    "team_projection": "チーム予測",
+    "projection_leaderboard": "予測リーダーボード",
 
     # 選手比較ページ
     "select_data_type": "データタイプ選択",
@@ -466,6 +486,7 @@ JA = {
     "predict_title": "MLB選手記録予測",
     "player_option": "選手とオプションの選択",
     "prediction_tab": "記録予測",
+    "simulation_tab": "シーズンシミュレーション",
     "prediction_result": "予測結果",
     "prediction_warning": "は予測に必要な最近のデータ（2022年、2023年）がありません。",
     "search_player_name": "選手名を検索",
@@ -562,6 +583,12 @@ JA = {
     "metric_Losses": "敗北",
     "metric_InningsPitched": "投球回",
     "metric_HitsAllowed": "被安打",
+    "metric_GamesPlayed": "試合",
+    "metric_AtBats": "打数",
+    "metric_Runs": "得点",
+    "metric_HomeRunsAllowed": "被本塁打",
+    "metric_Saves": "セーブ",
+    "metric_QualifyingInnings": "規定投球回",
 
     # その他
     "loading": "読み込み中...",
@@ -0,0 +1,169 @@
+import time
+import streamlit as st
+import pandas as pd
+import numpy as np
+from utils import load_data, load_pitcher_data, get_data_version, show_table
+from i18n import get_text, get_metric_names_dict
+from config import (
+    PREDICT_BATTER_METRICS, PREDICT_PITCHER_METRICS, CACHE_TTL_SECONDS,
+    LEADERBOARD_BASELINE_SEASONS, LOWER_IS_BETTER_METRICS, LEADERBOARD_TOP_N,
+)
+from forecast_batch import load_forecast_table
+from predict import FORECAST_ENGINES, get_marcel_projections
+
+# 리더보드에서 선택할 수 있는 사전 계산 엔진 키 -> 표시명
+LEADERBOARD_ENGINES = {
+    'marcel': FORECAST_ENGINES['marcel'][0],
+    'pooled': FORECAST_ENGINES['pooled'][0],
+    'prophet': FORECAST_ENGINES['prophet'][0],
+    'prophet_fast': FORECAST_ENGINES['prophet'][0] + " (fast)",
+}
+
+
+def score_projected_changes(df, forecasts, metrics, baseline_seasons=LEADERBOARD_BASELINE_SEASONS,
+                            lower_is_better=LOWER_IS_BETTER_METRICS):
+    """
+    마지막 시즌 출전 선수 전체의 다음 시즌 예측을 최근 기준 기록과 비교하여 한 번에 점수화합니다.
+
+    기준 기록은 최근 baseline_seasons 시즌 평균이며, 낮을수록 좋은 지표는 부호를 뒤집어
+    '개선량'으로 통일한 뒤 지표별로 개선량 백분위와 기준 기록 백분위를 계산합니다.
+
+    Args:
+        df: 선수 시즌 기록 데이터
+        forecasts: PlayerID, metric, yhat 컬럼의 다음 시즌 예측 (예측 테이블 한 번 조회 결과)
+        metrics: 점수화할 지표 리스트
+
+    Returns:
+        PlayerID, PlayerName, Team, metric, baseline, projected, change, change_pct,
+        percentile(개선량 백분위), baseline_percentile 컬럼의 데이터프레임
+    """
+    data = df[['PlayerID', 'PlayerName', 'Team', 'Season'] + metrics].sort_values(['PlayerID', 'Season'])
+    active = data.groupby('PlayerID')['Season'].transform('max') == data['Season'].max()
+    recency = data.groupby('PlayerID').cumcount(ascending=False)
+
+    baseline = data[active & (recency < baseline_seasons)].groupby('PlayerID')[metrics].mean()
+    info = data[active & (recency == 0)].set_index('PlayerID').reindex(baseline.index)
+    projected = forecasts.pivot_table(index='PlayerID', columns='metric', values='yhat')
+    projected = projected.reindex(index=baseline.index, columns=metrics)
+
+    base = baseline.to_numpy(dtype=float)
+    change = projected.to_numpy(dtype=float) - base
+    sign = np.where(np.isin(metrics, lower_is_better), -1.0, 1.0)
+    change_pct = np.divide(change, np.abs(base), out=np.full_like(change, np.nan), where=base != 0)
+
+    # 지표별 백분위 (예측이 없는 선수는 NaN으로 남아 순위에서 제외)
+    percentile = pd.DataFrame(change * sign).rank(pct=True).to_numpy()
+    baseline_percentile = pd.DataFrame(np.where(np.isnan(change), np.nan, base * sign)).rank(pct=True).to_numpy()
+
+    n_players, n_metrics = base.shape
+    scored = pd.DataFrame({
+        'PlayerID': np.repeat(baseline.index.to_numpy(), n_metrics),
+        'PlayerName': np.repeat(info['PlayerName'].to_numpy(), n_metrics),
+        'Team': np.repeat(info['Team'].to_numpy(), n_metrics),
+        'metric': np.tile(metrics, n_players),
+        'baseline': base.ravel(),
+        'projected': projected.to_numpy(dtype=float).ravel(),
+        'change': change.ravel(),
+        'change_pct': change_pct.ravel(),
+        'percentile': percentile.ravel(),
+        'baseline_percentile': baseline_percentile.ravel(),
+    })
+    return scored.dropna(subset=['change']).reset_index(drop=True)
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def get_projected_changes(player_type, engine, data_version):
+    """
+    예측 테이블을 한 번 조회하여 데이터 버전별 리더보드 점수를 계산합니다.
+    사전 계산된 예측이 없으면 실시간 Marcel 전체 예측으로 대신합니다.
+
+    Returns:
+        (점수 데이터프레임, 실제 사용한 엔진 키, 계산 시간(초))
+    """
+    start = time.perf_counter()
+    df = load_data() if player_type == 'batter' else load_pitcher_data()
+    metrics = list((PREDICT_BATTER_METRICS if player_type == 'batter' else PREDICT_PITCHER_METRICS).keys())
+
+    forecasts = load_forecast_table(player_type, data_version, engine)
+    if forecasts is None:
+        engine = 'marcel_live'
+        projections = get_marcel_projections(player_type, data_version)
+        forecasts = projections[projections['step'] == 1].reset_index()
+
+    scored = score_projected_changes(df, forecasts, metrics)
+    return scored, engine, time.perf_counter() - start
+
+
+def _format_board(board, metric):
+    """리더보드 표시용 데이터프레임과 컬럼별 printf 형식을 만듭니다. (비율 컬럼은 % 단위로 변환)"""
+    digits = 3 if board['baseline'].abs().max() < 2 else 1
+    show_df = board[['PlayerName', 'Team', 'baseline', 'projected', 'change', 'change_pct', 'percentile']].rename(columns={
+        'PlayerName': '선수', 'Team': '팀', 'baseline': '최근 평균', 'projected': '예측', 'change': '변화',
+        'change_pct': '변화율', 'percentile': '백분위',
+    })
+    show_df[['변화율', '백분위']] *= 100
+    formats = {
+        '최근 평균': f"%.{digits}f", '예측': f"%.{digits}f", '변화': f"%+.{digits}f",
+        '변화율': "%+.1f%%", '백분위': "%.0f%%",
+    }
+    return show_df.reset_index(drop=True), formats
+
+
+def run_leaderboard(lang):
+    st.header(get_text("projection_leaderboard", lang))
+
+    col1, col2 = st.columns(2)
+    with col1:
+        data_type = st.radio(
+            get_text("select_data_type", lang),
+            [get_text("batter", lang), get_text("pitcher", lang)],
+            horizontal=True
+        )
+    with col2:
+        engine = st.selectbox("예측 엔진", list(LEADERBOARD_ENGINES), format_func=lambda x: LEADERBOARD_ENGINES[x])
+
+    player_type = 'batter' if data_type == get_text("batter", lang) else 'pitcher'
+    metric_names = get_metric_names_dict(
+        list((PREDICT_BATTER_METRICS if player_type == 'batter' else PREDICT_PITCHER_METRICS).keys()), lang
+    )
+
+    scored, used_engine, elapsed = get_projected_changes(player_type, engine, get_data_version(player_type))
+    if used_engine != engine:
+        # 엔진 키 'prophet_fast'는 --engine prophet --mode fast로 만들어지는 테이블
+        batch_args = "--engine prophet --mode fast" if engine.endswith('_fast') else f"--engine {engine}"
+        st.info(f"💡 {LEADERBOARD_ENGINES[engine]}의 사전 계산 예측이 없어 실시간 Marcel 예측으로 표시합니다. "
+                f"(`python forecast_batch.py {batch_args}`로 사전 계산할 수 있습니다.)")
+
+    metric = st.selectbox("지표", list(metric_names), format_func=lambda x: metric_names[x])
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        baseline_range = st.slider("최근 기록 백분위 범위", 0, 100, (0, 100), step=5,
+                                   help="지표 방향 기준으로 최근 평균이 이 백분위 범위에 있는 선수만 표시합니다.")
+    with col2:
+        threshold = st.slider("변화 백분위 기준", 50, 99, 90,
+                              help="기대주는 개선량이 이 백분위 이상, 하락 후보는 (100 - 기준) 백분위 이하인 선수입니다.")
+    with col3:
+        top_n = st.number_input("표시 인원", 5, 100, LEADERBOARD_TOP_N, step=5)
+
+    board = scored[scored['metric'] == metric]
+    board = board[board['baseline_percentile'].between(baseline_range[0] / 100, baseline_range[1] / 100)]
+    risers = board[board['percentile'] >= threshold / 100].sort_values('percentile', ascending=False).head(top_n)
+    decliners = board[board['percentile'] <= 1 - threshold / 100].sort_values('percentile').head(top_n)
+
+    st.caption(f"선수 {scored['PlayerID'].nunique()}명 × 지표 {scored['metric'].nunique()}개 점수화 · "
+               f"{elapsed * 1000:.0f} ms (데이터 버전별 캐시)")
+
+    col1, col2 = st.columns(2)
+    for column, title, rows in ((col1, "🚀 기대주", risers), (col2, "📉 하락 후보", decliners)):
+        with column:
+            st.subheader(f"{title} ({len(rows)}명)")
+            if rows.empty:
+                st.write("조건에 맞는 선수가 없습니다.")
+                continue
+            show_df, formats = _format_board(rows, metric)
+            show_table(show_df, lang, formats=formats)
+
+    direction = "낮을수록" if metric in LOWER_IS_BETTER_METRICS else "높을수록"
+    st.info(f"💡 {metric_names[metric]}은(는) {direction} 좋은 지표로, 백분위는 최근 {LEADERBOARD_BASELINE_SEASONS}시즌 평균 대비 "
+            f"다음 시즌 예측의 개선량 순위입니다.")
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+선수 이름 검색 인덱스 모듈
+데이터 버전마다 한 번 만들어 두는 이름 인덱스로, 유니코드 폴딩한 키("Acuña" -> "acuna")의
+정렬 배열에 대한 이진 탐색(접두어)과 3-gram 역색인(부분 문자열/오타 허용 검색)을 사용하여
+키 입력마다 전체 이름을 훑지 않고 순위가 매겨진 PlayerID를 반환 (동명이인은 (이름, PlayerID) 쌍별로 구분)
+"""
+
+import argparse
+import time
+import unicodedata
+from bisect import bisect_left
+from collections import defaultdict
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+# 오타 허용 검색에서 후보로 인정하는 최소 3-gram 일치 비율 (검색어 3-gram 중 이름에 있는 비율)
+FUZZY_MIN_SIMILARITY = 0.5
+# 검색 결과 기본 상한
+DEFAULT_SEARCH_LIMIT = 50
+
+
+def fold_name(name: str) -> str:
+    """
+    검색용 키로 이름을 정규화합니다.
+    악센트 제거(NFKD 분해 후 결합 문자 삭제), 대소문자 폴딩, 영숫자 외 문자 제거, 공백 정리를 합니다.
+    예: "Ronald Acuña Jr." -> "ronald acuna jr", "A.J. Ellis" -> "aj ellis"
+    """
+    decomposed = unicodedata.normalize('NFKD', name)
+    stripped = ''.join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
+    cleaned = ''.join(ch if ch.isalnum() or ch.isspace() else '' for ch in stripped)
+    return ' '.join(cleaned.split())
+
+
+def _trigrams(key: str, padded: bool = True) -> List[str]:
+    """키의 3-gram 목록 (padded이면 단어 경계를 나타내도록 앞뒤에 공백을 붙임)"""
+    text = f" {key} " if padded else key
+    return [text[i:i + 3] for i in range(len(text) - 2)]
+
+
+class PlayerNameIndex:
+    """
+    선수 이름 검색 인덱스
+
+    Args:
+        df: PlayerID, PlayerName 컬럼(선택적으로 Season)을 가진 선수 기록 데이터
+
+    검색 순위는 완전 일치, 이름 접두어, 성/중간 이름 접두어, 부분 문자열, 3-gram 일치 비율(오타 허용) 순이며
+    같은 구간 안에서는 이름 순(오타 허용 구간은 일치 비율 순)으로 정렬됩니다.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        # 동명이인이 모두 검색되도록 (이름, PlayerID) 쌍마다 한 행 (이름 순, 같은 이름은 데뷔 시즌 순)
+        if 'Season' in df.columns:
+            pairs = (df.groupby(['PlayerName', 'PlayerID'])['Season'].agg(['min', 'max']).reset_index()
+                     .sort_values(['PlayerName', 'min', 'PlayerID']))
+        else:
+            pairs = df[['PlayerName', 'PlayerID']].drop_duplicates().sort_values(['PlayerName', 'PlayerID'])
+        self.names = pairs['PlayerName'].tolist()
+        self.player_ids = pairs['PlayerID'].to_numpy()
+        self.labels = self._display_labels(pairs)
+        self._rows_of_name = defaultdict(list)
+        for row, name in enumerate(self.names):
+            self._rows_of_name[name].append(row)
+        self._row_of_id = {player_id: row for row, player_id in enumerate(self.player_ids.tolist())}
+        self.keys = [fold_name(name) for name in self.names]
+
+        # 접두어 검색용: 전체 키 정렬 배열과, 두 번째 단어부터 시작하는 접미 키 정렬 배열 (-> 행 번호)
+        order = sorted(range(len(self.keys)), key=self.keys.__getitem__)
+        self._sorted_keys = [self.keys[row] for row in order]
+        self._sorted_rows = np.asarray(order, dtype=np.int32)
+        token_keys = []
+        for row, key in enumerate(self.keys):
+            start = key.find(' ')
+            while start != -1:
+                token_keys.append((key[start + 1:], row))
+                start = key.find(' ', start + 1)
+        token_keys.sort()
+        self._token_keys = [key for key, _ in token_keys]
+        self._token_rows = np.asarray([row for _, row in token_keys], dtype=np.int32)
+
+        # 3-gram 역색인 (3-gram -> 행 번호 배열)과 행별 3-gram 수 (같은 일치 비율이면 짧은 이름 우선)
+        postings = defaultdict(list)
+        self._gram_counts = np.empty(len(self.keys), dtype=np.int32)
+        for row, key in enumerate(self.keys):
+            grams = set(_trigrams(key))
+            self._gram_counts[row] = len(grams)
+            for gram in grams:
+                postings[gram].append(row)
+        self._postings = {gram: np.asarray(rows, dtype=np.int32) for gram, rows in postings.items()}
+
+        # 시즌별 행 번호 (시즌 선택 화면의 선택 상자용, 행 순서 = 표시 순서)
+        self._season_rows = {}
+        if 'Season' in df.columns:
+            rows = pairs[['PlayerName', 'PlayerID']].assign(row=np.arange(len(pairs)))
+            seasons = df[['Season', 'PlayerName', 'PlayerID']].drop_duplicates().merge(rows, on=['PlayerName', 'PlayerID'])
+            for season, season_rows in seasons.groupby('Season')['row']:
+                self._season_rows[season] = np.sort(season_rows.to_numpy())
+
+    @staticmethod
+    def _display_labels(pairs: pd.DataFrame) -> List[str]:
+        """선택 상자용 표시 이름 (동명이인은 '이름 (첫 시즌-마지막 시즌)', 그래도 같으면 PlayerID 추가)"""
+        names = pairs['PlayerName']
+        duplicated = names.duplicated(keep=False).to_numpy()
+        if not duplicated.any():
+            return names.tolist()
+        if 'min' in pairs:
+            spans = [f"{lo}" if lo == hi else f"{lo}-{hi}" for lo, hi in zip(pairs['min'], pairs['max'])]
+        else:
+            spans = [f"ID {player_id}" for player_id in pairs['PlayerID']]
+        labels = [f"{name} ({span})" if dup else name for name, span, dup in zip(names, spans, duplicated)]
+        repeated = pd.Series(labels).duplicated(keep=False).to_numpy()
+        return [f"{label[:-1]}, ID {player_id})" if rep else label
+                for label, player_id, rep in zip(labels, pairs['PlayerID'], repeated)]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def sorted_names(self, season: Optional[int] = None) -> List[str]:
+        """정렬된 이름 목록 (동명이인은 한 번, season을 주면 해당 시즌 출전 선수만)"""
+        rows = self._rows(season)
+        return list(dict.fromkeys(self.names[row] for row in rows))
+
+    def sorted_ids(self, season: Optional[int] = None) -> List:
+        """표시 이름 순으로 정렬된 PlayerID 목록 (season을 주면 해당 시즌 출전 선수만, 선택 상자 옵션용)"""
+        return self.player_ids[self._rows(season)].tolist()
+
+    def _rows(self, season: Optional[int]):
+        if season is None:
+            return np.arange(len(self.names))
+        return self._season_rows.get(season, np.empty(0, dtype=int))
+
+    def label(self, player_id) -> str:
+        """PlayerID의 표시 이름 (동명이인은 활동 기간 포함, 없으면 빈 문자열)"""
+        row = self._row_of_id.get(player_id)
+        return "" if row is None else self.labels[row]
+
+    def name(self, player_id) -> Optional[str]:
+        """PlayerID의 선수 이름 (없으면 None)"""
+        row = self._row_of_id.get(player_id)
+        return None if row is None else self.names[row]
+
+    def player_ids_of(self, name: str) -> List:
+        """이름의 모든 PlayerID (동명이인은 데뷔 시즌 순, 없으면 빈 목록)"""
+        return self.player_ids[self._rows_of_name.get(name, [])].tolist()
+
+    def _prefix_rows(self, sorted_keys, rows, query):
+        lo = bisect_left(sorted_keys, query)
+        hi = bisect_left(sorted_keys, query + '\uffff')
+        return rows[lo:hi]
+
+    def _substring_rows(self, query):
+        grams = _trigrams(query, padded=False)
+        if not grams:
+            # 3글자 미만은 역색인을 쓸 수 없어 전체 키를 확인 (이름 수만큼의 짧은 비교)
+            return [row for row, key in enumerate(self.keys) if query in key]
+        lists = sorted((self._postings.get(gram) for gram in set(grams)), key=lambda x: 0 if x is None else len(x))
+        if lists[0] is None:
+            return []
+        candidates = lists[0]
+        for rows in lists[1:]:
+            candidates = np.intersect1d(candidates, rows, assume_unique=True)
+            if len(candidates) == 0:
+                return []
+        return [row for row in candidates.tolist() if query in self.keys[row]]
+
+    def _fuzzy_rows(self, query, min_similarity):
+        grams = set(_trigrams(query))
+        hits = [self._postings[gram] for gram in grams if gram in self._postings]
+        if not hits:
+            return []
+        shared = np.bincount(np.concatenate(hits), minlength=len(self.keys))
+        similarity = shared / len(grams)
+        rows = np.flatnonzero(similarity >= min_similarity)
+        return rows[np.lexsort((self._gram_counts[rows], -similarity[rows]))].tolist()
+
+    def search_rows(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT,
+                    min_similarity: float = FUZZY_MIN_SIMILARITY) -> List[int]:
+        """검색어와 일치하는 행 번호를 순위 순으로 최대 limit개 반환합니다."""
+        query = fold_name(query)
+        if not query:
+            return []
+
+        # 앞 구간부터 필요한 만큼만 계산 (접두어 구간은 이름 순으로 정렬된 행 번호)
+        prefix = np.sort(self._prefix_rows(self._sorted_keys, self._sorted_rows, query)).tolist()
+        tiers = (
+            lambda: [row for row in prefix if self.keys[row] == query],
+            lambda: prefix,
+            lambda: np.unique(self._prefix_rows(self._token_keys, self._token_rows, query)).tolist(),
+            lambda: sorted(self._substring_rows(query)),
+            lambda: self._fuzzy_rows(query, min_similarity),
+        )
+        ranked, seen = [], set()
+        for tier in tiers:
+            for row in tier():
+                if row not in seen:
+                    seen.add(row)
+                    ranked.append(row)
+            if len(ranked) >= limit:
+                break
+        return ranked[:limit]
+
+    def search(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> np.ndarray:
+        """검색어와 일치하는 선수의 PlayerID를 순위 순으로 반환합니다. (동명이인은 모두 포함)"""
+        return self.player_ids[self.search_rows(query, limit)]
+
+    def search_names(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[str]:
+        """검색어와 일치하는 선수의 표시 이름을 순위 순으로 반환합니다. (동명이인은 활동 기간 포함)"""
+        return [self.labels[row] for row in self.search_rows(query, limit)]
+
+
+def _synthetic_history(n_players: int, seed: int = 0) -> pd.DataFrame:
+    """벤치마크용 가상 선수 이름 데이터 (이름/중간 이니셜/성/접미사 조합, 악센트 이름 포함)"""
+    rng = np.random.default_rng(seed)
+    first = ['José', 'Ronald', 'Julio', 'Adrián', 'Mike', 'Shohei', 'Carlos', 'Andrés', 'Freddie', 'Yordan',
+             'Víctor', 'Luis', 'Miguel', 'Aaron', 'Mookie', 'Juan', 'Francisco', 'Vladimir', 'Bo', 'Eloy']
+    last = ['Acuña', 'Rodríguez', 'Beltré', 'Trout', 'Ohtani', 'Correa', 'Giménez', 'Freeman', 'Álvarez',
+            'Martínez', 'Arráez', 'Cabrera', 'Judge', 'Betts', 'Soto', 'Lindor', 'Guerrero', 'Bichette', 'Jiménez']
+    suffix = ['', ' Jr.', ' II', ' III', ' Sr.']
+    names = [f"{f} {m}. {l}{s}" for f in first for m in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ' for l in last for s in suffix]
+    names = rng.choice(names, size=min(n_players, len(names)), replace=False)
+    return pd.DataFrame({'PlayerName': names, 'PlayerID': np.arange(len(names))})
+
+
+def main():
+    parser = argparse.ArgumentParser(description='선수 이름 검색 인덱스 벤치마크')
+    parser.add_argument('--players', type=int, default=25000, help='가상 선수 수 (기본값: 25000)')
+    parser.add_argument('--repeat', type=int, default=200, help='검색어별 반복 횟수')
+    args = parser.parse_args()
+
+    df = _synthetic_history(args.players)
+    start = time.perf_counter()
+    index = PlayerNameIndex(df)
+    build = time.perf_counter() - start
+    print(f"선수 {len(index)}명 인덱스 생성: {build * 1000:.0f} ms")
+
+    names = df['PlayerName'].tolist()
+    for query in ['a', 'acuna', 'Acuña', 'jose rod', 'rez jr', 'ohtanni', 'martinez']:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            rows = index.search_rows(query)
+        indexed = (time.perf_counter() - start) / args.repeat
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            [name for name in sorted(set(names)) if query.lower() in name.lower()]
+        scan = (time.perf_counter() - start) / args.repeat
+        print(f"{query!r:12} 결과 {len(rows):3}건  인덱스 {indexed * 1000:7.3f} ms  "
+              f"기존 정렬+부분 문자열 {scan * 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
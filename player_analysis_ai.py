@@ -3,12 +3,19 @@ AI 기반 선수 분석 보고서 생성 모듈
 LangChain과 Google Gemini를 활용한 MLB 선수 기록 동향 분석
 """
 
+import math
 import os
+import numpy as np
 import pandas as pd
 import streamlit as st
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 import logging
-from config import AI_MODEL_NAME, AI_TEMPERATURE, AI_MAX_TOKENS
+from config import (
+    AI_MODEL_NAME, AI_TEMPERATURE, AI_MAX_TOKENS,
+    AI_REPORT_CACHE_PATH, AI_REPORT_CACHE_TTL_SECONDS, AI_REPORT_CACHE_MAX_BYTES,
+    AI_PROMPT_TOKEN_BUDGET, AI_PROMPT_CHARS_PER_TOKEN, AI_PROMPT_PEAK_SEASONS, AI_PROMPT_RECENT_SEASONS,
+)
+from disk_cache import DiskCache, make_cache_key
 
 # .env 파일 로드
 try:
@@ -28,15 +35,115 @@ except ImportError:
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 앱 언어 코드 -> 보고서 작성 언어
+REPORT_LANGUAGES = {"ko": "한국어", "en": "영어", "ja": "일본어"}
+
+# 프롬프트에 넣는 지표: (컬럼, 표시명, 소수 자릿수, 단위, 누적 기록 여부 - 통산 블록에서 합계로 표시)
+_PLAYER_FIELDS = {
+    "타자": [
+        ('BattingAverage', '타율', 3, '', False), ('HomeRuns', '홈런', 0, '개', True), ('RBIs', '타점', 0, '개', True),
+        ('OPS', 'OPS', 3, '', False), ('OnBasePercentage', '출루율', 3, '', False),
+        ('SluggingPercentage', '장타율', 3, '', False),
+    ],
+    "투수": [
+        ('EarnedRunAverage', 'ERA', 2, '', False), ('Wins', '승수', 0, '승', True), ('Losses', '패수', 0, '패', True),
+        ('Whip', 'WHIP', 2, '', False), ('StrikeOuts', '탈삼진', 0, '개', True), ('InningsPitched', '이닝', 1, '', True),
+    ],
+}
+_LEAGUE_FIELDS = {
+    "타자": [
+        ('BattingAverage', '타율', 3, '', False), ('HomeRuns', '홈런', 1, '개', False), ('RBIs', '타점', 1, '개', False),
+        ('OPS', 'OPS', 3, '', False),
+    ],
+    "투수": [
+        ('EarnedRunAverage', 'ERA', 2, '', False), ('Whip', 'WHIP', 2, '', False), ('StrikeOuts', '탈삼진', 1, '개', False),
+    ],
+}
+# 최고 시즌을 고르는 기준 지표와 방향 (높을수록 좋은지)
+_PEAK_METRIC = {"타자": ('OPS', True), "투수": ('EarnedRunAverage', False)}
+
+
+def estimate_tokens(text: str) -> int:
+    """문자 수로 추정한 토큰 수 (한글/숫자가 섞인 요약 기준의 보수적 근사)"""
+    return math.ceil(len(text) / AI_PROMPT_CHARS_PER_TOKEN)
+
+
+def _season_rows(frame: pd.DataFrame, fields, unique: bool = True):
+    """
+    시즌 순으로 정렬한 (시즌 배열, 시즌 × 지표 값 행렬)을 만듭니다. (없는 컬럼은 NaN)
+    unique이면 같은 시즌이 여럿일 때 마지막 행만 남깁니다. (동명이인이 합쳐진 기록 등)
+    """
+    seasons = frame['Season'].to_numpy(dtype=int)
+    # 컬럼별 조회가 여러 컬럼 선택(새 데이터프레임 생성)보다 훨씬 빠름
+    values = np.column_stack([
+        frame[column].to_numpy(dtype=float) if column in frame else np.full(len(frame), np.nan)
+        for column, *_ in fields
+    ])
+    if not unique:
+        order = np.argsort(seasons, kind='stable')
+        return seasons[order], values[order]
+    distinct, last = np.unique(seasons[::-1], return_index=True)
+    return distinct, values[len(seasons) - 1 - last]
+
+
+def _format_stat_lines(labels, values: np.ndarray, fields) -> List[str]:
+    """행마다 '라벨: 지표 값, ...' 줄을 만듭니다. 행 단위 반복 없이 지표(컬럼)마다 전체 행을 한 번에 포맷합니다."""
+    columns = []
+    for (column, name, digits, unit, _), col in zip(fields, values.T):
+        pattern = f"{name} %.{digits}f{unit}"
+        missing = f"{name} N/A"
+        columns.append([pattern % x if x == x else missing for x in col.tolist()])
+    return [f"{label}: " + ", ".join(parts) for label, parts in zip(labels, zip(*columns))]
+
+
+def _group_means(values: np.ndarray, group_ids: np.ndarray, n_groups: int) -> np.ndarray:
+    """그룹별 지표 평균 (NaN 제외, 값이 없으면 NaN)"""
+    known = ~np.isnan(values)
+    sums = np.zeros((n_groups, values.shape[1]))
+    counts = np.zeros((n_groups, values.shape[1]))
+    np.add.at(sums, group_ids, np.where(known, values, 0.0))
+    np.add.at(counts, group_ids, known)
+    return np.divide(sums, counts, out=np.full_like(sums, np.nan), where=counts > 0)
+
+
+def _range_label(seasons) -> str:
+    """
+    실제 포함된 시즌으로 만든 구간 라벨 (예: '2003-2007 (5시즌)', '2003-2005, 2007 (4시즌)')
+    최고 시즌 등이 빠져 끊긴 부분은 연속 구간별로 나누어 표시합니다.
+    """
+    seasons = np.asarray(seasons)
+    if len(seasons) == 1:
+        return f"시즌 {seasons[0]}"
+    breaks = np.flatnonzero(np.diff(seasons) != 1) + 1
+    runs = [f"{run[0]}-{run[-1]}" if len(run) > 1 else f"{run[0]}" for run in np.split(seasons, breaks)]
+    return f"{', '.join(runs)} ({len(seasons)}시즌)"
+
+
+@st.cache_resource(show_spinner=False)
+def get_report_cache() -> DiskCache:
+    """프로세스 전체에서 공유하는 AI 보고서 디스크 캐시를 반환합니다. (여러 프로세스가 같은 파일을 공유)"""
+    return DiskCache(AI_REPORT_CACHE_PATH, AI_REPORT_CACHE_MAX_BYTES, ttl_seconds=AI_REPORT_CACHE_TTL_SECONDS)
+
+
+def report_cache_key(formatted_prompt: str, data_version: Optional[str]) -> str:
+    """완성된 프롬프트, 모델명, 온도, 데이터 버전으로 보고서 캐시 키를 만듭니다."""
+    return make_cache_key('ai_report', formatted_prompt, AI_MODEL_NAME, AI_TEMPERATURE, data_version)
+
 class PlayerAnalysisAI:
-    """AI 기반 선수 분석 클래스"""
+    """
+    AI 기반 선수 분석 클래스
+
+    생성 후에는 요청별 상태를 보관하지 않으므로(모델 클라이언트, 프롬프트 템플릿, 디스크 캐시 모두 읽기 전용)
+    get_player_analysis_ai()로 프로세스 전체에서 하나의 인스턴스를 여러 세션/스레드가 함께 사용합니다.
+    """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, use_cache: bool = True):
         """
         PlayerAnalysisAI 초기화
         
         Args:
             api_key: Google AI API 키 (없으면 환경변수에서 가져옴)
+            use_cache: 생성된 보고서를 디스크 캐시에 저장/조회할지 여부
         """
         if not LANGCHAIN_AVAILABLE:
             raise ImportError("LangChain 라이브러리가 필요합니다.")
@@ -53,6 +160,8 @@ class PlayerAnalysisAI:
             max_tokens=AI_MAX_TOKENS
         )
         
+        self.report_cache = get_report_cache() if use_cache else None
+
         # 프롬프트 템플릿 설정
         self._setup_prompts()
     
@@ -151,82 +260,196 @@ class PlayerAnalysisAI:
 """
         )
     
-    @staticmethod
-    def _safe_format(value, fmt=".3f"):
-        """NaN/None 안전 포매팅."""
-        try:
-            if pd.isna(value):
-                return "N/A"
-            return f"{value:{fmt}}"
-        except (ValueError, TypeError):
-            return str(value)
-
-    def _prepare_player_data_summary(self, player_data: pd.DataFrame, player_type: str) -> str:
-        """선수 데이터를 AI 분석용 텍스트로 변환"""
+    def _season_plan(self, player_data: pd.DataFrame, player_type: str) -> Optional[Dict[str, Any]]:
+        """
+        선수 기록 블록이 토큰 예산을 넘으면 압축 계획(최근/최고/기간별 시즌)을 만듭니다. 예산 안이면 None.
+
+        최근 AI_PROMPT_RECENT_SEASONS 시즌과 기준 지표의 최고 AI_PROMPT_PEAK_SEASONS 시즌은 그대로 두고,
+        나머지 시즌은 남은 예산에 맞는 수의 구간으로 묶어 구간 평균으로 보냅니다.
+        """
+        if player_data.empty:
+            return None
+        fields = _PLAYER_FIELDS[player_type]
+        seasons, values = _season_rows(player_data, fields)
+        # 줄 길이는 거의 일정하므로 첫 줄로 전체 토큰 수를 추정
+        line_tokens = estimate_tokens(_format_stat_lines([f"시즌 {seasons[0]}"], values[:1], fields)[0])
+        if len(seasons) * line_tokens <= AI_PROMPT_TOKEN_BUDGET:
+            return None
+
+        n_recent = min(AI_PROMPT_RECENT_SEASONS, len(seasons))
+        metric, higher_is_better = _PEAK_METRIC[player_type]
+        columns = [field[0] for field in fields]
+        key = values[:-n_recent or None, columns.index(metric)]
+        if player_type == "투수":
+            # 짧은 이닝의 평균자책점이 최고 시즌으로 뽑히지 않도록 커리어 최다 이닝의 절반 이상인 시즌만 후보
+            innings = values[:, columns.index('InningsPitched')]
+            key = np.where(innings[:len(key)] >= 0.5 * np.nanmax(innings), key, np.nan)
+        key = np.where(np.isnan(key), -np.inf, key if higher_is_better else -key)
+        peak = np.sort(seasons[:len(key)][np.argsort(-key, kind='stable')[:AI_PROMPT_PEAK_SEASONS]])
+        recent = seasons[len(seasons) - n_recent:]
+
+        rest = seasons[~np.isin(seasons, np.concatenate([peak, recent]))]
+        # 통산 줄과 머리글 3줄 몫을 뺀 나머지 예산으로 구간 수 결정
+        available = AI_PROMPT_TOKEN_BUDGET - (len(peak) + len(recent) + 4) * line_tokens
+        n_groups = int(np.clip(available // line_tokens, 1, max(len(rest), 1)))
+        return {
+            'metric': metric, 'peak': peak, 'recent': recent,
+            'groups': [group for group in np.array_split(rest, n_groups) if len(group)],
+        }
+
+    def _prepare_player_data_summary(self, player_data: pd.DataFrame, player_type: str,
+                                     plan: Optional[Dict[str, Any]] = None) -> str:
+        """선수 데이터를 AI 분석용 텍스트로 변환 (plan이 있으면 통산/기간별/최고/최근 시즌 블록으로 압축)"""
         if player_data.empty:
             return "데이터가 없습니다."
 
-        summary_lines = []
-        sf = self._safe_format
-
-        for _, row in player_data.iterrows():
-            if player_type == "타자":
-                line = f"시즌 {row['Season']}: "
-                line += f"타율 {sf(row.get('BattingAverage'), '.3f')}, "
-                line += f"홈런 {sf(row.get('HomeRuns'), '.0f')}개, "
-                line += f"타점 {sf(row.get('RBIs'), '.0f')}개, "
-                line += f"OPS {sf(row.get('OPS'), '.3f')}, "
-                line += f"출루율 {sf(row.get('OnBasePercentage'), '.3f')}, "
-                line += f"장타율 {sf(row.get('SluggingPercentage'), '.3f')}"
-            else:  # 투수
-                line = f"시즌 {row['Season']}: "
-                line += f"ERA {sf(row.get('EarnedRunAverage'), '.2f')}, "
-                line += f"승수 {sf(row.get('Wins'), '.0f')}승, "
-                line += f"패수 {sf(row.get('Losses'), '.0f')}패, "
-                line += f"WHIP {sf(row.get('Whip'), '.2f')}, "
-                line += f"탈삼진 {sf(row.get('StrikeOuts'), '.0f')}개, "
-                line += f"이닝 {sf(row.get('InningsPitched'), '.1f')}"
-
-            summary_lines.append(line)
-
-        return "\n".join(summary_lines)
+        fields = _PLAYER_FIELDS[player_type]
+        if plan is None:
+            seasons, values = _season_rows(player_data, fields, unique=False)
+            return "\n".join(_format_stat_lines([f"시즌 {s}" for s in seasons], values, fields))
+        seasons, values = _season_rows(player_data, fields)
+
+        known = ~np.isnan(values)
+        is_count = np.array([field[4] for field in fields])
+        totals = np.where(known, values, 0.0).sum(axis=0)
+        n_known = known.sum(axis=0)
+        career = np.where(is_count, totals, np.divide(totals, n_known, out=np.full_like(totals, np.nan), where=n_known > 0))
+        career[n_known == 0] = np.nan
+        metric_name = next(field[1] for field in fields if field[0] == plan['metric'])
+
+        lines = [f"[통산 ({len(seasons)}시즌, {seasons[0]}-{seasons[-1]}), 누적 기록은 합계, 비율 기록은 시즌 평균]"]
+        lines += _format_stat_lines(["통산"], career[None, :], fields)
+        if plan['groups']:
+            group_ids = np.repeat(np.arange(len(plan['groups'])), [len(g) for g in plan['groups']])
+            positions = np.searchsorted(seasons, np.concatenate(plan['groups']))
+            lines.append("[기간별 시즌 평균]")
+            lines += _format_stat_lines([_range_label(g) for g in plan['groups']],
+                                        _group_means(values[positions], group_ids, len(plan['groups'])), fields)
+        lines.append(f"[최고 시즌 ({metric_name} 기준)]")
+        lines += _format_stat_lines([f"시즌 {s}" for s in plan['peak']], values[np.searchsorted(seasons, plan['peak'])], fields)
+        lines.append("[최근 시즌]")
+        lines += _format_stat_lines([f"시즌 {s}" for s in plan['recent']], values[np.searchsorted(seasons, plan['recent'])], fields)
+        return "\n".join(lines)
     
-    def _prepare_league_averages_summary(self, league_data: pd.DataFrame, seasons: List[int], player_type: str) -> str:
-        """리그 평균 데이터를 AI 분석용 텍스트로 변환"""
+    def _prepare_league_averages_summary(self, league_data: pd.DataFrame, seasons: List[int], player_type: str,
+                                         plan: Optional[Dict[str, Any]] = None) -> str:
+        """리그 평균 데이터를 AI 분석용 텍스트로 변환 (plan이 있으면 선수 기록과 같은 구간/시즌으로 압축)"""
         if league_data.empty:
             return "리그 평균 데이터가 없습니다."
         
-        relevant_data = league_data[league_data['Season'].isin(seasons)]
-        if relevant_data.empty:
+        fields = _LEAGUE_FIELDS[player_type]
+        league_seasons, values = _season_rows(league_data, fields)
+        relevant = np.isin(league_seasons, np.asarray(seasons, dtype=int))
+        if not relevant.any():
             return "해당 시즌의 리그 평균 데이터가 없습니다."
-        
-        summary_lines = []
-        sf = self._safe_format
-
-        for _, row in relevant_data.iterrows():
-            if player_type == "타자":
-                line = f"시즌 {row['Season']} 리그 평균: "
-                line += f"타율 {sf(row.get('BattingAverage'), '.3f')}, "
-                line += f"홈런 {sf(row.get('HomeRuns'), '.1f')}개, "
-                line += f"타점 {sf(row.get('RBIs'), '.1f')}개, "
-                line += f"OPS {sf(row.get('OPS'), '.3f')}"
-            else:  # 투수
-                line = f"시즌 {row['Season']} 리그 평균: "
-                line += f"ERA {sf(row.get('EarnedRunAverage'), '.2f')}, "
-                line += f"WHIP {sf(row.get('Whip'), '.2f')}, "
-                line += f"탈삼진 {sf(row.get('StrikeOuts'), '.1f')}개"
-
-            summary_lines.append(line)
-
-        return "\n".join(summary_lines)
+        league_seasons, values = league_seasons[relevant], values[relevant]
+        if plan is None:
+            lines = _format_stat_lines([f"시즌 {s} 리그 평균" for s in league_seasons], values, fields)
+            if len(lines) * estimate_tokens(lines[0]) <= AI_PROMPT_TOKEN_BUDGET:
+                return "\n".join(lines)
+            # 두 선수 비교처럼 시즌이 많으면 예산에 맞는 수의 연속 구간 평균으로 묶음
+            n_groups = max(1, AI_PROMPT_TOKEN_BUDGET // (estimate_tokens(lines[0]) + 4))
+            plan = {'groups': np.array_split(league_seasons, n_groups), 'peak': [], 'recent': []}
+
+        lines = []
+        groups = [g[np.isin(g, league_seasons)] for g in plan['groups']]
+        groups = [g for g in groups if len(g)]
+        if groups:
+            group_ids = np.repeat(np.arange(len(groups)), [len(g) for g in groups])
+            positions = np.searchsorted(league_seasons, np.concatenate(groups))
+            lines += _format_stat_lines([f"{_range_label(g)} 리그 평균" for g in groups],
+                                        _group_means(values[positions], group_ids, len(groups)), fields)
+        single = np.union1d(plan['peak'], plan['recent']).astype(int)
+        single = single[np.isin(single, league_seasons)]
+        lines += _format_stat_lines([f"시즌 {s} 리그 평균" for s in single],
+                                    values[np.searchsorted(league_seasons, single)], fields)
+        return "\n".join(lines)
     
+    def build_player_prompt(
+        self,
+        player_name: str,
+        player_data: pd.DataFrame,
+        league_averages: pd.DataFrame,
+        player_type: str = "타자",
+        language: str = "한국어"
+    ) -> str:
+        """선수 분석 보고서 요청에 보낼 완성된 프롬프트를 만듭니다."""
+        # 데이터 전처리 (긴 커리어는 선수 기록과 리그 평균을 같은 블록으로 압축)
+        plan = self._season_plan(player_data, player_type)
+        player_summary = self._prepare_player_data_summary(player_data, player_type, plan)
+        seasons = player_data['Season'].tolist() if not player_data.empty else []
+        league_summary = self._prepare_league_averages_summary(league_averages, seasons, player_type, plan)
+
+        # 프롬프트 선택
+        if player_type == "타자":
+            prompt = self.batter_analysis_prompt
+        else:
+            prompt = self.pitcher_analysis_prompt
+
+        return prompt.format(
+            player_name=player_name,
+            player_data=player_summary,
+            league_averages=league_summary,
+            language=language
+        )
+
+    def get_cached_report(self, formatted_prompt: str, data_version: Optional[str] = None) -> Optional[str]:
+        """같은 프롬프트/모델/온도/데이터 버전으로 이미 생성된 보고서를 반환합니다. (없으면 None)"""
+        if self.report_cache is None:
+            return None
+        return self.report_cache.get(report_cache_key(formatted_prompt, data_version))
+
+    def generate_report(self, formatted_prompt: str, data_version: Optional[str]) -> Optional[str]:
+        """캐시에 없으면 모델을 호출하여 보고서를 생성하고 캐시에 저장합니다. 응답이 비어 있으면 None을 반환합니다."""
+        cached = self.get_cached_report(formatted_prompt, data_version)
+        if cached is not None:
+            return cached
+
+        response = self.llm.invoke([HumanMessage(content=formatted_prompt)])
+        if response is None or not hasattr(response, 'content') or not response.content:
+            return None
+
+        if self.report_cache is not None:
+            self.report_cache.set(report_cache_key(formatted_prompt, data_version), response.content)
+        return response.content
+
+    @staticmethod
+    def _chunk_text(chunk) -> str:
+        """스트리밍 청크의 텍스트 (content가 파트 목록인 경우 텍스트 파트만 이어 붙임)"""
+        content = getattr(chunk, 'content', chunk)
+        if isinstance(content, list):
+            return ''.join(part if isinstance(part, str) else part.get('text', '') for part in content)
+        return content or ''
+
+    def stream_report(self, formatted_prompt: str, data_version: Optional[str] = None) -> Iterator[str]:
+        """
+        보고서를 모델이 생성하는 대로 청크 단위로 반환합니다. (st.write_stream에 바로 전달 가능)
+        캐시에 있으면 저장된 보고서를 한 번에 반환하고, 스트림이 끝까지 완료되면 전체 보고서를 캐시에 저장합니다.
+        """
+        cached = self.get_cached_report(formatted_prompt, data_version)
+        if cached is not None:
+            yield cached
+            return
+
+        chunks = []
+        for chunk in self.llm.stream([HumanMessage(content=formatted_prompt)]):
+            text = self._chunk_text(chunk)
+            if text:
+                chunks.append(text)
+                yield text
+
+        report = ''.join(chunks)
+        if report and self.report_cache is not None:
+            self.report_cache.set(report_cache_key(formatted_prompt, data_version), report)
+
     def generate_player_analysis(
         self, 
         player_name: str,
         player_data: pd.DataFrame,
         league_averages: pd.DataFrame,
         player_type: str = "타자",
-        language: str = "한국어"
+        language: str = "한국어",
+        data_version: Optional[str] = None
     ) -> str:
         """
         선수 분석 보고서 생성
@@ -237,42 +460,25 @@ class PlayerAnalysisAI:
             league_averages: 리그 평균 데이터
             player_type: "타자" 또는 "투수"
             language: 분석 언어 ("한국어", "영어", "일본어")
+            data_version: 데이터 버전 (보고서 캐시 키에 포함, 데이터가 바뀌면 새로 생성)
         
         Returns:
             AI가 생성한 분석 보고서 (마크다운 형식)
         """
         try:
-            # 데이터 전처리
-            player_summary = self._prepare_player_data_summary(player_data, player_type)
-            seasons = player_data['Season'].tolist() if not player_data.empty else []
-            league_summary = self._prepare_league_averages_summary(league_averages, seasons, player_type)
-            
-            # 프롬프트 선택
-            if player_type == "타자":
-                prompt = self.batter_analysis_prompt
-            else:
-                prompt = self.pitcher_analysis_prompt
-            
-            # AI 분석 요청
-            formatted_prompt = prompt.format(
-                player_name=player_name,
-                player_data=player_summary,
-                league_averages=league_summary,
-                language=language
-            )
-            
-            response = self.llm.invoke([HumanMessage(content=formatted_prompt)])
+            formatted_prompt = self.build_player_prompt(player_name, player_data, league_averages, player_type, language)
 
-            if response is None or not hasattr(response, 'content') or not response.content:
+            # AI 분석 요청 (같은 요청의 보고서가 캐시에 있으면 그대로 반환)
+            report = self.generate_report(formatted_prompt, data_version)
+            if report is None:
                 return "AI 응답을 받지 못했습니다. 다시 시도해주세요."
-
-            return response.content
+            return report
 
         except Exception as e:
             logger.error(f"AI 분석 생성 중 오류 발생: {e}")
             return f"분석 보고서 생성 중 오류가 발생했습니다: {str(e)}"
     
-    def generate_comparison_analysis(
+    def build_comparison_prompt(
         self,
         player1_name: str,
         player1_data: pd.DataFrame,
@@ -282,30 +488,15 @@ class PlayerAnalysisAI:
         player_type: str = "타자",
         language: str = "한국어"
     ) -> str:
-        """
-        두 선수 비교 분석 보고서 생성
-        
-        Args:
-            player1_name: 첫 번째 선수명
-            player1_data: 첫 번째 선수 데이터
-            player2_name: 두 번째 선수명
-            player2_data: 두 번째 선수 데이터
-            league_averages: 리그 평균 데이터
-            player_type: "타자" 또는 "투수"
-            language: 분석 언어
-        
-        Returns:
-            AI가 생성한 비교 분석 보고서
-        """
-        try:
-            comparison_prompt = f"""
+        """두 선수 비교 분석 보고서 요청에 보낼 완성된 프롬프트를 만듭니다."""
+        return f"""
 당신은 MLB 데이터 분석 전문가입니다. 두 {player_type}의 기록을 비교 분석하여 종합적인 보고서를 작성해주세요.
 
 첫 번째 선수: {player1_name}
-{self._prepare_player_data_summary(player1_data, player_type)}
+{self._prepare_player_data_summary(player1_data, player_type, self._season_plan(player1_data, player_type))}
 
 두 번째 선수: {player2_name}
-{self._prepare_player_data_summary(player2_data, player_type)}
+{self._prepare_player_data_summary(player2_data, player_type, self._season_plan(player2_data, player_type))}
 
 리그 평균 참고 데이터:
 {self._prepare_league_averages_summary(league_averages, list(set(player1_data['Season'].tolist() + player2_data['Season'].tolist())), player_type)}
@@ -320,18 +511,56 @@ class PlayerAnalysisAI:
 
 마크다운 형식으로 작성해주세요.
 """
-            
-            response = self.llm.invoke([HumanMessage(content=comparison_prompt)])
 
-            if response is None or not hasattr(response, 'content') or not response.content:
+    def generate_comparison_analysis(
+        self,
+        player1_name: str,
+        player1_data: pd.DataFrame,
+        player2_name: str,
+        player2_data: pd.DataFrame,
+        league_averages: pd.DataFrame,
+        player_type: str = "타자",
+        language: str = "한국어",
+        data_version: Optional[str] = None
+    ) -> str:
+        """
+        두 선수 비교 분석 보고서 생성
+        
+        Args:
+            player1_name: 첫 번째 선수명
+            player1_data: 첫 번째 선수 데이터
+            player2_name: 두 번째 선수명
+            player2_data: 두 번째 선수 데이터
+            league_averages: 리그 평균 데이터
+            player_type: "타자" 또는 "투수"
+            language: 분석 언어
+            data_version: 데이터 버전 (보고서 캐시 키에 포함)
+        
+        Returns:
+            AI가 생성한 비교 분석 보고서
+        """
+        try:
+            comparison_prompt = self.build_comparison_prompt(
+                player1_name, player1_data, player2_name, player2_data, league_averages, player_type, language
+            )
+            report = self.generate_report(comparison_prompt, data_version)
+            if report is None:
                 return "AI 응답을 받지 못했습니다. 다시 시도해주세요."
-
-            return response.content
+            return report
 
         except Exception as e:
             logger.error(f"비교 분석 생성 중 오류 발생: {e}")
             return f"비교 분석 보고서 생성 중 오류가 발생했습니다: {str(e)}"
 
+@st.cache_resource(show_spinner=False)
+def get_player_analysis_ai() -> PlayerAnalysisAI:
+    """
+    프로세스 전체에서 공유하는 PlayerAnalysisAI를 반환합니다. 첫 사용 시에 한 번만 생성되며
+    (생성 실패는 캐시되지 않음), 같은 모델 클라이언트의 연결을 이후 요청에서도 재사용합니다.
+    """
+    return PlayerAnalysisAI()
+
+
 def is_ai_analysis_available() -> bool:
     """AI 분석 기능 사용 가능 여부 확인"""
     return LANGCHAIN_AVAILABLE and bool(os.getenv("GOOGLE_AI_API_KEY"))
@@ -0,0 +1,154 @@
+"""
+리그 공유(pooled) 예측 모델 모듈
+지표마다 리그 전체 선수의 경력 연차별 평균 곡선을 한 번에 학습하고,
+선수별 효과는 기록이 적을수록 0(리그 곡선) 쪽으로 축소(shrinkage)하여
+저장된 계수만으로 어떤 선수든 즉시 예측할 수 있도록 지원
+"""
+
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from aging_curves import aging_delta
+from config import FORECAST_MAX_PERIODS, FORECAST_INTERVAL_WIDTH, POOLED_MAX_CAREER_YEARS, POOLED_RECENCY_DECAY
+
+
+def group_sum(codes, values, n_groups):
+    """그룹 코드별로 (행, 지표) 행렬의 열 합계를 계산합니다."""
+    return np.column_stack([
+        np.bincount(codes, weights=values[:, j], minlength=n_groups)
+        for j in range(values.shape[1])
+    ])
+
+
+def fit_pooled_model(df, metrics, max_career_years=POOLED_MAX_CAREER_YEARS, recency_decay=POOLED_RECENCY_DECAY,
+                     aging=None):
+    """
+    리그 공유 모델을 벡터 연산으로 학습합니다.
+
+    1. 경력 연차(첫 기록 시즌부터의 연수)별 리그 평균으로 공유 곡선을 만듭니다.
+    2. 곡선 대비 잔차의 선수 내/선수 간 분산을 적률법으로 추정하여 축소 상수 k를 구합니다.
+    3. 선수 효과 = 최근 시즌 가중 잔차 합 / (가중치 합 + k) 로, 시즌이 적을수록 리그 곡선에 가깝습니다.
+
+    Args:
+        df: 선수 시즌 기록 데이터 (PlayerID, Season, 지표 컬럼)
+        metrics: 학습할 지표 리스트
+        max_career_years: 경력 연차 상한 (이후 연차는 마지막 연차 곡선 사용)
+        recency_decay: 최근 시즌 기준 연간 가중치 감소 비율
+        aging: 에이징 커브 (주면 예측 시 이후 시즌의 변화를 평균 곡선 대신 시즌 쌍 차이 곡선으로 계산)
+
+    Returns:
+        계수 딕셔너리 (curve, effect, post_var, sigma_e2, 선수별 마지막 시즌/연차 등)
+    """
+    data = df[['PlayerID', 'Season'] + list(metrics)].sort_values(['PlayerID', 'Season'])
+    codes, player_ids = pd.factorize(data['PlayerID'])
+    n_players = len(player_ids)
+
+    values = data[metrics].to_numpy(dtype=float)
+    seasons = data['Season'].to_numpy()
+    first_season = data.groupby('PlayerID', sort=False)['Season'].transform('min').to_numpy()
+    career = np.minimum(seasons - first_season, max_career_years - 1)
+
+    # 경력 연차별 리그 평균 곡선 (인접 연차와 표본 수 가중 3년 이동 평균, 표본이 없으면 직전 연차 값 사용)
+    kernel = np.ones(3)
+    sums = group_sum(career, values, max_career_years)
+    counts = np.convolve(np.bincount(career, minlength=max_career_years), kernel, mode='same')
+    smoothed = np.column_stack([np.convolve(sums[:, j], kernel, mode='same') for j in range(sums.shape[1])])
+    curve = np.where(counts[:, None] > 0, smoothed / np.maximum(counts, 1)[:, None], np.nan)
+    curve = pd.DataFrame(curve).ffill().to_numpy()
+
+    residual = values - curve[career]
+    n_seasons = np.bincount(codes, minlength=n_players)
+    player_mean = group_sum(codes, residual, n_players) / n_seasons[:, None]
+
+    # 적률법: 선수 내 잔차 분산(sigma_e2)과 선수 효과 분산(sigma_u2)
+    within_ss = ((residual - player_mean[codes]) ** 2).sum(axis=0)
+    sigma_e2 = within_ss / max(len(values) - n_players, 1)
+    sigma_u2 = np.maximum(player_mean.var(axis=0) - (sigma_e2[None, :] / n_seasons[:, None]).mean(axis=0), 1e-12)
+    shrink_k = sigma_e2 / sigma_u2
+
+    last_season = data.groupby('PlayerID', sort=False)['Season'].max().to_numpy()
+    weights = recency_decay ** (last_season[codes] - seasons)
+    weight_sum = np.bincount(codes, weights=weights, minlength=n_players)[:, None]
+    effect = group_sum(codes, weights[:, None] * residual, n_players) / (weight_sum + shrink_k)
+    post_var = sigma_e2 / (weight_sum + shrink_k)
+
+    return {
+        'metrics': list(metrics),
+        'player_ids': player_ids.to_numpy(),
+        'index': {int(pid): i for i, pid in enumerate(player_ids)},
+        'curve': curve,
+        'effect': effect,
+        'post_var': post_var,
+        'sigma_e2': sigma_e2,
+        'shrink_k': shrink_k,
+        'last_season': last_season,
+        'last_career': career[np.r_[np.flatnonzero(codes[1:] != codes[:-1]), len(codes) - 1]],
+        'n_seasons': n_seasons,
+        'aging': aging,
+    }
+
+
+def _evaluate(model, rows, metric_idx, periods, interval_width):
+    """선수 행 인덱스 배열에 대해 (yhat, lower, upper) 배열을 계산합니다. (선수, 지표, 기간) 형태"""
+    steps = np.arange(1, periods + 1)
+    last_career = model['last_career'][rows]
+    curve = model['curve'][:, metric_idx]
+    effect = model['effect'][rows][:, metric_idx][:, :, None]
+    if model.get('aging') is not None:
+        # 선수의 현재 수준(마지막 연차 곡선 + 선수 효과)에서 시즌 쌍 차이 곡선만큼 변화
+        metrics = [model['metrics'][j] for j in metric_idx]
+        yhat = curve[last_career][:, :, None] + effect + aging_delta(model['aging'], metrics, last_career, steps)
+    else:
+        career = np.minimum(last_career[:, None] + steps[None, :], len(model['curve']) - 1)
+        yhat = curve[career].transpose(0, 2, 1) + effect
+
+    sigma = np.sqrt(model['sigma_e2'][metric_idx][None, :] + model['post_var'][rows][:, metric_idx])
+    half_width = NormalDist().inv_cdf((1 + interval_width) / 2) * sigma[:, :, None]
+    return yhat, np.maximum(yhat - half_width, 0), yhat + half_width
+
+
+def pooled_forecast(model, player_id, metric, periods=5, interval_width=FORECAST_INTERVAL_WIDTH):
+    """
+    저장된 계수로 한 선수/지표의 예측을 계산합니다. 학습 데이터에 없는 선수면 None을 반환합니다.
+
+    Returns:
+        ds, yhat, yhat_lower, yhat_upper 컬럼의 데이터프레임
+    """
+    row = model['index'].get(int(player_id))
+    if row is None or metric not in model['metrics']:
+        return None
+
+    metric_idx = [model['metrics'].index(metric)]
+    yhat, lower, upper = _evaluate(model, np.array([row]), metric_idx, periods, interval_width)
+    years = model['last_season'][row] + np.arange(periods)
+    return pd.DataFrame({
+        'ds': pd.to_datetime([f"{year}-12-31" for year in years]),
+        'yhat': yhat[0, 0],
+        'yhat_lower': lower[0, 0],
+        'yhat_upper': upper[0, 0],
+    })
+
+
+def pooled_project(model, periods=FORECAST_MAX_PERIODS, interval_width=FORECAST_INTERVAL_WIDTH):
+    """
+    모든 선수/지표의 예측을 한 번에 계산합니다. (marcel_project와 같은 형식)
+
+    Returns:
+        PlayerID, metric, step, ds, yhat, yhat_lower, yhat_upper 컬럼의 데이터프레임
+    """
+    n_players, n_metrics = len(model['player_ids']), len(model['metrics'])
+    yhat, lower, upper = _evaluate(model, np.arange(n_players), np.arange(n_metrics), periods, interval_width)
+
+    steps = np.arange(1, periods + 1)
+    ds_years = np.repeat((model['last_season'][:, None] + steps[None, :] - 1)[:, None, :], n_metrics, axis=1)
+    return pd.DataFrame({
+        'PlayerID': np.repeat(model['player_ids'], n_metrics * periods),
+        'metric': np.tile(np.repeat(model['metrics'], periods), n_players),
+        'step': np.tile(steps, n_players * n_metrics),
+        'ds': pd.to_datetime(pd.Series(ds_years.ravel()).astype(str) + '-12-31').to_numpy(),
+        'yhat': yhat.ravel(),
+        'yhat_lower': lower.ravel(),
+        'yhat_upper': upper.ravel(),
+    })
@@ -1,52 +1,412 @@
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import streamlit as st
+from streamlit import runtime
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import pandas as pd
 import plotly.graph_objects as go
 import numpy as np
+from statistics import NormalDist
 from prophet import Prophet
-from utils import load_data, load_pitcher_data, get_plotly_config, display_player_image
+from utils import load_data, load_pitcher_data, get_plotly_config, display_player_image, get_data_version, calculate_league_averages, get_aging_curves, get_player_name_index, show_table
 from streamlit_option_menu import option_menu
 from i18n import get_text, get_metric_names_dict
-from config import PREDICT_BATTER_METRICS, PREDICT_PITCHER_METRICS
+from config import (
+    PREDICT_BATTER_METRICS, PREDICT_PITCHER_METRICS, CACHE_TTL_SECONDS, FORECAST_MAX_PERIODS, FORECAST_MIN_SEASONS,
+    FORECAST_INTERVAL_WIDTH, DEFAULT_FORECAST_ENGINE, FORECAST_MODES, DEFAULT_FORECAST_MODE, PROPHET_UNCERTAINTY_SAMPLES,
+    FORECAST_CACHE_PATH, FORECAST_CACHE_MAX_BYTES, FORECAST_REQUEST_CONCURRENCY,
+    FORECAST_POOL_WORKERS, FORECAST_POOL_MAX_QUEUE, FORECAST_POOL_TIMEOUT_SECONDS,
+    MARCEL_WEIGHTS, MARCEL_REGRESSION_WEIGHT, MARCEL_DECAY, SIM_DEFAULT_RUNS, SIM_SEED, SIM_PERCENTILES,
+)
+from forecast_batch import load_forecast, engine_key, series_fingerprint
+from disk_cache import DiskCache, make_cache_key
+from pooled_model import group_sum, fit_pooled_model, pooled_forecast
+from forecast_pool import ForecastPool, ForecastPoolError
+from aging_curves import aging_delta
+from season_simulator import PROJECTORS, BATTER_SIM_STATS, PITCHER_SIM_STATS, simulate_player, summarize_draws
+
+
+def _add_analytic_intervals(forecast, df_metric, interval_width=FORECAST_INTERVAL_WIDTH):
+    """
+    불확실성 샘플링 없이 학습한 예측에 해석적 예측 구간을 추가합니다.
+    학습 구간 잔차의 표준편차와 선형 추세 외삽의 예측 구간 공식
+    (se = sigma * sqrt(1 + 1/n + (t - t_mean)^2 / Sxx))을 사용합니다.
+    """
+    fitted = df_metric.merge(forecast[['ds', 'yhat']], on='ds')
+    residual = (fitted['y'] - fitted['yhat']).to_numpy()
+    n = len(residual)
+    sigma = np.sqrt((residual ** 2).sum() / max(n - 2, 1))
+
+    origin = df_metric['ds'].min()
+    t_hist = ((fitted['ds'] - origin).dt.days / 365.25).to_numpy()
+    t = ((forecast['ds'] - origin).dt.days / 365.25).to_numpy()
+    sxx = max(((t_hist - t_hist.mean()) ** 2).sum(), 1e-9)
+    se = sigma * np.sqrt(1 + 1 / n + (t - t_hist.mean()) ** 2 / sxx)
+
+    half_width = NormalDist().inv_cdf((1 + interval_width) / 2) * se
+    return forecast.assign(yhat_lower=forecast['yhat'] - half_width, yhat_upper=forecast['yhat'] + half_width)
+
+
+def fit_prophet_forecast(df_metric, periods=5, mode=DEFAULT_FORECAST_MODE):
+    """
+    Prophet 모델을 학습하고 예측을 수행합니다. (캐싱 없이 계산만 수행)
+
+    Args:
+        df_metric: 'ds', 'y' 컬럼의 시계열 데이터
+        periods: 예측 기간 (년)
+        mode: 'accurate'는 불확실성 샘플링으로 구간 계산, 'fast'는 MAP 학습 후 해석적 구간 계산
+    """
+    fast = mode == 'fast'
+    model = Prophet(
+        yearly_seasonality=False,
+        weekly_seasonality=False,
+        daily_seasonality=False,
+        interval_width=FORECAST_INTERVAL_WIDTH,
+        uncertainty_samples=0 if fast else PROPHET_UNCERTAINTY_SAMPLES
+    )
+    model.fit(df_metric)
+
+    future = model.make_future_dataframe(periods=periods, freq='Y')
+    forecast = model.predict(future)
+    if fast:
+        forecast = _add_analytic_intervals(forecast, df_metric)
+    return forecast
+
+
+@st.cache_resource(show_spinner=False)
+def get_forecast_cache():
+    """프로세스 전체에서 공유하는 예측 결과 디스크 캐시를 반환합니다."""
+    return DiskCache(FORECAST_CACHE_PATH, FORECAST_CACHE_MAX_BYTES)
 
 
-@st.cache_data(ttl=3600)
-def get_prophet_forecast(data, metric, periods=5):
+def _load_player_type_data(player_type):
+    """선수 유형에 해당하는 캐시된 기록 데이터와 예측 지표 목록을 반환합니다."""
+    if player_type == 'batter':
+        return load_data(), list(PREDICT_BATTER_METRICS.keys())
+    return load_pitcher_data(), list(PREDICT_PITCHER_METRICS.keys())
+
+
+@st.cache_resource(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def get_series_fingerprints(player_type, data_version):
+    """
+    데이터 버전별로 모든 (PlayerID, 지표) 시계열의 지문을 한 번만 계산합니다.
+    (읽기 전용으로 공유되므로 반환값을 수정하지 마세요.)
+    """
+    df, metrics = _load_player_type_data(player_type)
+    data = df[['PlayerID', 'Season'] + metrics].sort_values(['PlayerID', 'Season'])
+    fingerprints = {}
+    for player_id, group in data.groupby('PlayerID', sort=False):
+        seasons = group['Season'].to_numpy()
+        for metric in metrics:
+            fingerprints[(int(player_id), metric)] = series_fingerprint(seasons, group[metric].to_numpy())
+    return fingerprints
+
+
+def load_player_series(player_type, player_id, metric):
+    """한 선수/지표의 (ds, y) 시계열을 만듭니다. 캐시 실패 시에만 호출됩니다."""
+    df, _ = _load_player_type_data(player_type)
+    series = df.loc[df['PlayerID'] == player_id, ['Season', metric]].sort_values('Season')
+    return pd.DataFrame({
+        'ds': pd.to_datetime(series['Season'].astype(str), format='%Y'),
+        'y': series[metric].to_numpy(),
+    })
+
+
+def _is_session_active(session_id):
+    return runtime.exists() and runtime.get_instance().is_active_session(session_id)
+
+
+def _current_session_id():
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx is not None else None
+
+
+@st.cache_resource(show_spinner=False)
+def get_forecast_pool():
+    """서버 프로세스 전체에서 공유하는 Prophet 워커 풀을 반환합니다. (워커는 Prophet을 미리 로드한 상태로 유지)"""
+    return ForecastPool(FORECAST_POOL_WORKERS, FORECAST_POOL_MAX_QUEUE, session_probe=_is_session_active)
+
+
+def _store_forecast(cache, key, future):
+    """워커 풀의 결과를 디스크 캐시에 저장합니다. 제한 시간을 넘겨 도착한 결과도 다음 요청에서 재사용됩니다."""
+    if not future.cancelled() and future.exception() is None:
+        cache.set(key, future.result())
+
+
+def get_prophet_forecast(player_type, player_id, metric, periods=5, series_hash=None, mode=DEFAULT_FORECAST_MODE):
     """
     Prophet 모델을 학습하고 예측을 수행합니다.
-    Streamlit 캐싱을 통해 반복 학습을 방지합니다.
+    (엔진, 모드, 선수, 지표, 기간, 시계열 지문) 키의 디스크 캐시를 통해 재시작 후에도 반복 학습을 방지하며,
+    시계열 데이터는 캐시에 없을 때만 불러와 워커 풀에서 학습합니다.
+    워커 풀이 가득 찼거나 제한 시간을 넘기거나 워커가 비정상 종료되면 ForecastPoolError를 그대로 전달합니다.
+
+    Args:
+        player_type: 'batter' 또는 'pitcher'
+        player_id: 선수 ID
+        metric: 예측할 지표
+        periods: 예측 기간 (년)
+        series_hash: 데이터 버전별로 미리 계산한 시계열 지문 (없으면 조회)
+        mode: 예측 모드 ('accurate' 또는 'fast')
     """
     try:
-        df_metric = data[['Season', metric]].copy()
-        df_metric.columns = ['ds', 'y']
+        if series_hash is None:
+            fingerprints = get_series_fingerprints(player_type, get_data_version(player_type))
+            series_hash = fingerprints[(int(player_id), metric)]
+
+        cache = get_forecast_cache()
+        key = make_cache_key('prophet', mode, int(player_id), metric, periods, series_hash)
+        forecast = cache.get(key)
+        if forecast is None:
+            df_metric = load_player_series(player_type, player_id, metric)
+            pool = get_forecast_pool()
+            future = pool.submit(_current_session_id(), df_metric['ds'].dt.year.to_numpy(), df_metric['y'].to_numpy(),
+                                 periods, mode)
+            future.add_done_callback(lambda f: _store_forecast(cache, key, f))
+            forecast = pool.result(future, timeout=FORECAST_POOL_TIMEOUT_SECONDS)
+        return forecast
+    except ForecastPoolError:
+        raise
+    except Exception:
+        return None
 
-        model = Prophet(
-            yearly_seasonality=False,
-            weekly_seasonality=False,
-            daily_seasonality=False
-        )
-        model.fit(df_metric)
 
-        future = model.make_future_dataframe(periods=periods, freq='Y')
-        forecast = model.predict(future)
-        return forecast
-    except Exception as e:
+def marcel_project(df, metrics, periods=FORECAST_MAX_PERIODS, league_avg=None,
+                   weights=MARCEL_WEIGHTS, regression=MARCEL_REGRESSION_WEIGHT,
+                   decay=MARCEL_DECAY, interval_width=FORECAST_INTERVAL_WIDTH, aging=None):
+    """
+    Marcel 방식으로 모든 선수/지표의 예측을 한 번에 계산합니다.
+
+    최근 시즌에 가중치(기본 5/4/3)를 두어 평균을 내고, 같은 시즌들의 리그 평균 쪽으로
+    회귀시킵니다. 이후 시즌은 리그 평균 쪽으로 decay만큼 더 수렴하며,
+    구간은 선수 내 변동과 리그 전체의 시즌 잡음 분산을 더한 표준편차로 계산합니다.
+
+    Args:
+        df: 선수 시즌 기록 데이터 (PlayerID, Season, 지표 컬럼)
+        metrics: 예측할 지표 리스트
+        periods: 예측 기간 (년)
+        league_avg: 시즌별 리그 평균 (없으면 df로 계산)
+        weights: 최근 시즌부터의 가중치
+        regression: 리그 평균으로의 회귀 가중치 (시즌 가중치 단위)
+        decay: 두 번째 해부터 적용되는 연간 수렴 비율
+        interval_width: 예측 구간 폭 (Prophet 기본값과 동일한 0.8)
+        aging: 에이징 커브 (compute_aging_curves 결과, 주면 경력 연차에 따른 평균 변화량을 더함)
+
+    Returns:
+        PlayerID, metric, step, ds, yhat, yhat_lower, yhat_upper 컬럼의 데이터프레임
+    """
+    if league_avg is None:
+        league_avg = calculate_league_averages(df, metrics)
+
+    data = df[['PlayerID', 'Season'] + metrics].sort_values(['PlayerID', 'Season'])
+    codes, player_ids = pd.factorize(data['PlayerID'])
+    n_players, n_metrics = len(player_ids), len(metrics)
+
+    values = data[metrics].to_numpy(dtype=float)
+    seasons = data['Season'].to_numpy()
+    league_values = league_avg.set_index('Season')[metrics].reindex(seasons).to_numpy(dtype=float)
+    recency = data.groupby('PlayerID', sort=False).cumcount(ascending=False).to_numpy()
+
+    weight_table = np.asarray(weights, dtype=float)
+    row_weights = np.where(recency < len(weight_table), weight_table[np.minimum(recency, len(weight_table) - 1)], 0.0)
+    weight_sum = np.bincount(codes, weights=row_weights, minlength=n_players)[:, None]
+
+    weighted_mean = group_sum(codes, row_weights[:, None] * values, n_players) / weight_sum
+    league_ref = group_sum(codes, row_weights[:, None] * league_values, n_players) / weight_sum
+    projection = (weight_sum * weighted_mean + regression * league_ref) / (weight_sum + regression)
+
+    # 선수 내 변동 + 한 시즌의 잡음 분산(리그 전체 시즌 간 차분 분산의 절반)
+    player_var = group_sum(codes, row_weights[:, None] * (values - weighted_mean[codes]) ** 2, n_players) / weight_sum
+    same_player = codes[1:] == codes[:-1]
+    season_noise_var = np.nanvar(np.diff(values, axis=0)[same_player], axis=0) / 2
+    sigma = np.sqrt(player_var + season_noise_var)
+
+    steps = np.arange(1, periods + 1)
+    shrink = decay ** (steps - 1)
+    yhat = league_ref[:, :, None] + (projection - league_ref)[:, :, None] * shrink
+    if aging is not None:
+        last_career = seasons[recency == 0] - data.groupby('PlayerID', sort=False)['Season'].min().to_numpy()
+        yhat = yhat + aging_delta(aging, metrics, last_career, steps)
+    half_width = NormalDist().inv_cdf((1 + interval_width) / 2) * sigma[:, :, None] * np.sqrt(steps)
+
+    last_season = seasons[recency == 0]
+    ds_years = last_season[:, None] + steps[None, :] - 1
+    ds = pd.to_datetime(pd.Series(np.repeat(ds_years[:, None, :], n_metrics, axis=1).ravel()).astype(str) + '-12-31')
+
+    return pd.DataFrame({
+        'PlayerID': np.repeat(player_ids.to_numpy(), n_metrics * periods),
+        'metric': np.tile(np.repeat(metrics, periods), n_players),
+        'step': np.tile(steps, n_players * n_metrics),
+        'ds': ds.to_numpy(),
+        'yhat': yhat.ravel(),
+        'yhat_lower': np.maximum(yhat - half_width, 0).ravel(),
+        'yhat_upper': (yhat + half_width).ravel(),
+    })
+
+
+@st.cache_resource(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def get_marcel_projections(player_type, data_version):
+    """
+    선수 유형 전체의 Marcel 예측을 데이터 버전별로 한 번만 계산합니다.
+    (읽기 전용으로 공유되므로 반환값을 수정하지 마세요.)
+    """
+    df, metrics = _load_player_type_data(player_type)
+    aging = get_aging_curves(player_type, data_version)
+    return marcel_project(df, metrics, aging=aging).set_index(['PlayerID', 'metric']).sort_index()
+
+
+def get_marcel_forecast(player_type, player_id, metric, periods=5):
+    """전체 Marcel 예측에서 한 선수/지표의 예측 결과를 조회합니다."""
+    projections = get_marcel_projections(player_type, get_data_version(player_type))
+    try:
+        forecast = projections.loc[(player_id, metric)]
+    except KeyError:
         return None
+    return forecast[forecast['step'] <= periods].reset_index(drop=True)
+
+
+@st.cache_resource(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def get_pooled_model(player_type, data_version):
+    """
+    선수 유형의 리그 공유 모델을 데이터 버전별로 한 번만 학습합니다.
+    (읽기 전용으로 공유되므로 반환값을 수정하지 마세요.)
+    """
+    df, metrics = _load_player_type_data(player_type)
+    return fit_pooled_model(df, metrics, aging=get_aging_curves(player_type, data_version))
+
+
+def get_pooled_forecast(player_type, player_id, metric, periods=5):
+    """리그 공유 모델의 저장된 계수로 한 선수/지표를 예측합니다."""
+    model = get_pooled_model(player_type, get_data_version(player_type))
+    return pooled_forecast(model, player_id, metric, periods)
+
+
+@st.cache_resource(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def get_simulation_rates(player_type, data_version):
+    """
+    선수 유형 전체의 다음 시즌 PA/BF와 결과 비율을 데이터 버전별로 한 번만 추정합니다.
+    (읽기 전용으로 공유되므로 반환값을 수정하지 마세요.)
+    """
+    df, _ = _load_player_type_data(player_type)
+    return PROJECTORS[player_type](df)
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def get_season_simulation(player_type, player_id, n_sims, seed, data_version):
+    """한 선수의 다음 시즌을 n_sims번 시뮬레이션한 지표별 결과 배열을 반환합니다."""
+    rates = get_simulation_rates(player_type, data_version)
+    return simulate_player(rates, player_id, player_type, n_sims=n_sims, seed=seed)
+
+
+def _prophet_engine(player_type, player_id, metric, periods, mode):
+    return get_prophet_forecast(player_type, player_id, metric, periods=periods, mode=mode)
+
+
+def _marcel_engine(player_type, player_id, metric, periods, mode):
+    return get_marcel_forecast(player_type, player_id, metric, periods)
+
+
+def _pooled_engine(player_type, player_id, metric, periods, mode):
+    return get_pooled_forecast(player_type, player_id, metric, periods)
+
+
+# 예측 엔진 레지스트리: 이름 -> (표시명, 실시간 예측 함수)
+FORECAST_ENGINES = {
+    'prophet': ('Prophet', _prophet_engine),
+    'marcel': ('Marcel (NumPy)', _marcel_engine),
+    'pooled': ('리그 공유 모델', _pooled_engine),
+}
+
+# 예측 모드(fast/accurate)를 지원하는 엔진
+MODE_ENGINES = ['prophet']
+
+# 실시간 학습을 워커 풀에서 수행하는 엔진
+POOL_ENGINES = ['prophet']
+
+# 시즌 수가 FORECAST_MIN_SEASONS 미만인 선수도 예측할 수 있는 엔진 (리그 곡선을 사전 분포로 사용)
+SHORT_CAREER_ENGINES = ['pooled']
 
 
-def create_prediction_plot(player_data, forecast, metric, player_name, lang="ko"):
+def run_forecast(engine, player_type, player_id, metric, periods=5, mode=DEFAULT_FORECAST_MODE):
+    """
+    선택한 엔진으로 예측을 수행합니다.
+    사전 계산된 예측 테이블을 먼저 조회하고, 없을 때만 엔진을 실행합니다.
+    """
+    forecast = load_forecast(player_type, player_id, metric, get_data_version(player_type), periods,
+                             engine=engine_key(engine, mode))
+    if forecast is None:
+        _, engine_fn = FORECAST_ENGINES[engine]
+        forecast = engine_fn(player_type, player_id, metric, periods, mode)
+    return forecast
+
+
+def forecast_metrics_concurrently(engine, player_type, player_id, metrics, periods=5,
+                                  mode=DEFAULT_FORECAST_MODE, max_workers=FORECAST_REQUEST_CONCURRENCY, on_wait=None):
+    """
+    여러 지표의 예측을 스레드 풀에서 동시에 수행하고, 끝나는 순서대로 (지표, 예측 결과, 안내 문구)를 반환합니다.
+    요청 하나가 사용하는 워커 수는 max_workers로 제한하며, Prophet 워커 풀이 혼잡하거나
+    제한 시간을 넘기거나 워커가 비정상 종료되면 Marcel 예측으로 대체합니다.
+
+    Args:
+        on_wait: 결과를 기다리는 동안 주기적으로 호출되는 함수 (이 세션의 워커 풀 대기 순번을 인자로 받음)
+    """
+    if not metrics:
+        return
+
+    ctx = get_script_run_ctx()
+    session_id = ctx.session_id if ctx is not None else None
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(metrics)),
+                                  initializer=add_script_run_ctx, initargs=(None, ctx))
+    futures = {
+        executor.submit(run_forecast, engine, player_type, player_id, metric, periods, mode): metric
+        for metric in metrics
+    }
+    pending = set(futures)
+    try:
+        while pending:
+            done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+            if not done:
+                if on_wait is not None and engine in POOL_ENGINES:
+                    on_wait(get_forecast_pool().queue_position(session_id))
+                continue
+
+            for future in done:
+                metric, notice = futures[future], None
+                try:
+                    forecast = future.result()
+                except ForecastPoolError as e:
+                    forecast = run_forecast('marcel', player_type, player_id, metric, periods)
+                    notice = f"{e} Marcel 예측으로 대체합니다."
+                except Exception:
+                    forecast = None
+                yield metric, forecast, notice
+    finally:
+        # 스크립트가 중단(재실행, 세션 종료)되면 이 세션의 시작 전 학습 요청을 취소
+        if pending and engine in POOL_ENGINES:
+            get_forecast_pool().cancel_session(session_id)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def get_future_forecast(forecast, last_season):
+    """예측 결과에서 마지막 실제 시즌 이후 구간만 반환합니다."""
+    return forecast[forecast['ds'] > pd.Timestamp(year=int(last_season), month=1, day=1)]
+
+
+def create_prediction_plot(player_data, forecast, metric, player_name, lang="ko", metric_label=None):
     """
     Plotly를 사용하여 예측 차트를 생성합니다.
 
     Args:
-        player_data: 선수 실제 데이터
-        forecast: Prophet 예측 결과
-        metric: 예측한 지표명
+        player_data: 선수 실제 데이터 (Season, 지표 컬럼)
+        forecast: 예측 결과 (ds, yhat, yhat_lower, yhat_upper)
+        metric: 예측한 지표 컬럼명
         player_name: 선수 이름
         lang: 언어 코드
+        metric_label: 화면에 표시할 지표명 (없으면 컬럼명)
     """
+    metric_label = metric_label or metric
+
     # 실제 데이터와 예측 데이터 분리
-    actual_years = player_data['ds'].dt.year
-    future_forecast = forecast[forecast['ds'] > player_data['ds'].max()]
+    actual_years = player_data['Season']
+    future_forecast = get_future_forecast(forecast, actual_years.max())
     future_years = future_forecast['ds'].dt.year
 
     # Figure 생성
@@ -55,7 +415,7 @@ def create_prediction_plot(player_data, forecast, metric, player_name, lang="ko"
     # 실제 데이터 라인
     fig.add_trace(go.Scatter(
         x=actual_years,
-        y=player_data['y'],
+        y=player_data[metric],
         mode='lines+markers',
         name='실제 기록',
         line=dict(color='#1f77b4', width=3),
@@ -89,13 +449,13 @@ def create_prediction_plot(player_data, forecast, metric, player_name, lang="ko"
     # 레이아웃 업데이트
     fig.update_layout(
         title={
-            'text': f"{player_name}의 {metric} 5년 예측",
+            'text': f"{player_name}의 {metric_label} 5년 예측",
             'x': 0.5,
             'xanchor': 'center',
             'font': {'size': 20}
         },
         xaxis_title="시즌",
-        yaxis_title=metric,
+        yaxis_title=metric_label,
         height=500,
         hovermode='x unified',
         plot_bgcolor='white',
@@ -115,6 +475,98 @@ def create_prediction_plot(player_data, forecast, metric, player_name, lang="ko"
     return fig
 
 
+def render_forecast_result(player, player_data, last_row, forecast, metric, metric_label, lang="ko"):
+    """한 지표의 예측 차트, 요약 통계, 상세 테이블을 표시합니다."""
+    last_season = player_data.at[last_row, 'Season']
+
+    # 예측 차트 생성
+    st.subheader(f"📈 {metric_label} 예측 결과")
+
+    fig = create_prediction_plot(
+        player_data,
+        forecast,
+        metric,
+        player,
+        lang,
+        metric_label=metric_label
+    )
+
+    st.plotly_chart(fig, use_container_width=True, config=get_plotly_config())
+
+    # 예측 결과 테이블
+    future_forecast = get_future_forecast(forecast, last_season)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("**📊 예측 통계**")
+        avg_pred = future_forecast['yhat'].mean()
+        st.metric("평균 예측값", f"{avg_pred:.2f}")
+
+    with col2:
+        trend = "상승 📈" if future_forecast['yhat'].iloc[-1] > player_data.at[last_row, metric] else "하락 📉"
+        st.markdown("**📊 추세**")
+        st.metric("예측 트렌드", trend)
+
+    # 상세 예측 테이블
+    with st.expander("📋 상세 예측 데이터 보기"):
+        result_df = future_forecast[['ds', 'yhat', 'yhat_lower', 'yhat_upper']].copy()
+        result_df.columns = ['시즌', '예측값', '하한값', '상한값']
+        result_df['시즌'] = result_df['시즌'].dt.year
+
+        digits = 3 if metric in ['BattingAverage', 'OnBasePercentage', 'SluggingPercentage', 'OPS', 'Whip', 'EarnedRunAverage'] else 1
+        show_table(result_df, lang, precision={'예측값': digits, '하한값': digits, '상한값': digits})
+
+    st.markdown("---")
+
+
+def render_season_simulation(player, player_type, player_id, last_season, lang="ko"):
+    """다음 시즌 몬테카를로 시뮬레이션 결과(백분위 표와 지표별 분포)를 표시합니다."""
+    stats = BATTER_SIM_STATS if player_type == 'batter' else PITCHER_SIM_STATS
+    stat_names = get_metric_names_dict(stats, lang)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        n_sims = st.slider("시뮬레이션 횟수", 1000, 20000, SIM_DEFAULT_RUNS, step=1000)
+    with col2:
+        seed = st.number_input("난수 시드", min_value=0, value=SIM_SEED, step=1)
+
+    if not st.button("🎲 시뮬레이션 실행", type="primary", use_container_width=True):
+        st.info(f"💡 최근 시즌 기록으로 추정한 타석(상대 타자)당 결과 비율로 {last_season + 1}시즌을 반복 시뮬레이션합니다.")
+        return
+
+    draws = get_season_simulation(player_type, player_id, n_sims, int(seed), get_data_version(player_type))
+    if draws is None:
+        st.warning(f"{player}은(는) {last_season}시즌 기록이 없어 시뮬레이션할 수 없습니다.")
+        return
+
+    summary = summarize_draws(draws)
+    summary['stat'] = summary['stat'].map(stat_names)
+    percentile_columns = {f'p{q}': f'{q}%' for q in SIM_PERCENTILES}
+    summary = summary.rename(columns={'stat': '지표', 'mean': '평균', **percentile_columns})
+
+    st.markdown(f"#### 📋 {last_season + 1}시즌 시뮬레이션 결과 ({n_sims:,}회)")
+    show_table(summary, lang)
+
+    plot_stats = st.multiselect(
+        "분포를 볼 지표", options=stats, format_func=lambda x: stat_names[x], default=stats[:2]
+    )
+    for stat in plot_stats:
+        values = draws[stat]
+        fig = go.Figure(go.Histogram(x=values, nbinsx=40, marker_color='#1f77b4', opacity=0.8, name=stat_names[stat]))
+        for q, value in zip(SIM_PERCENTILES, np.percentile(values, SIM_PERCENTILES)):
+            fig.add_vline(x=value, line_dash='dash', line_color='#ff7f0e', annotation_text=f"{q}%: {value:.3g}")
+        fig.update_layout(
+            title=f"{player} {stat_names[stat]} 분포",
+            xaxis_title=stat_names[stat],
+            yaxis_title="시뮬레이션 수",
+            template='plotly_white',
+            height=350,
+            showlegend=False
+        )
+        st.plotly_chart(fig, use_container_width=True, config=get_plotly_config())
+
+
 def run_predict(lang="ko"):
     """선수별 기록을 입력받아 미래 시즌의 성적을 예측하고 시각화합니다."""
     st.title(get_text('predict_title', lang))
@@ -147,34 +599,35 @@ def run_predict(lang="ko"):
     batter_options = {'ko': '타자', 'en': 'Batters', 'ja': '打者'}
     batter_option = batter_options.get(lang, '타자')
 
+    player_type = 'batter' if selected == batter_option else 'pitcher'
+
     if selected == batter_option:
         df = load_data()
-        player_names = [""] + sorted(df['PlayerName'].unique())
         metrics = get_metric_names_dict(list(PREDICT_BATTER_METRICS.keys()), lang)
     else:
         df = load_pitcher_data()
-        player_names = [""] + sorted(df['PlayerName'].unique())
         metrics = get_metric_names_dict(list(PREDICT_PITCHER_METRICS.keys()), lang)
+    name_index = get_player_name_index(player_type, get_data_version(player_type))
 
     st.header(get_text("player_option", lang))
 
-    # 검색 기능 추가
+    # 검색 기능 추가 (이름 인덱스: 악센트 무시, 부분 일치, 오타 허용 - 일치도 순으로 정렬)
+    # 동명이인을 구분하도록 PlayerID로 선택하고 표시 이름(동명이인은 활동 기간 포함)으로 보여줌
     search_query = st.text_input("🔍 선수 이름 검색", "")
-    if search_query:
-        filtered_names = [""] + [name for name in sorted(df['PlayerName'].unique()) if search_query.lower() in name.lower()]
-        player = st.selectbox(get_text("select_player", lang), filtered_names, index=0)
-    else:
-        player = st.selectbox(get_text("select_player", lang), player_names, index=0)
+    player_options = name_index.search(search_query).tolist() if search_query else name_index.sorted_ids()
+    player_id = st.selectbox(get_text("select_player", lang), [None] + player_options, index=0,
+                             format_func=lambda x: "" if x is None else name_index.label(x))
 
-    player_data = df[df['PlayerName'] == player]
+    player = name_index.name(player_id)
+    player_data = df[df['PlayerID'] == player_id]
 
     if not player_data.empty and len(player_data) > 0:
-        tab1, tab2 = st.tabs([get_text("player_info", lang), get_text("prediction_tab", lang)])
+        tab1, tab2, tab3 = st.tabs([
+            get_text("player_info", lang), get_text("prediction_tab", lang), get_text("simulation_tab", lang)
+        ])
 
         with tab1:
-            st.subheader(f"📊 {player} {get_text('player_info', lang)}")
-
-            player_id = player_data.iloc[0]['PlayerID']
+            st.subheader(f"📊 {name_index.label(player_id)} {get_text('player_info', lang)}")
 
             col1, col2 = st.columns([1, 2])
 
@@ -192,27 +645,22 @@ def run_predict(lang="ko"):
 
             with col2:
                 show_data = player_data.drop(['PlayerID', 'PlayerName'], axis=1).sort_values('Season', ascending=False)
-                st.dataframe(show_data.style.format({
-                    "Season": "{:.0f}",
-                    "BattingAverage": "{:.3f}",
-                    "OnBasePercentage": "{:.3f}",
-                    "SluggingPercentage": "{:.3f}",
-                    "OPS": "{:.3f}",
-                    "EarnedRunAverage": "{:.2f}",
-                    "Wins": "{:.0f}",
-                    "Losses": "{:.0f}",
-                    "Strikeouts": "{:.0f}",
-                    "Whip": "{:.2f}",
-                    "InningsPitched": "{:.1f}"
-                }), height=400, use_container_width=True)
+                show_table(show_data, lang, height=400)
+
+        # 예측 탭은 지표를 선택하지 않으면 중간에 반환하므로 시뮬레이션 탭을 먼저 구성
+        with tab3:
+            st.subheader("🎲 " + get_text("simulation_tab", lang))
+            render_season_simulation(player, player_type, player_id, int(df['Season'].max()), lang)
 
         with tab2:
             st.subheader("🔮 " + get_text("prediction_tab", lang))
 
             # 최소 3시즌 데이터 필요
-            if len(player_data) < 3:
-                st.warning(f"⚠️ {player}의 데이터가 부족합니다. 예측을 위해서는 최소 3시즌 이상의 데이터가 필요합니다.")
-                return
+            # 3시즌 미만 선수는 리그 공유 모델로만 예측
+            short_career = len(player_data) < FORECAST_MIN_SEASONS
+            if short_career:
+                st.info(f"💡 {player}의 기록이 {FORECAST_MIN_SEASONS}시즌 미만이므로 리그 공유 모델(경력 연차 곡선)을 기준으로 예측합니다.")
+            engine_options = SHORT_CAREER_ENGINES if short_career else list(FORECAST_ENGINES.keys())
 
             # 선택 가능한 지표
             selected_metrics = st.multiselect(
@@ -226,83 +674,59 @@ def run_predict(lang="ko"):
                 st.info("💡 예측할 지표를 하나 이상 선택해주세요.")
                 return
 
-            # 예측 기간 선택
+            # 예측 기간 및 엔진 선택
             prediction_years = st.slider("예측 기간 (년)", 1, 10, 5)
+            engine = st.radio(
+                "예측 엔진",
+                options=engine_options,
+                format_func=lambda x: FORECAST_ENGINES[x][0],
+                index=engine_options.index(DEFAULT_FORECAST_ENGINE) if DEFAULT_FORECAST_ENGINE in engine_options else 0,
+                horizontal=True
+            )
+            mode = DEFAULT_FORECAST_MODE
+            if engine in MODE_ENGINES:
+                mode = st.radio(
+                    "예측 모드",
+                    options=list(FORECAST_MODES),
+                    format_func=lambda x: {'accurate': '정확 (불확실성 샘플링)', 'fast': '빠름 (해석적 구간)'}[x],
+                    index=list(FORECAST_MODES).index(DEFAULT_FORECAST_MODE),
+                    horizontal=True
+                )
 
             if st.button("🚀 예측 시작", type="primary", use_container_width=True):
-                player_data_copy = player_data.copy()
-                player_data_copy['Season'] = pd.to_datetime(player_data_copy['Season'], format='%Y')
+                last_row = player_data['Season'].idxmax()
+
+                target_metrics = [metric for metric in selected_metrics if metric in player_data.columns]
 
                 progress_bar = st.progress(0)
                 status_text = st.empty()
+                status_text.text(f"📊 {len(target_metrics)}개 지표 예측 중...")
 
-                for idx, metric in enumerate(selected_metrics):
-                    if metric not in player_data_copy.columns:
-                        continue
+                # 선택 순서대로 자리를 잡아 두고, 예측이 끝나는 대로 해당 자리에 결과를 표시
+                slots = {metric: st.container() for metric in target_metrics}
 
-                    status_text.text(f"📊 {metrics[metric]} 예측 중... ({idx + 1}/{len(selected_metrics)})")
-                    progress_bar.progress((idx + 1) / len(selected_metrics))
+                def show_queue_position(position):
+                    if position:
+                        status_text.text(f"⏳ 예측 대기 중... (대기열 {position}번째)")
+                    elif position == 0:
+                        status_text.text("📊 모델 학습 중...")
 
-                    with st.spinner(f'{metrics[metric]} 모델 학습 및 예측 중...'):
-                        # 데이터 준비
-                        player_metric_data = player_data_copy[['Season', metric]].copy()
-                        player_metric_data.columns = ['ds', 'y']
+                results = forecast_metrics_concurrently(engine, player_type, player_id, target_metrics,
+                                                        periods=prediction_years, mode=mode,
+                                                        on_wait=show_queue_position)
 
-                        # 예측 수행
-                        forecast = get_prophet_forecast(player_data_copy, metric, periods=prediction_years)
+                for done, (metric, forecast, notice) in enumerate(results, start=1):
+                    status_text.text(f"📊 {metrics[metric]} 예측 완료 ({done}/{len(target_metrics)})")
+                    progress_bar.progress(done / len(target_metrics))
 
+                    with slots[metric]:
                         if forecast is None:
                             st.error(f"{metrics[metric]} 예측에 실패했습니다.")
                             continue
+                        if notice:
+                            st.warning(f"⚠️ {notice}")
 
-                        # 예측 차트 생성
-                        st.subheader(f"📈 {metrics[metric]} 예측 결과")
-
-                        fig = create_prediction_plot(
-                            player_metric_data,
-                            forecast,
-                            metrics[metric],
-                            player,
-                            lang
-                        )
-
-                        st.plotly_chart(fig, use_container_width=True, config=get_plotly_config())
-
-                        # 예측 결과 테이블
-                        future_forecast = forecast[forecast['ds'] > player_metric_data['ds'].max()]
-
-                        col1, col2 = st.columns(2)
-
-                        with col1:
-                            st.markdown("**📊 예측 통계**")
-                            avg_pred = future_forecast['yhat'].mean()
-                            st.metric("평균 예측값", f"{avg_pred:.2f}")
-
-                        with col2:
-                            trend = "상승 📈" if future_forecast['yhat'].iloc[-1] > player_metric_data['y'].iloc[-1] else "하락 📉"
-                            st.markdown("**📊 추세**")
-                            st.metric("예측 트렌드", trend)
-
-                        # 상세 예측 테이블
-                        with st.expander("📋 상세 예측 데이터 보기"):
-                            result_df = future_forecast[['ds', 'yhat', 'yhat_lower', 'yhat_upper']].copy()
-                            result_df.columns = ['시즌', '예측값', '하한값', '상한값']
-                            result_df['시즌'] = result_df['시즌'].dt.year
-
-                            if metric in ['BattingAverage', 'OnBasePercentage', 'SluggingPercentage', 'OPS', 'Whip', 'EarnedRunAverage']:
-                                st.dataframe(result_df.style.format({
-                                    '예측값': "{:.3f}",
-                                    '하한값': "{:.3f}",
-                                    '상한값': "{:.3f}"
-                                }), use_container_width=True)
-                            else:
-                                st.dataframe(result_df.style.format({
-                                    '예측값': "{:.1f}",
-                                    '하한값': "{:.1f}",
-                                    '상한값': "{:.1f}"
-                                }), use_container_width=True)
-
-                        st.markdown("---")
+                        render_forecast_result(player, player_data, last_row, forecast, metric, metrics[metric], lang)
 
                 progress_bar.progress(1.0)
                 status_text.text("✅ 모든 예측이 완료되었습니다!")
@@ -4,10 +4,10 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import plotly.express as px
 from streamlit_option_menu import option_menu
-from utils import load_data, load_pitcher_data, get_plotly_layout_config, get_plotly_config, display_player_image, calculate_league_averages
+from utils import load_data, load_pitcher_data, get_plotly_layout_config, display_player_image, calculate_league_averages, get_data_version, get_player_name_index, show_table, get_cached_figure, get_chart_labels, localize_figure, show_chart
 from i18n import get_text
 from config import BATTING_METRICS, PITCHING_METRICS
-from player_analysis_ai import PlayerAnalysisAI, is_ai_analysis_available, get_ai_analysis_status
+from player_analysis_ai import get_player_analysis_ai, is_ai_analysis_available, get_ai_analysis_status, REPORT_LANGUAGES
 
 def create_interactive_charts(player_data, league_avg, metrics, player_name, player_type):
     """
@@ -33,6 +33,9 @@ def create_interactive_charts(player_data, league_avg, metrics, player_name, pla
 
     colors = px.colors.qualitative.Plotly
 
+    # 선수가 뛴 시즌의 리그 평균은 지표와 무관하므로 한 번만 필터링
+    league_data_filtered = league_avg[league_avg['Season'].isin(player_data['Season'])]
+
     for idx, metric in enumerate(metrics):
         row = idx // 2 + 1
         col = idx % 2 + 1
@@ -54,7 +57,6 @@ def create_interactive_charts(player_data, league_avg, metrics, player_name, pla
         )
 
         # 리그 평균 라인
-        league_data_filtered = league_avg[league_avg['Season'].isin(player_data['Season'])]
         fig.add_trace(
             go.Scatter(
                 x=league_data_filtered['Season'],
@@ -172,29 +174,36 @@ def run_search(lang="ko"):
         }
     )
 
+    def data_version_of(player_type):
+        return get_data_version('pitcher' if player_type == '투수' else 'batter')
+
+    def select_player(label, player_type, season=None):
+        # 데이터 버전별로 한 번 만든 이름 인덱스의 정렬된 목록을 사용 (매 실행마다 정렬하지 않음)
+        # 동명이인을 구분하도록 PlayerID로 선택하고 표시 이름(동명이인은 활동 기간 포함)으로 보여줌
+        index_type = 'pitcher' if player_type == '투수' else 'batter'
+        name_index = get_player_name_index(index_type, data_version_of(player_type))
+        player_id = st.selectbox(label, [None] + name_index.sorted_ids(season), index=0,
+                                 format_func=lambda x: "" if x is None else name_index.label(x))
+        return player_id, name_index.name(player_id)
+
     def view_player_stats(data, league_avg, player_type, metrics, season=None):
         if season:
             data = data[data['Season'] == season]
             league_avg = league_avg[league_avg['Season'] == season]
 
-        player_names = [""] + sorted(data['PlayerName'].unique())
-        player = st.selectbox(get_text('select_player', lang), player_names, index=0)
+        player_id, player = select_player(get_text('select_player', lang), player_type, season)
 
         if player:
-            with st.spinner('선수 데이터를 불러오는 중...'):
-                player_data = data[data['PlayerName'] == player].sort_values(by='Season')
-                player_data_styled = player_data.style.format(precision=3)
+            # 세션 간 누적 검색 통계에 기록 (AI 보고서 사전 생성 대상 선정에 사용)
+            tracker = st.session_state.get('metric_tracker')
+            if tracker is not None:
+                tracker.log_player_search(player, 'pitcher' if player_type == '투수' else 'batter', player_id)
 
-                if player_type == '투수':
-                    player_data_styled = player_data.style.format({
-                        "EarnedRunAverage": "{:.2f}",
-                        "Whip": "{:.2f}",
-                        "InningsPitched": "{:.1f}"
-                    })
+            with st.spinner('선수 데이터를 불러오는 중...'):
+                # ai_pregenerate.player_report_prompt와 같은 방식으로 선수 기록을 선택 (보고서 캐시 키 일치)
+                player_data = data[data['PlayerID'] == player_id].sort_values(by='Season')
 
             if not player_data.empty and len(player_data) > 0:
-                player_id = player_data.iloc[0]['PlayerID']
-
                 col1, col2 = st.columns([1, 2])
 
                 with col1:
@@ -215,7 +224,7 @@ def run_search(lang="ko"):
                         avg_era = player_data['EarnedRunAverage'].mean()
                         st.metric("평균 ERA", f"{avg_era:.2f}")
 
-                st.dataframe(player_data_styled, height=min(400, 50 + 35 * len(player_data)), use_container_width=True)
+                show_table(player_data, lang, height=min(400, 50 + 35 * len(player_data)))
 
                 st.subheader("📊 선수 기록 인터랙티브 시각화")
 
@@ -225,16 +234,19 @@ def run_search(lang="ko"):
                     else:
                         metrics_to_display = PITCHING_METRICS
 
-                    # Plotly 인터랙티브 차트 생성
-                    fig = create_interactive_charts(
+                    # Plotly 인터랙티브 차트 생성 (데이터 버전/선수/시즌/지표별 캐시, 언어별 레이블은 덮어쓰기)
+                    fig = get_cached_figure(
+                        create_interactive_charts,
+                        (data_version_of(player_type), int(player_id), season, tuple(metrics_to_display)),
                         player_data,
                         league_avg,
                         metrics_to_display,
                         player,
                         player_type
                     )
+                    fig = localize_figure(fig, get_chart_labels(metrics_to_display, lang))
 
-                    st.plotly_chart(fig, use_container_width=True, config=get_plotly_config())
+                    show_chart(fig, "search_player_stats")
 
                     # 차트 다운로드 안내
                     st.info("💡 차트 위에 마우스를 올리면 확대/축소, 다운로드 등의 기능을 사용할 수 있습니다.")
@@ -245,38 +257,35 @@ def run_search(lang="ko"):
                 if is_ai_analysis_available():
                     st.subheader("🤖 AI 기반 선수 분석 보고서")
 
-                    if st.button(f"✨ {player} AI 분석 보고서 생성", key=f"ai_analysis_{player}", use_container_width=True):
-                        with st.spinner("🤖 AI가 선수 기록을 분석 중입니다... (30초 소요)"):
-                            try:
-                                # 프로그레스 바
-                                progress_bar = st.progress(0)
-                                progress_bar.progress(20)
-
-                                ai_analyzer = PlayerAnalysisAI()
-                                progress_bar.progress(40)
+                    if st.button(f"✨ {player} AI 분석 보고서 생성", key=f"ai_analysis_{player_id}", use_container_width=True):
+                        try:
+                            ai_analyzer = get_player_analysis_ai()
 
-                                # 언어 매핑
-                                lang_mapping = {"ko": "한국어", "en": "영어", "ja": "일본어"}
-                                analysis_lang = lang_mapping.get(lang, "한국어")
+                            # 언어 매핑
+                            analysis_lang = REPORT_LANGUAGES.get(lang, "한국어")
 
-                                progress_bar.progress(60)
+                            # 같은 프롬프트/모델/데이터 버전의 보고서가 캐시에 있으면 바로 표시
+                            data_version = data_version_of(player_type)
+                            formatted_prompt = ai_analyzer.build_player_prompt(
+                                player, player_data, league_avg, player_type, analysis_lang
+                            )
+                            analysis_report = ai_analyzer.get_cached_report(formatted_prompt, data_version)
 
-                                # AI 분석 실행
-                                analysis_report = ai_analyzer.generate_player_analysis(
-                                    player_name=player,
-                                    player_data=player_data,
-                                    league_averages=league_avg,
-                                    player_type=player_type,
-                                    language=analysis_lang
-                                )
-
-                                progress_bar.progress(100)
-
-                                # 분석 결과 표시
-                                st.success("✅ AI 분석이 완료되었습니다!")
+                            if analysis_report is not None:
+                                st.success("⚡ 저장된 AI 분석 보고서를 불러왔습니다!")
                                 st.markdown("### 📊 AI 분석 보고서")
                                 st.markdown(analysis_report)
+                            else:
+                                # 모델이 생성하는 대로 보고서를 표시 (완료되면 전체 보고서가 캐시에 저장됨)
+                                st.markdown("### 📊 AI 분석 보고서")
+                                with st.spinner("🤖 AI가 선수 기록을 분석 중입니다..."):
+                                    analysis_report = st.write_stream(
+                                        ai_analyzer.stream_report(formatted_prompt, data_version)
+                                    )
 
+                            if not analysis_report:
+                                st.warning("AI 응답을 받지 못했습니다. 다시 시도해주세요.")
+                            else:
                                 # 보고서 다운로드 옵션
                                 col1, col2 = st.columns([1, 4])
                                 with col1:
@@ -288,8 +297,8 @@ def run_search(lang="ko"):
                                         use_container_width=True
                                     )
 
-                            except Exception as e:
-                                st.error(f"❌ AI 분석 중 오류가 발생했습니다: {str(e)}")
+                        except Exception as e:
+                            st.error(f"❌ AI 분석 중 오류가 발생했습니다: {str(e)}")
                 else:
                     # AI 기능 사용 불가 시 상태 표시
                     with st.expander("💡 AI 분석 기능 안내"):
@@ -304,17 +313,14 @@ def run_search(lang="ko"):
                 st.warning(f"❌ 해당 선수의 기록을 찾을 수 없습니다.")
 
     def view_player_stats_by_season(data, league_avg, player_type, metrics, season):
-        player_names = [""] + sorted(data['PlayerName'].unique())
-        player = st.selectbox('선수를 선택하세요:', player_names, index=0)
+        player_id, player = select_player('선수를 선택하세요:', player_type, season)
 
         if player and season:
             with st.spinner('선수 데이터를 불러오는 중...'):
-                player_data = data[(data['PlayerName'] == player) & (data['Season'] == season)]
+                player_data = data[(data['PlayerID'] == player_id) & (data['Season'] == season)]
                 league_data = league_avg[league_avg['Season'] == season]
 
             if not player_data.empty and len(player_data) > 0:
-                player_id = player_data.iloc[0]['PlayerID']
-
                 col1, col2 = st.columns([1, 2])
 
                 with col1:
@@ -324,21 +330,18 @@ def run_search(lang="ko"):
                     st.markdown(f"### {player}")
                     st.markdown(f"**{season} 시즌**")
 
-                player_data_styled = player_data.style.format(precision=3)
-                if player_type == '투수':
-                    player_data_styled = player_data.style.format({
-                        "EarnedRunAverage": "{:.2f}",
-                        "Whip": "{:.2f}",
-                        "InningsPitched": "{:.1f}"
-                    })
-
-                st.dataframe(player_data_styled, height=min(400, 50 + 35 * len(player_data)), use_container_width=True)
+                show_table(player_data, lang, height=min(400, 50 + 35 * len(player_data)))
 
                 st.subheader("📊 선수와 리그 평균 비교")
 
                 with st.spinner('비교 차트를 생성하는 중...'):
-                    fig = create_comparison_bar_chart(player_data, league_data, metrics, player, season)
-                    st.plotly_chart(fig, use_container_width=True, config=get_plotly_config())
+                    fig = get_cached_figure(
+                        create_comparison_bar_chart,
+                        (data_version_of(player_type), int(player_id), int(season), tuple(metrics)),
+                        player_data, league_data, metrics, player, season
+                    )
+                    fig = localize_figure(fig, get_chart_labels(metrics, lang))
+                    show_chart(fig, "search_season_comparison")
 
                     st.info("💡 차트 위에 마우스를 올리면 확대/축소, 다운로드 등의 기능을 사용할 수 있습니다.")
             else:
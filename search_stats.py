@@ -0,0 +1,87 @@
+"""
+선수 검색 인기도 저장 모듈
+세션별 MetricTracker가 세는 선수(PlayerID) 검색 횟수를 SQLite 파일에 누적하여 세션/프로세스가 끝나도 유지하고,
+많이 검색된 선수 목록을 조회 (AI 보고서 사전 생성 대상 선정에 사용)
+"""
+
+import logging
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import List, Optional, Tuple
+
+from config import SEARCH_STATS_DB_PATH
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS player_searches (
+    player_type TEXT NOT NULL,
+    player_id INTEGER NOT NULL,
+    player_name TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    last_searched_at REAL NOT NULL,
+    PRIMARY KEY (player_type, player_id)
+);
+CREATE INDEX IF NOT EXISTS idx_player_searches_count ON player_searches (count);
+"""
+
+
+class SearchStatsStore:
+    """
+    선수 유형/이름별 누적 검색 횟수 저장소
+
+    Args:
+        db_path: 검색 통계 DB 파일 경로
+    """
+
+    def __init__(self, db_path: str = SEARCH_STATS_DB_PATH):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            # 이름 기준으로 누적하던 이전 형식은 동명이인을 구분할 수 없으므로 새로 누적
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(player_searches)")]
+            if columns and 'player_id' not in columns:
+                conn.execute("DROP TABLE player_searches")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        # 여러 세션/프로세스가 동시에 기록하므로 호출마다 연결하고 트랜잭션 후 닫습니다.
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def record(self, player_type: str, player_id: int, player_name: str):
+        """검색 1회를 누적합니다. (동명이인을 구분하도록 PlayerID 기준, 이름은 표시/로그용)"""
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT INTO player_searches (player_type, player_id, player_name, count, last_searched_at) "
+                    "VALUES (?, ?, ?, 1, ?) "
+                    "ON CONFLICT(player_type, player_id) DO UPDATE SET "
+                    "count = count + 1, player_name = excluded.player_name, last_searched_at = excluded.last_searched_at",
+                    (player_type, int(player_id), player_name, time.time())
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"검색 통계 저장 실패 ({self.db_path}): {e}")
+
+    def top_players(self, limit: int, player_type: Optional[str] = None) -> List[Tuple[str, int, str, int]]:
+        """검색 횟수가 많은 순으로 (선수 유형, PlayerID, 이름, 횟수) 목록을 반환합니다. (같으면 최근 검색 순)"""
+        query = "SELECT player_type, player_id, player_name, count FROM player_searches"
+        params = ()
+        if player_type is not None:
+            query += " WHERE player_type = ?"
+            params = (player_type,)
+        query += " ORDER BY count DESC, last_searched_at DESC LIMIT ?"
+        try:
+            with self._connect() as conn:
+                return conn.execute(query, params + (limit,)).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"검색 통계 조회 실패 ({self.db_path}): {e}")
+            return []
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+몬테카를로 시즌 시뮬레이션 모듈
+선수별 타석(PA)/상대 타자(BF)당 결과 비율을 Marcel 방식으로 추정하고,
+수천 시즌을 NumPy 이항/포아송 난수로 한 번에 뽑아 HR, H, RBI, AVG, OPS, K, ERA 등의
+분포와 백분위를 계산 (시드 고정으로 재현 가능)
+"""
+
+import argparse
+import logging
+import time
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from config import (
+    MARCEL_WEIGHTS, SIM_DEFAULT_RUNS, SIM_SEED, SIM_REGRESSION_PA, SIM_PLAYING_TIME_WEIGHTS,
+    SIM_PLAYING_TIME_BASE, SIM_PERCENTILES, SIM_CHUNK_SIZE,
+)
+from pooled_model import group_sum
+
+logger = logging.getLogger(__name__)
+
+# 타석/상대 타자 결과 범주 (마지막 범주는 나머지 아웃)
+BATTER_EVENTS = ['HomeRuns', 'Singles', 'Walks', 'StrikeOuts', 'Outs']
+PITCHER_EVENTS = ['StrikeOuts', 'Walks', 'HitsAllowed', 'Outs']
+
+# 시뮬레이션 결과 지표 (표시 순서)
+BATTER_SIM_STATS = ['HomeRuns', 'Hits', 'RBIs', 'StrikeOuts', 'BattingAverage', 'OnBasePercentage', 'OPS']
+PITCHER_SIM_STATS = ['StrikeOuts', 'Walks', 'HitsAllowed', 'InningsPitched', 'EarnedRunAverage', 'Whip']
+
+
+def innings_to_outs(innings):
+    """야구식 이닝 표기(183.1 = 183⅓이닝)를 아웃 카운트로 변환합니다."""
+    innings = np.asarray(innings, dtype=float)
+    whole = np.floor(innings)
+    return whole * 3 + np.round((innings - whole) * 10)
+
+
+def batter_season_counts(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    타자 시즌 기록을 타석 결과 범주별 횟수로 변환합니다.
+    타수가 없는 시즌(2024년 이후)은 안타 / 타율로 타수를 역산하고, PA는 타수 + 볼넷으로 근사합니다.
+    """
+    at_bats = df['AtBats'].to_numpy(dtype=float)
+    hits = df['Hits'].to_numpy(dtype=float)
+    average = df['BattingAverage'].to_numpy(dtype=float)
+    derived = np.divide(hits, average, out=np.zeros_like(hits), where=average > 0)
+    at_bats = np.where(at_bats > 0, at_bats, np.round(derived))
+
+    home_runs = df['HomeRuns'].to_numpy(dtype=float)
+    walks = df['Walks'].to_numpy(dtype=float)
+    strikeouts = df['StrikeOuts'].to_numpy(dtype=float)
+    total_bases = df['SluggingPercentage'].to_numpy(dtype=float) * at_bats
+
+    return pd.DataFrame({
+        'PlayerID': df['PlayerID'].to_numpy(),
+        'Season': df['Season'].to_numpy(),
+        'PA': at_bats + walks,
+        'HomeRuns': home_runs,
+        'Singles': hits - home_runs,  # 홈런 외 안타 (2/3루타 포함)
+        'Walks': walks,
+        'StrikeOuts': strikeouts,
+        'Outs': np.maximum(at_bats - hits - strikeouts, 0),
+        'ExtraBases': np.maximum(total_bases - 4 * home_runs - (hits - home_runs), 0),
+        'RunnersBattedIn': np.maximum(df['RBIs'].to_numpy(dtype=float) - home_runs, 0),
+    })
+
+
+def pitcher_season_counts(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    투수 시즌 기록을 상대 타자 결과 범주별 횟수로 변환합니다.
+    BF는 아웃 + 피안타 + 볼넷으로 근사하고, 자책점은 ERA × 이닝 / 9로 역산합니다.
+    (2024년 이후 피홈런 기록이 없어 홈런은 별도 범주로 나누지 않습니다.)
+    """
+    outs = innings_to_outs(df['InningsPitched'])
+    strikeouts = df['StrikeOuts'].to_numpy(dtype=float)
+    walks = df['Walks'].to_numpy(dtype=float)
+    hits = df['HitsAllowed'].to_numpy(dtype=float)
+
+    return pd.DataFrame({
+        'PlayerID': df['PlayerID'].to_numpy(),
+        'Season': df['Season'].to_numpy(),
+        'PA': outs + hits + walks,
+        'StrikeOuts': np.minimum(strikeouts, outs),
+        'Walks': walks,
+        'HitsAllowed': hits,
+        'Outs': np.maximum(outs - strikeouts, 0),
+        'EarnedRuns': np.round(df['EarnedRunAverage'].to_numpy(dtype=float) * outs / 27),
+    })
+
+
+def project_rates(counts: pd.DataFrame, events, extra_columns, player_type: str, season: Optional[int] = None,
+                  weights=MARCEL_WEIGHTS, regression_pa=SIM_REGRESSION_PA) -> pd.DataFrame:
+    """
+    시즌별 결과 횟수로 다음 시즌의 결과 비율과 출전 기회를 Marcel 방식으로 추정합니다.
+
+    최근 시즌 횟수에 가중치(기본 5/4/3)를 두어 합산하고 같은 시즌들의 리그 비율로
+    regression_pa 타석만큼을 더해 회귀시킵니다. 출전 기회는 직전/전전 시즌 PA의 가중합에 기본값을 더합니다.
+
+    Args:
+        counts: batter_season_counts / pitcher_season_counts 결과
+        events: 다항 결과 범주 (합이 PA)
+        extra_columns: 결과 범주 외에 비율로 추정할 컬럼 (장타 추가 루타, 자책점 등)
+        player_type: 'batter' 또는 'pitcher' (출전 기회 기본값 선택)
+        season: 이 시즌에 출전한 선수만 대상 (None이면 마지막 시즌)
+
+    Returns:
+        PlayerID 인덱스, PA 및 events/extra_columns 비율 컬럼의 데이터프레임
+    """
+    season = int(counts['Season'].max()) if season is None else season
+    active = counts.loc[counts['Season'] == season, 'PlayerID'].unique()
+    data = counts[counts['PlayerID'].isin(active) & (counts['Season'] <= season)].sort_values(['PlayerID', 'Season'])
+
+    columns = list(events) + list(extra_columns)
+    codes, player_ids = pd.factorize(data['PlayerID'])
+    n_players = len(player_ids)
+    values = data[columns].to_numpy(dtype=float)
+    pa = data['PA'].to_numpy(dtype=float)
+
+    # 시즌별 리그 비율 (PA 합 대비 범주 합)
+    league = counts.groupby('Season')[['PA'] + columns].sum()
+    league_rates = (league[columns].to_numpy() / league[['PA']].to_numpy())
+    league_rates = pd.DataFrame(league_rates, index=league.index).reindex(data['Season']).to_numpy()
+
+    recency = season - data['Season'].to_numpy()
+    weight_table = np.asarray(weights, dtype=float)
+    row_weights = np.where(recency < len(weight_table), weight_table[np.minimum(recency, len(weight_table) - 1)], 0.0)
+
+    weighted_counts = group_sum(codes, row_weights[:, None] * values, n_players)
+    weighted_pa = np.bincount(codes, weights=row_weights * pa, minlength=n_players)
+    league_ref = group_sum(codes, (row_weights * pa + (pa == 0))[:, None] * league_rates, n_players)
+    league_ref /= np.bincount(codes, weights=row_weights * pa + (pa == 0), minlength=n_players)[:, None]
+    rates = (weighted_counts + regression_pa * league_ref) / (weighted_pa + regression_pa)[:, None]
+
+    # 결과 범주 비율은 합이 1이 되도록 정규화
+    n_events = len(events)
+    rates[:, :n_events] /= rates[:, :n_events].sum(axis=1, keepdims=True)
+
+    pa_weights = np.zeros(len(data))
+    for lag, weight in enumerate(SIM_PLAYING_TIME_WEIGHTS):
+        pa_weights[recency == lag] = weight
+    projected_pa = np.bincount(codes, weights=pa_weights * pa, minlength=n_players) + SIM_PLAYING_TIME_BASE[player_type]
+
+    projection = pd.DataFrame(rates, columns=columns, index=pd.Index(player_ids, name='PlayerID'))
+    projection.insert(0, 'PA', np.round(projected_pa).astype(np.int64))
+    return projection
+
+
+def project_batter_rates(df: pd.DataFrame, season: Optional[int] = None) -> pd.DataFrame:
+    """타자의 다음 시즌 PA와 타석 결과 비율을 추정합니다."""
+    return project_rates(batter_season_counts(df), BATTER_EVENTS, ['ExtraBases', 'RunnersBattedIn'], 'batter', season)
+
+
+def project_pitcher_rates(df: pd.DataFrame, season: Optional[int] = None) -> pd.DataFrame:
+    """투수의 다음 시즌 BF와 상대 타자 결과 비율을 추정합니다."""
+    return project_rates(pitcher_season_counts(df), PITCHER_EVENTS, ['EarnedRuns'], 'pitcher', season)
+
+
+def _draw_events(rng: np.random.Generator, pa: np.ndarray, rates: np.ndarray, n_sims: int):
+    """
+    (선수, 시뮬레이션) 형태로 다항 분포를 조건부 이항 난수의 연쇄로 뽑습니다.
+    마지막 범주는 남은 타석 수입니다.
+    """
+    remaining = np.broadcast_to(pa[:, None], (len(pa), n_sims)).astype(np.int64)
+    remaining_prob = np.ones(len(pa))
+    draws = []
+    for j in range(rates.shape[1] - 1):
+        prob = np.clip(rates[:, j] / np.maximum(remaining_prob, 1e-12), 0.0, 1.0)
+        draw = rng.binomial(remaining, prob[:, None])
+        draws.append(draw)
+        remaining = remaining - draw
+        remaining_prob = remaining_prob - rates[:, j]
+    draws.append(remaining)
+    return draws
+
+
+def _simulate_batter_chunk(rng: np.random.Generator, rates: pd.DataFrame, n_sims: int) -> Dict[str, np.ndarray]:
+    pa = rates['PA'].to_numpy()
+    home_runs, singles, walks, strikeouts, _ = _draw_events(rng, pa, rates[BATTER_EVENTS].to_numpy(), n_sims)
+    hits = home_runs + singles
+    at_bats = pa[:, None] - walks
+
+    # 추가 루타와 주자 타점은 홈런 외 안타(+볼넷) 수에 비례하는 포아송 분포로 근사
+    batted_in_per_event = rates['RunnersBattedIn'].to_numpy() / (rates['Singles'] + rates['Walks']).to_numpy()
+    extra_per_single = rates['ExtraBases'].to_numpy() / rates['Singles'].to_numpy()
+    extra_bases = rng.poisson(extra_per_single[:, None] * singles)
+    rbis = home_runs + rng.poisson(batted_in_per_event[:, None] * (singles + walks))
+
+    safe_ab = np.maximum(at_bats, 1)
+    average = hits / safe_ab
+    on_base = (hits + walks) / np.maximum(pa[:, None], 1)
+    slugging = (4 * home_runs + singles + extra_bases) / safe_ab
+    return {
+        'HomeRuns': home_runs,
+        'Hits': hits,
+        'RBIs': rbis,
+        'StrikeOuts': strikeouts,
+        'BattingAverage': average,
+        'OnBasePercentage': on_base,
+        'OPS': on_base + slugging,
+    }
+
+
+def _simulate_pitcher_chunk(rng: np.random.Generator, rates: pd.DataFrame, n_sims: int) -> Dict[str, np.ndarray]:
+    bf = rates['PA'].to_numpy()
+    strikeouts, walks, hits, other_outs = _draw_events(rng, bf, rates[PITCHER_EVENTS].to_numpy(), n_sims)
+    innings = np.maximum(strikeouts + other_outs, 1) / 3
+
+    # 자책점은 출루 허용(피안타 + 볼넷) 수에 비례하는 포아송 분포로 근사
+    runs_per_baserunner = rates['EarnedRuns'].to_numpy() / (rates['HitsAllowed'] + rates['Walks']).to_numpy()
+    earned_runs = rng.poisson(runs_per_baserunner[:, None] * (hits + walks))
+    return {
+        'StrikeOuts': strikeouts,
+        'Walks': walks,
+        'HitsAllowed': hits,
+        'InningsPitched': innings,
+        'EarnedRunAverage': 9 * earned_runs / innings,
+        'Whip': (hits + walks) / innings,
+    }
+
+
+_CHUNK_SIMULATORS = {
+    'batter': _simulate_batter_chunk,
+    'pitcher': _simulate_pitcher_chunk,
+}
+
+
+def simulate_player(rates: pd.DataFrame, player_id, player_type: str, n_sims: int = SIM_DEFAULT_RUNS,
+                    seed: int = SIM_SEED) -> Optional[Dict[str, np.ndarray]]:
+    """
+    한 선수의 시즌을 n_sims번 시뮬레이션하여 지표별 결과 배열을 반환합니다.
+    추정 비율이 없는 선수(마지막 시즌 미출전)는 None을 반환합니다.
+    """
+    if player_id not in rates.index:
+        return None
+    rng = np.random.default_rng(seed)
+    draws = _CHUNK_SIMULATORS[player_type](rng, rates.loc[[player_id]], n_sims)
+    return {stat: values[0] for stat, values in draws.items()}
+
+
+def simulate_league(rates: pd.DataFrame, player_type: str, n_sims: int = SIM_DEFAULT_RUNS, seed: int = SIM_SEED,
+                    percentiles=SIM_PERCENTILES, chunk_size: int = SIM_CHUNK_SIZE) -> pd.DataFrame:
+    """
+    리그 전체 선수의 시즌을 n_sims번씩 시뮬레이션하고 지표별 평균과 백분위를 계산합니다.
+    메모리를 일정하게 유지하도록 chunk_size명씩 나누어 뽑고 바로 요약합니다.
+
+    Returns:
+        PlayerID, stat, mean, p<백분위>... 컬럼의 데이터프레임
+    """
+    rng = np.random.default_rng(seed)
+    simulate_chunk = _CHUNK_SIMULATORS[player_type]
+    frames = []
+    for start in range(0, len(rates), chunk_size):
+        chunk = rates.iloc[start:start + chunk_size]
+        for stat, values in simulate_chunk(rng, chunk, n_sims).items():
+            summary = np.percentile(values, percentiles, axis=1)
+            frame = pd.DataFrame({'PlayerID': chunk.index.to_numpy(), 'stat': stat, 'mean': values.mean(axis=1)})
+            for q, column in zip(percentiles, summary):
+                frame[f'p{q}'] = column
+            frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+
+def summarize_draws(draws: Dict[str, np.ndarray], percentiles=SIM_PERCENTILES) -> pd.DataFrame:
+    """simulate_player 결과를 지표별 평균/백분위 표로 요약합니다."""
+    rows = []
+    for stat, values in draws.items():
+        row = {'stat': stat, 'mean': values.mean()}
+        row.update({f'p{q}': v for q, v in zip(percentiles, np.percentile(values, percentiles))})
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+PROJECTORS = {
+    'batter': project_batter_rates,
+    'pitcher': project_pitcher_rates,
+}
+
+
+def main():
+    from forecast_batch import PLAYER_TYPES, load_stats_frame
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description='리그 전체 몬테카를로 시즌 시뮬레이션 (속도 측정)')
+    parser.add_argument('--player-type', choices=list(PLAYER_TYPES), default='batter', help='선수 유형 (기본값: batter)')
+    parser.add_argument('--sims', type=int, default=SIM_DEFAULT_RUNS, help=f'선수별 시뮬레이션 횟수 (기본값: {SIM_DEFAULT_RUNS})')
+    parser.add_argument('--seed', type=int, default=SIM_SEED, help=f'난수 시드 (기본값: {SIM_SEED})')
+    parser.add_argument('--output', help='요약 결과 CSV 경로 (선택)')
+    args = parser.parse_args()
+
+    df = load_stats_frame(args.player_type)
+    start = time.perf_counter()
+    rates = PROJECTORS[args.player_type](df)
+    projected = time.perf_counter()
+    summary = simulate_league(rates, args.player_type, n_sims=args.sims, seed=args.seed)
+    finished = time.perf_counter()
+
+    print(f"선수 {len(rates)}명 × {args.sims}회 시뮬레이션")
+    print(f"  비율 추정: {projected - start:.3f}초, 시뮬레이션: {finished - projected:.2f}초")
+    print(summary.groupby('stat')[['mean'] + [f'p{q}' for q in SIM_PERCENTILES]].median().round(3).to_string())
+
+    if args.output:
+        summary.to_csv(args.output, index=False)
+        print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
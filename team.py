@@ -0,0 +1,150 @@
+import time
+import streamlit as st
+import plotly.graph_objects as go
+from utils import load_data, load_pitcher_data, get_plotly_config, apply_theme_to_figure, get_data_version, show_table
+from i18n import get_text
+from config import TEAM_TRADED_LABEL, TEAM_PA_PER_GAME, PYTHAG_EXPONENT, SEASON_GAMES, CACHE_TTL_SECONDS
+from predict import FORECAST_ENGINES, get_marcel_projections, get_pooled_model, get_simulation_rates
+from pooled_model import pooled_project
+
+# 팀 예측에 사용할 수 있는 엔진 (리그 전체 예측을 한 번에 계산할 수 있는 엔진만)
+TEAM_ENGINES = ['marcel', 'pooled']
+
+
+def project_teams(batter_df, pitcher_df, batter_projection, pitcher_projection, batter_rates):
+    """
+    마지막 시즌 소속 팀 기준으로 선수 예측을 합산하여 팀별 득점 생산(RC)과 실점을 예측합니다.
+
+    RC는 기본 공식 (H + BB) × TB / (AB + BB) = OBP × SLG × AB 로, 실점은 ERA × 이닝 / 9 로 계산합니다.
+    트레이드로 시즌 중 팀을 옮긴 선수(Team이 '- - -')는 소속을 알 수 없어 제외합니다.
+
+    Args:
+        batter_df / pitcher_df: 타자/투수 시즌 기록 데이터
+        batter_projection: PlayerID 인덱스, OnBasePercentage / SluggingPercentage 예측 컬럼
+        pitcher_projection: PlayerID 인덱스, EarnedRunAverage / InningsPitched 예측 컬럼
+        batter_rates: PlayerID 인덱스, 예상 타석(PA)과 볼넷 비율(Walks) 컬럼 (시즌 시뮬레이터 추정값)
+
+    Returns:
+        (Team 인덱스의 팀 예측 데이터프레임, 제외된 트레이드 선수 수)
+    """
+    def roster(df):
+        latest = df.loc[df['Season'] == df['Season'].max(), ['PlayerID', 'Team']].drop_duplicates('PlayerID')
+        traded = latest['Team'] == TEAM_TRADED_LABEL
+        return latest[~traded].set_index('PlayerID'), int(traded.sum())
+
+    batter_roster, traded_batters = roster(batter_df)
+    pitcher_roster, traded_pitchers = roster(pitcher_df)
+
+    batters = batter_roster.join(batter_projection[['OnBasePercentage', 'SluggingPercentage']], how='inner')
+    batters = batters.join(batter_rates[['PA', 'Walks']], how='inner')
+    at_bats = batters['PA'] * (1 - batters['Walks'])
+    batters['RunsCreated'] = batters['OnBasePercentage'] * batters['SluggingPercentage'] * at_bats
+
+    pitchers = pitcher_roster.join(pitcher_projection[['EarnedRunAverage', 'InningsPitched']], how='inner')
+    pitchers['InningsPitched'] = pitchers['InningsPitched'].clip(lower=0)
+    pitchers['RunsAllowed'] = pitchers['EarnedRunAverage'].clip(lower=0) * pitchers['InningsPitched'] / 9
+
+    offense = batters.groupby('Team').agg(Batters=('PA', 'size'), PA=('PA', 'sum'), RunsCreated=('RunsCreated', 'sum'))
+    defense = pitchers.groupby('Team').agg(Pitchers=('RunsAllowed', 'size'), InningsPitched=('InningsPitched', 'sum'),
+                                           RunsAllowed=('RunsAllowed', 'sum'))
+    teams = offense.join(defense, how='outer').fillna(0)
+
+    # 팀마다 수집된 로스터 규모가 달라 총합 대신 경기당 득실점으로 피타고리안 승률을 계산
+    runs_per_game = teams['RunsCreated'] / teams['PA'].where(teams['PA'] > 0) * TEAM_PA_PER_GAME
+    allowed_per_game = 9 * teams['RunsAllowed'] / teams['InningsPitched'].where(teams['InningsPitched'] > 0)
+    scored, allowed = runs_per_game ** PYTHAG_EXPONENT, allowed_per_game ** PYTHAG_EXPONENT
+    teams['RunsPerGame'] = runs_per_game
+    teams['RunsAllowedPerGame'] = allowed_per_game
+    teams['WinPct'] = scored / (scored + allowed)
+    teams['Wins'] = teams['WinPct'] * SEASON_GAMES
+    return teams.sort_values('WinPct', ascending=False), traded_batters + traded_pitchers
+
+
+def _next_season_projection(player_type, engine):
+    """선수 유형 전체의 다음 시즌(1년 후) 예측을 PlayerID × 지표 형태로 반환합니다."""
+    data_version = get_data_version(player_type)
+    if engine == 'marcel':
+        projections = get_marcel_projections(player_type, data_version)
+        return projections.loc[projections['step'] == 1, 'yhat'].unstack('metric')
+    projections = pooled_project(get_pooled_model(player_type, data_version), periods=1)
+    return projections.pivot(index='PlayerID', columns='metric', values='yhat')
+
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def get_team_projections(engine, batter_version, pitcher_version):
+    """
+    데이터 버전별로 30개 팀 예측을 한 번만 계산합니다.
+    (버전 인자는 캐시 키로만 사용되며, 데이터나 예측이 갱신되면 새로 계산됩니다.)
+
+    Returns:
+        (팀 예측 데이터프레임, 제외된 트레이드 선수 수, 계산 시간(초))
+    """
+    start = time.perf_counter()
+    teams, traded = project_teams(
+        load_data(), load_pitcher_data(),
+        _next_season_projection('batter', engine), _next_season_projection('pitcher', engine),
+        get_simulation_rates('batter', batter_version),
+    )
+    return teams, traded, time.perf_counter() - start
+
+
+def create_team_chart(teams, theme="plotly_white"):
+    """팀별 예상 경기당 득점/실점 막대 차트를 생성합니다."""
+    ordered = teams.sort_values('Wins')
+    fig = go.Figure()
+    fig.add_trace(go.Bar(y=ordered.index, x=ordered['RunsPerGame'], name='경기당 득점', orientation='h',
+                         marker_color='#00CC96'))
+    fig.add_trace(go.Bar(y=ordered.index, x=ordered['RunsAllowedPerGame'], name='경기당 실점', orientation='h',
+                         marker_color='#EF553B'))
+    fig.update_layout(
+        title={'text': "팀별 예상 경기당 득점/실점", 'x': 0.5, 'xanchor': 'center'},
+        barmode='group',
+        height=max(500, 25 * len(ordered)),
+        xaxis_title="점수",
+        legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1)
+    )
+    return apply_theme_to_figure(fig, theme)
+
+
+def run_team(lang):
+    st.header(get_text("team_projection", lang))
+
+    theme = st.session_state.get('chart_theme', 'plotly_white')
+
+    engine = st.radio(
+        "예측 엔진",
+        options=TEAM_ENGINES,
+        format_func=lambda x: FORECAST_ENGINES[x][0],
+        horizontal=True
+    )
+
+    teams, traded, elapsed = get_team_projections(engine, get_data_version('batter'), get_data_version('pitcher'))
+    if teams.empty:
+        st.warning(get_text("no_data_available", lang))
+        return
+
+    last_season = int(load_data()['Season'].max())
+    st.caption(
+        f"{last_season}시즌 소속 팀 기준 {last_season + 1}시즌 예측 · 팀 {len(teams)}개 · 계산 {elapsed * 1000:.0f} ms"
+    )
+    if traded:
+        st.info(f"💡 시즌 중 팀을 옮긴 선수 {traded}명은 소속 팀을 알 수 없어 합산에서 제외했습니다.")
+
+    show_df = teams[['Wins', 'WinPct', 'RunsPerGame', 'RunsAllowedPerGame', 'RunsCreated', 'RunsAllowed',
+                     'Batters', 'Pitchers']].rename(columns={
+        'Wins': '예상 승수', 'WinPct': '피타고리안 승률', 'RunsPerGame': '경기당 득점', 'RunsAllowedPerGame': '경기당 실점',
+        'RunsCreated': '득점 생산(RC)', 'RunsAllowed': '실점', 'Batters': '타자 수', 'Pitchers': '투수 수',
+    })
+    show_df.index.name = 'Team'
+    show_table(show_df.reset_index(), lang, precision={
+        '예상 승수': 1,
+        '피타고리안 승률': 3,
+        '경기당 득점': 2,
+        '경기당 실점': 2,
+        '득점 생산(RC)': 0,
+        '실점': 0,
+        '타자 수': 0,
+        '투수 수': 0,
+    }, height=min(1100, 36 * (len(show_df) + 1)))
+
+    st.plotly_chart(create_team_chart(teams, theme), use_container_width=True, config=get_plotly_config())
@@ -0,0 +1,46 @@
+"""
+에이징 커브 테스트
+세 선수의 연속 시즌 쌍으로 손으로 계산한 연차별 변화량과 누적 곡선을 확인
+"""
+
+import numpy as np
+import pandas as pd
+
+from aging_curves import aging_delta, compute_aging_curves
+
+
+def _three_pitchers():
+    return pd.DataFrame([
+        # 1: 100이닝씩 3시즌, ERA 0.5씩 개선
+        (1, 2010, 4.0, 100.0), (1, 2011, 3.5, 100.0), (1, 2012, 3.0, 100.0),
+        # 2: 2년차에 ERA 0.5 악화, 이닝 100 -> 300 (조화 평균 가중치 150)
+        (2, 2015, 4.0, 100.0), (2, 2016, 4.5, 300.0),
+        # 3: 2011 결장으로 2010 -> 2012는 쌍이 아님, 3년차(2012) -> 2013만 사용
+        (3, 2010, 5.0, 200.0), (3, 2012, 4.0, 200.0), (3, 2013, 4.4, 200.0),
+    ], columns=['PlayerID', 'Season', 'EarnedRunAverage', 'InningsPitched'])
+
+
+def test_paired_season_deltas_by_career_year():
+    curves = compute_aging_curves(_three_pitchers(), ['EarnedRunAverage'], 'pitcher',
+                                  max_career_years=5, min_pairs=1)
+
+    # 1년차 -> 2년차: (100 * -0.5 + 150 * +0.5) / 250 = +0.1
+    # 2년차 -> 3년차: 선수 1만 -0.5, 3년차 -> 4년차: 선수 3만 +0.4
+    np.testing.assert_array_equal(curves['career_pairs'], [2, 1, 1, 0])
+    np.testing.assert_allclose(curves['career'][:, 0], [0.0, 0.1, -0.4, 0.0, 0.0], atol=1e-6)
+    assert curves['career'].dtype == np.float32
+    assert curves['age'] is None
+
+    # 0년차 선수의 1, 2년 뒤 변화량과 1년차 선수의 1, 2년 뒤 변화량, 곡선이 없는 지표는 0
+    delta = aging_delta(curves, ['EarnedRunAverage', 'Whip'], np.array([0, 1]), [1, 2])
+    assert delta.shape == (2, 2, 2)
+    np.testing.assert_allclose(delta[:, 0], [[0.1, -0.4], [-0.5, -0.1]], atol=1e-6)
+    np.testing.assert_array_equal(delta[:, 1], 0.0)
+
+
+def test_sparse_career_years_stay_flat():
+    curves = compute_aging_curves(_three_pitchers(), ['EarnedRunAverage'], 'pitcher',
+                                  max_career_years=5, min_pairs=2)
+
+    # 쌍이 하나뿐인 2, 3년차 구간은 변화량 0으로 평평하게 이어짐
+    np.testing.assert_allclose(curves['career'][:, 0], [0.0, 0.1, 0.1, 0.1, 0.1], atol=1e-6)
@@ -0,0 +1,49 @@
+"""
+AI 보고서 사전 생성 대상 선정 테스트
+검색 통계가 PlayerID별로 누적되고, 사전 생성 프롬프트가 검색 화면과 같은 선수 기록(PlayerID 기준)을 쓰는지 확인
+"""
+
+import sqlite3
+
+import pandas as pd
+
+from ai_pregenerate import player_report_prompt
+from search_stats import SearchStatsStore
+
+
+class PromptRecorder:
+    """build_player_prompt에 전달된 선수 기록을 그대로 돌려주는 분석기 대체"""
+
+    def build_player_prompt(self, player_name, player_data, league_averages, player_type, language):
+        return player_name, player_data['PlayerID'].unique().tolist(), player_data['Season'].tolist()
+
+
+def test_namesakes_are_counted_separately(tmp_path):
+    store = SearchStatsStore(str(tmp_path / "search_stats.sqlite"))
+    store.record('batter', 571970, 'Max Muncy')
+    store.record('batter', 571970, 'Max Muncy')
+    store.record('batter', 29779, 'Max Muncy')
+    assert store.top_players(5) == [('batter', 571970, 'Max Muncy', 2), ('batter', 29779, 'Max Muncy', 1)]
+
+
+def test_name_keyed_table_is_replaced(tmp_path):
+    path = str(tmp_path / "search_stats.sqlite")
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE player_searches (player_type TEXT, player_name TEXT, count INTEGER, "
+                     "last_searched_at REAL, PRIMARY KEY (player_type, player_name))")
+        conn.execute("INSERT INTO player_searches VALUES ('batter', 'Max Muncy', 3, 0)")
+    store = SearchStatsStore(path)
+    assert store.top_players(5) == []
+    store.record('batter', 29779, 'Max Muncy')
+    assert store.top_players(5) == [('batter', 29779, 'Max Muncy', 1)]
+
+
+def test_prompt_uses_only_the_selected_player_id():
+    df = pd.DataFrame({
+        'PlayerID': [571970, 29779, 571970],
+        'PlayerName': ['Max Muncy'] * 3,
+        'Season': [2025, 2025, 2024],
+    })
+    name, ids, seasons = player_report_prompt(PromptRecorder(), df, pd.DataFrame(), 'batter', 571970, 'Max Muncy', "한국어")
+    assert (name, ids, seasons) == ('Max Muncy', [571970], [2024, 2025])
+    assert player_report_prompt(PromptRecorder(), df, pd.DataFrame(), 'batter', 1, 'Nobody', "한국어") is None
@@ -0,0 +1,101 @@
+"""
+예측 일괄 사전 계산 테스트
+임시 DB에서 precompute_forecasts를 반복 실행하여 바뀐 시계열(또는 예측 기간)만 다시 학습하는지 확인
+(Prophet 학습은 학습한 시계열을 기록하는 가짜 함수로 대체)
+"""
+
+import pandas as pd
+import pytest
+
+import forecast_batch
+from config import PREDICT_BATTER_METRICS
+from forecast_batch import load_forecast, precompute_forecasts
+
+METRICS = list(PREDICT_BATTER_METRICS)
+
+
+def _stats(last_ops=0.800):
+    rows = []
+    for player_id, base in [(1, 0.250), (2, 0.280)]:
+        for i, season in enumerate(range(2020, 2024)):
+            row = {'PlayerID': player_id, 'PlayerName': f"Player {player_id}", 'Season': season}
+            row.update({metric: base + 0.01 * i for metric in METRICS})
+            rows.append(row)
+    df = pd.DataFrame(rows)
+    df.loc[(df['PlayerID'] == 2) & (df['Season'] == 2023), 'OPS'] = last_ops
+    return df
+
+
+class FakeProphet:
+    """학습 요청을 기록하고 예측 행을 만드는 _prophet_rows 대체 (fail에 있는 시계열은 실패 처리)"""
+
+    def __init__(self):
+        self.calls = []
+        self.fail = set()
+
+    def __call__(self, series, periods, workers, mode):
+        keys = [(s['player_id'], s['metric']) for s in series]
+        self.calls.append(keys)
+        rows, failed = [], 0
+        for player_id, metric in keys:
+            if (player_id, metric) in self.fail:
+                failed += 1
+                continue
+            rows += [(player_id, metric, step, f"{2023 + step}-01-01", 0.3, 0.2, 0.4) for step in range(1, periods + 1)]
+        return rows, failed
+
+
+@pytest.fixture
+def batch(monkeypatch, tmp_path):
+    state = {'df': _stats()}
+    fake = FakeProphet()
+    monkeypatch.setattr(forecast_batch, 'load_stats_frame', lambda player_type: state['df'])
+    monkeypatch.setattr(forecast_batch, '_prophet_rows', fake)
+    db_path = str(tmp_path / "forecasts.sqlite")
+
+    def run(periods=5, **kwargs):
+        return precompute_forecasts('batter', engine='prophet', periods=periods, db_path=db_path, **kwargs)
+    return state, fake, run, db_path
+
+
+def test_only_changed_series_are_refit(batch):
+    state, fake, run, db_path = batch
+    first = run()
+    assert first['fitted'] == 2 * len(METRICS)
+
+    # 같은 데이터 버전/기간은 건너뜀
+    assert run()['skipped']
+
+    state['df'] = _stats(last_ops=0.900)
+    second = run()
+    assert fake.calls[-1] == [(2, 'OPS')]
+    assert second['skipped_fits'] == 2 * len(METRICS) - 1
+
+    # 변경 없는 시계열의 예측도 새 데이터 버전으로 조회됨
+    for player_id in (1, 2):
+        forecast = load_forecast('batter', player_id, 'OPS', second['data_version'], 5, db_path=db_path)
+        assert forecast is not None and len(forecast) == 5
+    assert load_forecast('batter', 1, 'OPS', first['data_version'], 5, db_path=db_path) is None
+
+
+def test_periods_change_refits_everything(batch):
+    state, fake, run, db_path = batch
+    version = run(periods=3)['data_version']
+    assert load_forecast('batter', 1, 'OPS', version, 5, db_path=db_path) is None
+
+    result = run(periods=5)
+    assert not result['skipped'] and result['fitted'] == 2 * len(METRICS)
+    assert len(load_forecast('batter', 1, 'OPS', version, 5, db_path=db_path)) == 5
+
+
+def test_failed_refits_are_retried(batch):
+    state, fake, run, db_path = batch
+    run()
+    state['df'] = _stats(last_ops=0.900)
+    fake.fail = {(2, 'OPS')}
+    assert run()['failed'] == 1
+
+    fake.fail = set()
+    state['df'] = _stats(last_ops=0.900).assign(PlayerName=lambda d: d['PlayerName'] + " ")  # 새 데이터 버전
+    run()
+    assert fake.calls[-1] == [(2, 'OPS')]
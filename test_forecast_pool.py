@@ -0,0 +1,54 @@
+"""
+예측 워커 풀 테스트
+워커 프로세스가 비정상 종료된 뒤 ForecastPoolError로 실패를 알리고, 풀이 새 워커로 다시 시작되는지 확인
+"""
+
+import os
+import signal
+
+import pytest
+
+from forecast_pool import ForecastPool, ForecastPoolError, ForecastWorkerError
+
+SEASONS = [2018, 2019, 2020, 2021, 2022]
+VALUES = [0.250, 0.262, 0.271, 0.265, 0.280]
+
+
+@pytest.fixture
+def pool():
+    pool = ForecastPool(workers=1, max_queue=4)
+    yield pool
+    pool.shutdown()
+
+
+def _kill_workers(pool):
+    for process in list(pool._executor._processes.values()):
+        os.kill(process.pid, signal.SIGKILL)
+        process.join()
+
+
+def test_pool_recovers_after_worker_crash(pool):
+    # 워커가 준비될 때까지 한 번 학습
+    assert not pool.result(pool.submit(None, SEASONS, VALUES, 1, 'fast'), timeout=120).empty
+
+    broken = pool._executor
+    future = pool.submit(None, SEASONS, VALUES, 1, 'fast')
+    _kill_workers(pool)
+    with pytest.raises(ForecastPoolError) as excinfo:
+        pool.result(future, timeout=120)
+    assert isinstance(excinfo.value, ForecastWorkerError)
+    assert pool._executor is not broken
+
+    forecast = pool.result(pool.submit(None, SEASONS, VALUES, 1, 'fast'), timeout=120)
+    assert {'yhat', 'yhat_lower', 'yhat_upper'} <= set(forecast.columns)
+
+
+def test_submit_restarts_broken_pool(pool):
+    assert not pool.result(pool.submit(None, SEASONS, VALUES, 1, 'fast'), timeout=120).empty
+
+    broken = pool._executor
+    _kill_workers(pool)
+    # 고장을 보고받은 요청이 없어도 다음 제출은 새 워커로 처리
+    future = pool.submit(None, SEASONS, VALUES, 1, 'fast')
+    assert pool._executor is not broken
+    assert not pool.result(future, timeout=120).empty
@@ -0,0 +1,33 @@
+"""
+선수 이름 검색 인덱스 테스트
+동명이인이 (이름, PlayerID) 쌍별로 모두 검색되고 표시 이름으로 구분되는지 확인
+"""
+
+import pandas as pd
+
+from name_index import PlayerNameIndex
+
+
+def _index():
+    return PlayerNameIndex(pd.DataFrame({
+        'PlayerID': [571970, 571970, 29779, 545361, 545361],
+        'PlayerName': ['Max Muncy', 'Max Muncy', 'Max Muncy', 'Mike Trout', 'Mike Trout'],
+        'Season': [2024, 2025, 2025, 2024, 2025],
+    }))
+
+
+def test_same_name_players_are_all_searchable():
+    index = _index()
+    assert sorted(index.search('max muncy').tolist()) == [29779, 571970]
+    assert index.player_ids_of('Max Muncy') == [571970, 29779]
+    assert index.search_names('muncy') == ['Max Muncy (2024-2025)', 'Max Muncy (2025)']
+
+
+def test_labels_and_season_lists():
+    index = _index()
+    assert index.label(545361) == 'Mike Trout'
+    assert index.name(29779) == 'Max Muncy'
+    assert index.sorted_ids() == [571970, 29779, 545361]
+    assert index.sorted_ids(2024) == [571970, 545361]
+    assert index.sorted_names(2025) == ['Max Muncy', 'Mike Trout']
+    assert index.label(1) == ''
@@ -0,0 +1,70 @@
+"""
+AI 분석 모듈 스모크 테스트
+모델 클라이언트를 대체하여 실제 API 호출 없이 생성, 보고서 캐시 저장/조회, 스트리밍을 확인
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+import player_analysis_ai
+from disk_cache import DiskCache
+
+pytestmark = pytest.mark.skipif(not player_analysis_ai.LANGCHAIN_AVAILABLE, reason="LangChain 미설치")
+
+
+class FakeLLM:
+    """invoke/stream 호출 수를 세고 고정 응답을 돌려주는 모델 대체"""
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.calls = 0
+
+    def invoke(self, messages):
+        self.calls += 1
+        return SimpleNamespace(content="보고서 본문")
+
+    def stream(self, messages):
+        self.calls += 1
+        for text in ("보고서 ", "본문"):
+            yield SimpleNamespace(content=text)
+
+
+@pytest.fixture
+def analyzer(monkeypatch, tmp_path):
+    monkeypatch.setattr(player_analysis_ai, "ChatGoogleGenerativeAI", FakeLLM)
+    cache = DiskCache(str(tmp_path / "ai_reports.sqlite"), 1024 * 1024)
+    monkeypatch.setattr(player_analysis_ai, "get_report_cache", lambda: cache)
+    return player_analysis_ai.PlayerAnalysisAI(api_key="test-key")
+
+
+def test_construct_with_report_cache(analyzer):
+    assert isinstance(analyzer.llm, FakeLLM)
+    assert analyzer.report_cache is not None
+
+
+def test_generate_report_is_cached(analyzer):
+    assert analyzer.get_cached_report("prompt", "v1") is None
+    assert analyzer.generate_report("prompt", "v1") == "보고서 본문"
+    assert analyzer.get_cached_report("prompt", "v1") == "보고서 본문"
+    # 데이터 버전이 바뀌면 다른 키
+    assert analyzer.get_cached_report("prompt", "v2") is None
+
+
+def test_stream_report_caches_full_text(analyzer):
+    assert "".join(analyzer.stream_report("prompt", "v1")) == "보고서 본문"
+    assert analyzer.get_cached_report("prompt", "v1") == "보고서 본문"
+
+
+def test_report_cache_key_depends_on_prompt_and_version():
+    key = player_analysis_ai.report_cache_key("prompt", "v1")
+    assert key == player_analysis_ai.report_cache_key("prompt", "v1")
+    assert key != player_analysis_ai.report_cache_key("prompt", "v2")
+    assert key != player_analysis_ai.report_cache_key("other", "v1")
+
+
+def test_range_label_uses_included_seasons():
+    assert player_analysis_ai._range_label([2003, 2004, 2005, 2006, 2007]) == "2003-2007 (5시즌)"
+    assert player_analysis_ai._range_label([2010, 2012]) == "2010, 2012 (2시즌)"
+    assert player_analysis_ai._range_label([2003, 2004, 2005, 2007]) == "2003-2005, 2007 (4시즌)"
+    assert player_analysis_ai._range_label([2015]) == "시즌 2015"
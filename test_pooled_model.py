@@ -0,0 +1,40 @@
+"""
+리그 공유 모델 테스트
+기록이 한 시즌뿐인 선수의 효과가 리그 곡선 쪽으로 축소되는지 확인
+"""
+
+import numpy as np
+import pandas as pd
+
+from pooled_model import fit_pooled_model, pooled_forecast
+
+
+def _league(seed=0):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for player_id in range(40):
+        first, talent = 2010 + player_id % 8, rng.normal(0, 0.030)
+        for season in range(first, first + 6):
+            rows.append((player_id, season, 0.700 + talent + rng.normal(0, 0.020)))
+    rows += [(998, season, 0.900) for season in range(2014, 2020)]  # 6시즌 내내 .900
+    rows.append((999, 2019, 0.900))  # .900 한 시즌
+    return pd.DataFrame(rows, columns=['PlayerID', 'Season', 'OPS'])
+
+
+def test_one_season_player_is_shrunk_toward_league_curve():
+    model = fit_pooled_model(_league(), ['OPS'])
+    rookie, veteran = model['index'][999], model['index'][998]
+    k = model['shrink_k'][0]
+    assert k > 0
+
+    # 한 시즌(가중치 1) 선수의 효과 = 곡선 대비 잔차 / (1 + k)
+    residual = 0.900 - model['curve'][0, 0]
+    assert np.isclose(model['effect'][rookie, 0], residual / (1 + k))
+    assert 0 < model['effect'][rookie, 0] < residual
+    # 같은 수준을 여러 시즌 보인 선수는 덜 축소됨
+    assert model['effect'][veteran, 0] > model['effect'][rookie, 0]
+    assert model['post_var'][rookie, 0] > model['post_var'][veteran, 0]
+
+    forecast = pooled_forecast(model, 999, 'OPS', periods=1)
+    assert model['curve'][1, 0] < forecast['yhat'].iloc[0] < 0.900
+    assert pooled_forecast(model, 12345, 'OPS') is None
@@ -0,0 +1,35 @@
+"""
+Marcel 예측 테스트
+손으로 계산한 선수의 가중 평균, 리그 평균 회귀, 연간 수렴을 확인
+"""
+
+import numpy as np
+import pandas as pd
+
+from predict import marcel_project
+
+
+def test_marcel_weights_and_regression():
+    df = pd.DataFrame({
+        'PlayerID': [1, 1, 1, 1, 2, 2, 2, 2],
+        'Season': [2019, 2020, 2021, 2022] * 2,
+        'OPS': [0.950, 0.700, 0.800, 0.900, 0.700, 0.700, 0.700, 0.700],
+    })
+    league_avg = pd.DataFrame({'Season': [2019, 2020, 2021, 2022], 'OPS': [0.700] * 4})
+
+    result = marcel_project(df, ['OPS'], periods=3, league_avg=league_avg,
+                            weights=(5, 4, 3), regression=2.0, decay=0.9)
+    player = result[result['PlayerID'] == 1].sort_values('step')
+
+    # 최근 3시즌 가중 평균 (5*.900 + 4*.800 + 3*.700) / 12, 4시즌 전(.950)은 가중치 0
+    weighted = (5 * 0.900 + 4 * 0.800 + 3 * 0.700) / 12
+    # 리그 평균 .700을 가중치 2로 섞어 회귀 -> .800, 이후 해마다 리그 평균과의 차이가 0.9배
+    projected = (12 * weighted + 2 * 0.700) / 14
+    assert np.isclose(projected, 0.800)
+    np.testing.assert_allclose(player['yhat'], [0.800, 0.790, 0.781])
+    assert (player['yhat_lower'] < player['yhat']).all() and (player['yhat'] < player['yhat_upper']).all()
+    # 구간은 기간이 길수록 넓어짐
+    assert np.all(np.diff(player['yhat_upper'] - player['yhat_lower']) > 0)
+
+    # 리그 평균과 같은 선수는 리그 평균 그대로
+    np.testing.assert_allclose(result.loc[result['PlayerID'] == 2, 'yhat'], 0.700)
@@ -0,0 +1,78 @@
+"""
+몬테카를로 시즌 시뮬레이션 테스트
+시드를 고정했을 때 결과가 재현되고, 백분위가 평균을 감싸는지 확인
+"""
+
+import numpy as np
+import pandas as pd
+
+from season_simulator import (
+    BATTER_SIM_STATS, PITCHER_SIM_STATS, project_batter_rates, project_pitcher_rates,
+    simulate_league, simulate_player, summarize_draws,
+)
+
+
+def _batters():
+    rows = []
+    for player_id, (hr, avg) in enumerate([(30, 0.280), (10, 0.250), (20, 0.300)], start=1):
+        for season in (2021, 2022, 2023):
+            at_bats = 500
+            hits = round(at_bats * avg)
+            rows.append({
+                'PlayerID': player_id, 'Season': season, 'AtBats': at_bats, 'Hits': hits,
+                'BattingAverage': avg, 'HomeRuns': hr, 'Walks': 50, 'StrikeOuts': 110,
+                'SluggingPercentage': (hits + 3 * hr + 25) / at_bats, 'RBIs': 2 * hr + 40,
+            })
+    return pd.DataFrame(rows)
+
+
+def _pitchers():
+    rows = []
+    for player_id, era in enumerate([3.00, 4.50], start=1):
+        for season in (2022, 2023):
+            rows.append({
+                'PlayerID': player_id, 'Season': season, 'InningsPitched': 180.1, 'StrikeOuts': 180,
+                'Walks': 50, 'HitsAllowed': 160, 'EarnedRunAverage': era,
+            })
+    return pd.DataFrame(rows)
+
+
+def test_batter_percentiles_bracket_mean_and_are_reproducible():
+    rates = project_batter_rates(_batters())
+    draws = simulate_player(rates, 1, 'batter', n_sims=2000, seed=7)
+    assert set(draws) == set(BATTER_SIM_STATS)
+    assert all(len(values) == 2000 for values in draws.values())
+
+    summary = summarize_draws(draws, percentiles=(10, 50, 90)).set_index('stat')
+    assert (summary['p10'] <= summary['mean']).all()
+    assert (summary['mean'] <= summary['p90']).all()
+    assert (summary['p10'] < summary['p90']).all()
+
+    # 같은 시드면 같은 결과, 다른 시드면 다른 결과
+    again = simulate_player(rates, 1, 'batter', n_sims=2000, seed=7)
+    other = simulate_player(rates, 1, 'batter', n_sims=2000, seed=8)
+    np.testing.assert_array_equal(draws['HomeRuns'], again['HomeRuns'])
+    assert not np.array_equal(draws['HomeRuns'], other['HomeRuns'])
+
+    # 홈런이 많은 선수의 평균 홈런이 더 많음
+    low = simulate_player(rates, 2, 'batter', n_sims=2000, seed=7)
+    assert draws['HomeRuns'].mean() > low['HomeRuns'].mean()
+
+
+def test_unknown_player_returns_none():
+    rates = project_batter_rates(_batters())
+    assert simulate_player(rates, 404, 'batter', n_sims=10) is None
+
+
+def test_league_summary_percentiles_bracket_mean():
+    rates = project_pitcher_rates(_pitchers())
+    summary = simulate_league(rates, 'pitcher', n_sims=2000, seed=7, percentiles=(10, 50, 90), chunk_size=1)
+    assert len(summary) == 2 * len(PITCHER_SIM_STATS)
+    assert (summary['p10'] <= summary['mean']).all()
+    assert (summary['mean'] <= summary['p90']).all()
+
+    again = simulate_league(rates, 'pitcher', n_sims=2000, seed=7, percentiles=(10, 50, 90), chunk_size=1)
+    pd.testing.assert_frame_equal(summary, again)
+
+    era = summary[summary['stat'] == 'EarnedRunAverage'].set_index('PlayerID')['mean']
+    assert era[1] < era[2]
@@ -0,0 +1,79 @@
+"""
+유틸리티 테스트
+- PlayerID 통일: 수집 경로에 따라 PlayerID가 바뀐 같은 선수는 합치고, 같은 시즌에 뛴 동명이인은 분리되는지 확인
+- LTTB 다운샘플링: 양 끝점 유지, 인덱스 순서, 점 수, 짧은 시계열 통과를 확인
+"""
+
+import base64
+
+import numpy as np
+import pandas as pd
+
+from utils import downsample_figure, lttb_indices, read_stats_csv, unify_player_ids
+
+
+def test_same_player_with_switched_ids_is_unified():
+    df = pd.DataFrame({
+        'PlayerID': [111, 111, 9001, 9001],
+        'PlayerName': ['Max Muncy'] * 4,
+        'Season': [2019, 2020, 2021, 2022],
+    })
+    assert unify_player_ids(df).tolist() == [111, 111, 111, 111]
+
+
+def test_same_name_players_in_same_season_stay_separate(tmp_path):
+    path = tmp_path / "stats.csv"
+    pd.DataFrame({
+        'PlayerID': [571970, 571970, 691777, 13301, 13302],
+        'PlayerName': ['Max Muncy'] * 5,
+        'Season': [2023, 2024, 2024, 2025, 2025],
+        'HomeRuns': [36, 15, 0, 19, 4],
+    }).to_csv(path, index=False)
+
+    df = read_stats_csv(path)
+    # 2025년의 두 PlayerID는 시즌이 겹치지 않는 각 선수의 ID로 합쳐지고, 같은 시즌의 동명이인은 분리
+    assert df.groupby(['PlayerID', 'Season']).size().max() == 1
+    assert df['PlayerID'].nunique() == 2
+    assert set(df.loc[df['Season'] == 2024, 'PlayerID']) == {571970, 691777}
+    assert set(df.loc[df['Season'] == 2025, 'PlayerID']) == {571970, 691777}
+
+
+def test_unique_names_are_unchanged():
+    df = pd.DataFrame({'PlayerID': [1, 2], 'PlayerName': ['A', 'B'], 'Season': [2020, 2020]})
+    assert unify_player_ids(df).tolist() == [1, 2]
+
+
+def test_lttb_keeps_endpoints_and_threshold():
+    x = np.arange(1000, dtype=float)
+    y = np.sin(x / 50) + np.random.default_rng(0).normal(0, 0.1, len(x))
+    y[437] = 10.0  # 튀는 점은 반드시 남음
+
+    keep = lttb_indices(x, y, 100)
+    assert len(keep) == 100
+    assert keep[0] == 0 and keep[-1] == len(x) - 1
+    assert np.all(np.diff(keep) > 0)
+    assert 437 in keep
+
+
+def test_lttb_short_series_pass_through():
+    x = np.arange(5, dtype=float)
+    y = np.array([1.0, 3.0, 2.0, 5.0, 4.0])
+    np.testing.assert_array_equal(lttb_indices(x, y, 5), np.arange(5))
+    np.testing.assert_array_equal(lttb_indices(x, y, 10), np.arange(5))
+
+
+def test_downsample_figure_trims_only_long_traces():
+    long_y = np.cos(np.arange(500) / 20).tolist()
+    fig = {'data': [
+        {'type': 'scatter', 'y': long_y, 'customdata': list(range(500))},
+        {'type': 'scatter', 'x': [2021, 2022, 2023], 'y': [0.7, 0.8, 0.75]},
+    ]}
+
+    fig, shown, total = downsample_figure(fig, point_budget=50, decimals=3)
+    assert (shown, total) == (53, 503)
+    long_trace, short_trace = fig['data']
+    x = np.frombuffer(base64.b64decode(long_trace['x']['bdata']), dtype=long_trace['x']['dtype'])
+    assert len(x) == 50 and x[0] == 0 and x[-1] == 499
+    # 점별 부가 데이터도 같은 점만 남음 (x0/dx로 복원한 x가 곧 원래 인덱스)
+    assert long_trace['customdata'] == x.astype(int).tolist()
+    assert short_trace['y'] == [0.7, 0.8, 0.75]
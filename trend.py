@@ -3,9 +3,12 @@ import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 from streamlit_option_menu import option_menu
-from utils import load_data, load_pitcher_data, get_plotly_config, apply_theme_to_figure, calculate_league_averages
+from utils import (
+    load_data, load_pitcher_data, apply_theme_to_figure, calculate_league_averages,
+    get_aging_curves, get_data_version, get_cached_figure, get_chart_labels, localize_figure, show_chart,
+)
 from i18n import get_text, get_metric_names_dict
-from config import BATTING_TREND_METRICS, PITCHING_TREND_METRICS
+from config import BATTING_TREND_METRICS, PITCHING_TREND_METRICS, AGING_MIN_AGE
 
 
 # 이동평균 계산 함수
@@ -31,6 +34,9 @@ def create_animated_trend_chart(league_avg, metric, title, theme="plotly_white")
     """
     애니메이션이 포함된 트렌드 차트를 생성합니다.
 
+    전체 시계열은 한 번만 보내고, 각 프레임은 x축 범위만 바꾸어 시즌을 차례로 드러냅니다.
+    (프레임마다 누적 데이터를 복사하지 않으므로 전송량이 시즌 수에 비례)
+
     Args:
         league_avg: 리그 평균 데이터
         metric: 표시할 지표
@@ -40,27 +46,19 @@ def create_animated_trend_chart(league_avg, metric, title, theme="plotly_white")
     Returns:
         Plotly Figure 객체
     """
-    # 애니메이션 프레임 생성
-    frames = []
-    for i in range(len(league_avg)):
-        frame_data = league_avg.iloc[:i+1]
-        frames.append(go.Frame(
-            data=[go.Scatter(
-                x=frame_data['Season'],
-                y=frame_data[metric],
-                mode='lines+markers',
-                line=dict(color='#636EFA', width=3),
-                marker=dict(size=8),
-                name=metric
-            )],
-            name=str(league_avg.iloc[i]['Season'])
-        ))
+    seasons = league_avg['Season'].tolist()
+    first_season = seasons[0]
+
+    # 레이아웃 전용 프레임: 첫 시즌부터 해당 시즌까지 보이도록 x축 범위만 변경
+    frames = [
+        go.Frame(layout={'xaxis': {'range': [first_season - 0.5, season + 0.5]}}, name=str(season))
+        for season in seasons
+    ]
 
-    # 초기 Figure 생성
     fig = go.Figure(
         data=[go.Scatter(
-            x=league_avg['Season'][:1],
-            y=league_avg[metric][:1],
+            x=league_avg['Season'],
+            y=league_avg[metric],
             mode='lines+markers',
             line=dict(color='#636EFA', width=3),
             marker=dict(size=8),
@@ -69,7 +67,7 @@ def create_animated_trend_chart(league_avg, metric, title, theme="plotly_white")
         frames=frames
     )
 
-    # 애니메이션 버튼 추가
+    # 애니메이션 버튼 추가 (레이아웃만 바뀌므로 다시 그리지 않고 축 범위 전환으로 재생)
     fig.update_layout(
         title={
             'text': title,
@@ -89,9 +87,9 @@ def create_animated_trend_chart(league_avg, metric, title, theme="plotly_white")
                         'label': '▶️ 재생',
                         'method': 'animate',
                         'args': [None, {
-                            'frame': {'duration': 500, 'redraw': True},
+                            'frame': {'duration': 500, 'redraw': False},
                             'fromcurrent': True,
-                            'transition': {'duration': 300}
+                            'transition': {'duration': 300, 'easing': 'linear'}
                         }]
                     },
                     {
@@ -114,15 +112,15 @@ def create_animated_trend_chart(league_avg, metric, title, theme="plotly_white")
             'active': 0,
             'steps': [
                 {
-                    'args': [[f.name], {
-                        'frame': {'duration': 0, 'redraw': True},
+                    'args': [[str(season)], {
+                        'frame': {'duration': 0, 'redraw': False},
                         'mode': 'immediate',
                         'transition': {'duration': 0}
                     }],
                     'label': str(season),
                     'method': 'animate'
                 }
-                for f, season in zip(frames, league_avg['Season'])
+                for season in seasons
             ],
             'x': 0.1,
             'len': 0.9,
@@ -132,7 +130,8 @@ def create_animated_trend_chart(league_avg, metric, title, theme="plotly_white")
         }]
     )
 
-    # Y축 범위 고정
+    # 초기 화면은 첫 시즌만 보이도록 x축 범위 설정, Y축 범위 고정
+    fig.update_xaxes(range=[first_season - 0.5, first_season + 0.5])
     fig.update_yaxes(range=[league_avg[metric].min() * 0.95, league_avg[metric].max() * 1.05])
 
     # 테마 적용
@@ -234,6 +233,54 @@ def create_comparison_area_chart(league_avg, moving_avg_5, metric, title, theme=
     return fig
 
 
+def create_aging_curve_chart(curves, metric, title, by="career", theme="plotly_white"):
+    """
+    사전 계산된 에이징 커브(첫 연차/최소 나이 대비 평균 변화량)를 표시하는 차트를 생성합니다.
+    """
+    column = curves['metrics'].index(metric)
+    curve = curves[by][:, column]
+    # 각 점으로 들어오는 시즌 쌍 수 (첫 점은 기준점이라 0)
+    pairs = [0] + curves[f'{by}_pairs'].tolist()
+    offset = AGING_MIN_AGE if by == 'age' else 0
+    x_values = list(range(offset, offset + len(curve)))
+    x_label = "나이" if by == 'age' else "경력 연차"
+
+    # 표본이 없는 구간 이후는 평평하게 이어지므로 마지막 표본 구간까지만 표시
+    observed = [i for i, n in enumerate(pairs) if n > 0]
+    end = observed[-1] + 1 if observed else len(curve)
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=x_values[:end],
+        y=curve[:end],
+        mode='lines+markers',
+        name=metric,
+        line=dict(color='#636EFA', width=3),
+        marker=dict(size=7),
+        customdata=pairs[:end],
+        hovertemplate=f'<b>{x_label} %{{x}}</b><br>변화량: %{{y:.3f}}<br>시즌 쌍: %{{customdata}}<extra></extra>'
+    ))
+    fig.add_hline(y=0, line_dash='dot', line_color='gray')
+
+    fig.update_layout(
+        title={
+            'text': title,
+            'x': 0.5,
+            'xanchor': 'center',
+            'font': {'size': 20}
+        },
+        xaxis_title=x_label,
+        yaxis_title="평균 변화량",
+        height=500,
+        hovermode='x unified'
+    )
+
+    # 테마 적용
+    fig = apply_theme_to_figure(fig, theme)
+
+    return fig
+
+
 def run_trend(lang="ko"):
     """리그 트렌드 분석 페이지를 실행합니다."""
     df_batters = load_data()
@@ -285,13 +332,17 @@ def run_trend(lang="ko"):
             return pd.Series(0.5, index=series.index)
         return (series - series.min()) / range_val
 
-    def _render_trend_section(league_avg, moving_avg, metrics_list, metric_names, section_label):
+    def _render_trend_section(league_avg, moving_avg, metrics_list, metric_names, section_label, player_type):
         """타자/투수 트렌드 섹션을 렌더링합니다."""
         st.subheader(f"⚾ {section_label}")
 
+        # 차트 캐시 키: 데이터 버전, 지표, 테마 (제목과 언어별 레이블은 덮어쓰기)
+        data_version = get_data_version(player_type)
+        labels = get_chart_labels(metrics_list, lang)
+
         analysis_mode = st.radio(
             "분석 모드 선택",
-            ["📊 단일 지표 애니메이션", "📈 다중 지표 비교", "🔄 이동평균 비교"],
+            ["📊 단일 지표 애니메이션", "📈 다중 지표 비교", "🔄 이동평균 비교", "📉 에이징 커브"],
             horizontal=True,
             key=f"mode_{section_label}"
         )
@@ -307,12 +358,10 @@ def run_trend(lang="ko"):
             )
 
             with st.spinner('애니메이션 차트 생성 중...'):
-                fig = create_animated_trend_chart(
-                    league_avg, selected_metric,
-                    f"MLB 리그 {metric_names.get(selected_metric, selected_metric)} 변화 추이",
-                    theme
-                )
-                st.plotly_chart(fig, use_container_width=True, config=get_plotly_config())
+                fig = get_cached_figure(create_animated_trend_chart, (data_version, selected_metric, theme),
+                                        league_avg, selected_metric, "", theme)
+                fig = localize_figure(fig, labels, title=f"MLB 리그 {metric_names.get(selected_metric, selected_metric)} 변화 추이")
+                show_chart(fig, "trend_animated")
 
         elif analysis_mode == "📈 다중 지표 비교":
             selected_metrics = st.multiselect(
@@ -330,15 +379,35 @@ def run_trend(lang="ko"):
                     for metric in selected_metrics:
                         normalized_data[metric] = _safe_normalize(league_avg[metric])
 
-                    fig = create_multi_line_chart(
-                        normalized_data, selected_metrics,
-                        f"MLB {section_label} 비교 (정규화)", theme
-                    )
-                    st.plotly_chart(fig, use_container_width=True, config=get_plotly_config())
+                    fig = get_cached_figure(create_multi_line_chart, (data_version, tuple(selected_metrics), theme),
+                                            normalized_data, selected_metrics, "", theme)
+                    fig = localize_figure(fig, labels, title=f"MLB {section_label} 비교 (정규화)")
+                    show_chart(fig, "trend_multi_metric")
                     st.info("💡 정규화된 값(0-1)으로 표시되어 서로 다른 단위의 지표를 비교할 수 있습니다.")
             else:
                 st.warning("비교할 지표를 하나 이상 선택해주세요.")
 
+        elif analysis_mode == "📉 에이징 커브":
+            curves = get_aging_curves(player_type, get_data_version(player_type))
+
+            selected_metric = st.selectbox(
+                "분석할 지표 선택",
+                metrics_list,
+                format_func=lambda x: metric_names.get(x, x),
+                key=f"aging_{section_label}"
+            )
+            by = "career"
+            if curves['age'] is not None:
+                by = st.radio("기준", ["career", "age"], format_func=lambda x: {"career": "경력 연차", "age": "나이"}[x],
+                              horizontal=True, key=f"aging_by_{section_label}")
+
+            fig = get_cached_figure(create_aging_curve_chart, (data_version, selected_metric, by, theme),
+                                    curves, selected_metric, "", by, theme)
+            fig = localize_figure(fig, labels, title=f"MLB {metric_names.get(selected_metric, selected_metric)} 에이징 커브")
+            show_chart(fig, "trend_aging_curve")
+            st.info("💡 같은 선수의 연속 두 시즌 차이를 출전량으로 가중 평균하여 누적한 곡선입니다. "
+                    "기록이 있는 첫 시즌 대비 평균 변화량을 나타내며, 예측 엔진(Marcel, 리그 공유 모델)도 같은 곡선을 사용합니다.")
+
         else:  # 이동평균 비교
             selected_metric = st.selectbox(
                 "분석할 지표 선택",
@@ -348,23 +417,23 @@ def run_trend(lang="ko"):
             )
 
             with st.spinner('이동평균 차트 생성 중...'):
-                fig = create_comparison_area_chart(
-                    league_avg, moving_avg, selected_metric,
-                    f"MLB {metric_names.get(selected_metric, selected_metric)} - 리그 평균 vs 이동평균",
-                    theme
+                fig = get_cached_figure(create_comparison_area_chart, (data_version, selected_metric, theme),
+                                        league_avg, moving_avg, selected_metric, "", theme)
+                fig = localize_figure(
+                    fig, labels, title=f"MLB {metric_names.get(selected_metric, selected_metric)} - 리그 평균 vs 이동평균"
                 )
-                st.plotly_chart(fig, use_container_width=True, config=get_plotly_config())
+                show_chart(fig, "trend_moving_average")
                 st.info("💡 이동평균은 단기 변동을 제거하고 장기 트렌드를 파악하는 데 유용합니다.")
 
     if selected == selected_lang_options[0]:  # 타자
         _render_trend_section(
             batting_league_avg, batting_moving_avg_5,
-            BATTING_TREND_METRICS, batting_metric_names, "타자 트렌드 분석"
+            BATTING_TREND_METRICS, batting_metric_names, "타자 트렌드 분석", 'batter'
         )
     else:  # 투수
         _render_trend_section(
             pitching_league_avg, pitching_moving_avg_5,
-            PITCHING_TREND_METRICS, pitching_metric_names, "투수 트렌드 분석"
+            PITCHING_TREND_METRICS, pitching_metric_names, "투수 트렌드 분석", 'pitcher'
         )
 
     # 차트 사용 안내
@@ -67,6 +67,16 @@ def main():
         action='store_true',
         help='기존 데이터 백업 생성'
     )
+    parser.add_argument(
+        '--skip-forecasts',
+        action='store_true',
+        help='업데이트 후 예측 사전 계산 생략'
+    )
+    parser.add_argument(
+        '--skip-ai-reports',
+        action='store_true',
+        help='업데이트 후 AI 보고서 사전 생성 생략'
+    )
     
     args = parser.parse_args()
     
@@ -130,6 +140,24 @@ def main():
                 
         except Exception as e:
             logger.warning(f"통계 출력 실패: {e}")
+
+        # 예측 테이블 사전 계산
+        if not args.skip_forecasts:
+            try:
+                from forecast_batch import run_all
+                logger.info("예측 사전 계산 시작...")
+                for summary in run_all():
+                    logger.info(f"예측 사전 계산 완료: {summary}")
+            except Exception as e:
+                logger.warning(f"예측 사전 계산 실패: {e}")
+
+        # 많이 검색된 선수의 AI 보고서 사전 생성
+        if not args.skip_ai_reports:
+            try:
+                from ai_pregenerate import refresh_ai_reports
+                refresh_ai_reports()
+            except Exception as e:
+                logger.warning(f"AI 보고서 사전 생성 실패: {e}")
         
     else:
         logger.error("모든 데이터 업데이트 방법이 실패했습니다.")
@@ -2,21 +2,61 @@ import pandas as pd
 import streamlit as st
 from PIL import Image
 import os
+import base64
+import hashlib
+import re
 import numpy as np
 from matplotlib import pyplot as plt
 from config import (
     BATTER_STATS_FILE, PITCHER_STATS_FILE, FONT_PATH, MLB_LOGO_PATH,
     DATA_START_YEAR, DATA_END_YEAR, MLB_IMAGE_CDN_URL, CACHE_TTL_SECONDS,
+    METRIC_PRECISION, TABLE_DEFAULT_PRECISION, FIGURE_CACHE_MAX_ENTRIES,
+    CHART_DECIMALS, CHART_WEBGL_THRESHOLD, CHART_POINT_BUDGET,
 )
+from i18n import get_text, get_metric_name
+
+def read_stats_csv(file_path):
+    """CSV 파일을 읽고 컬럼명 정리 및 수치형 결측치 처리를 수행합니다."""
+    df = pd.read_csv(file_path)
+    df = df.rename(columns=lambda x: x.strip())
+    numeric_cols = df.select_dtypes(include=np.number).columns
+    df[numeric_cols] = df[numeric_cols].fillna(0)
+
+    if {'PlayerID', 'PlayerName', 'Season'}.issubset(df.columns):
+        df['PlayerID'] = unify_player_ids(df)
+    return df
+
+def unify_player_ids(df):
+    """
+    수집 경로(MLB API/PyBaseball)에 따라 같은 선수의 PlayerID 체계가 달라지므로,
+    이름이 같고 시즌이 겹치지 않는 PlayerID들을 가장 이른 시즌의 PlayerID로 통일한 PlayerID 시리즈를 반환합니다.
+    같은 시즌에 기록이 있는 PlayerID는 동명이인으로 보고 별도 선수로 유지합니다.
+    """
+    multi = df.groupby('PlayerName')['PlayerID'].transform('nunique') > 1
+    if not multi.any():
+        return df['PlayerID']
+
+    id_seasons = df[multi].groupby(['PlayerName', 'PlayerID'])['Season'].agg(lambda s: set(s.tolist()))
+    aliases = {}
+    for name, group in id_seasons.groupby(level='PlayerName', sort=False):
+        clusters = []  # [대표 PlayerID, 합쳐진 시즌 집합] (첫 시즌 순)
+        for (_, player_id), seasons in sorted(group.items(), key=lambda item: min(item[1])):
+            cluster = next((c for c in clusters if not c[1] & seasons), None)
+            if cluster is None:
+                clusters.append([player_id, set(seasons)])
+            else:
+                cluster[1] |= seasons
+                aliases[(name, player_id)] = cluster[0]
+
+    return pd.Series(
+        [aliases.get(key, key[1]) for key in zip(df['PlayerName'], df['PlayerID'])],
+        index=df.index, dtype=df['PlayerID'].dtype
+    )
 
 def _load_csv_file(file_path, data_name, fallback_fn):
     """CSV 파일을 로드하고 전처리합니다. 실패 시 fallback 함수를 호출합니다."""
     try:
-        df = pd.read_csv(file_path)
-        df = df.rename(columns=lambda x: x.strip())
-        numeric_cols = df.select_dtypes(include=np.number).columns
-        df[numeric_cols] = df[numeric_cols].fillna(0)
-        return df
+        return read_stats_csv(file_path)
     except FileNotFoundError:
         st.error(f"{data_name} 데이터 파일을 찾을 수 없습니다: {file_path}")
         st.info("샘플 데이터를 대신 사용합니다.")
@@ -36,6 +76,82 @@ def load_pitcher_data():
     """투수 데이터를 로드합니다."""
     return _load_csv_file(PITCHER_STATS_FILE, "투수", _create_sample_pitcher_data)
 
+def compute_data_version(df):
+    """데이터프레임 내용으로부터 데이터 버전(내용 해시)을 계산합니다."""
+    row_hashes = pd.util.hash_pandas_object(df, index=False).values
+    return hashlib.sha1(row_hashes.tobytes()).hexdigest()[:16]
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def get_data_version(player_type):
+    """현재 로드된 타자('batter')/투수('pitcher') 데이터의 버전을 반환합니다."""
+    df = load_data() if player_type == 'batter' else load_pitcher_data()
+    return compute_data_version(df)
+
+@st.cache_resource(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def get_aging_curves(player_type, data_version):
+    """
+    선수 유형의 에이징 커브를 데이터 버전별로 한 번만 준비합니다. (사전 계산 파일이 같은 버전이면 그대로 로드)
+    (읽기 전용으로 공유되므로 반환값을 수정하지 마세요.)
+    """
+    from aging_curves import resolve_aging_curves
+    df = load_data() if player_type == 'batter' else load_pitcher_data()
+    return resolve_aging_curves(df, player_type, data_version)
+
+@st.cache_resource(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def get_player_name_index(player_type, data_version):
+    """
+    선수 유형의 이름 검색 인덱스를 데이터 버전별로 한 번만 만듭니다.
+    (읽기 전용으로 공유되므로 반환값을 수정하지 마세요.)
+    """
+    from name_index import PlayerNameIndex
+    df = load_data() if player_type == 'batter' else load_pitcher_data()
+    return PlayerNameIndex(df)
+
+# 지표 외 컬럼의 다국어 헤더 키
+_COLUMN_TEXT_KEYS = {'Season': 'season', 'Team': 'team', 'PlayerName': 'player'}
+
+def get_column_label(column, lang="ko"):
+    """컬럼 이름의 다국어 헤더를 반환합니다. (번역이 없으면 컬럼 이름 그대로)"""
+    key = _COLUMN_TEXT_KEYS.get(column, f"metric_{column}")
+    text = get_text(key, lang)
+    return column if text == key else text
+
+def build_column_config(df, lang="ko", precision=None, formats=None, labels=None):
+    """
+    st.dataframe용 컬럼 설정(st.column_config)을 만듭니다.
+    Styler처럼 셀마다 서식 문자열을 만들어 보내지 않고, 원본 값을 Arrow로 보낸 뒤 브라우저에서 서식을 적용합니다.
+
+    Args:
+        df: 표시할 데이터프레임
+        lang: 헤더 언어
+        precision: {컬럼: 소수 자릿수} (METRIC_PRECISION보다 우선)
+        formats: {컬럼: printf 형식 문자열} (예: "%+.1f%%", precision보다 우선)
+        labels: {컬럼: 헤더} (다국어 헤더보다 우선)
+    """
+    precision = {**METRIC_PRECISION, **(precision or {})}
+    formats = formats or {}
+    labels = labels or {}
+
+    config = {}
+    for column in df.columns:
+        label = labels.get(column) or get_column_label(column, lang)
+        dtype = df[column].dtype
+        if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+            digits = precision.get(column, 0 if pd.api.types.is_integer_dtype(dtype) else TABLE_DEFAULT_PRECISION)
+            config[column] = st.column_config.NumberColumn(label, format=formats.get(column, f"%.{digits}f"))
+        else:
+            config[column] = st.column_config.Column(label)
+    return config
+
+def show_table(df, lang="ko", precision=None, formats=None, labels=None, **kwargs):
+    """
+    지표별 소수 자릿수와 다국어 헤더를 적용하여 데이터프레임을 표시합니다. (Styler 없이 Arrow로 전송)
+    인덱스를 표시하려면 reset_index()로 컬럼으로 바꾸어 전달하세요. 나머지 인자는 st.dataframe에 전달됩니다.
+    """
+    kwargs.setdefault('use_container_width', True)
+    kwargs.setdefault('hide_index', True)
+    st.dataframe(df, column_config=build_column_config(df, lang, precision, formats, labels), **kwargs)
+
 def calculate_league_averages(df, metrics):
     """시즌별 리그 평균을 계산합니다."""
     return df.groupby('Season')[metrics].mean().reset_index()
@@ -312,3 +428,226 @@ def apply_theme_to_figure(fig, theme="plotly_white"):
     fig.update_yaxes(gridcolor=colors['grid_color'])
 
     return fig
+
+# 차트 캐시 및 다국어 레이블 덮어쓰기
+@st.cache_data(ttl=CACHE_TTL_SECONDS, max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+def _cached_figure_dict(builder_name, key, _builder, _args, _kwargs):
+    # 밑줄로 시작하는 인자(생성 함수와 데이터프레임 인자)는 해시하지 않고, builder_name과 key만 캐시 키로 사용
+    return optimize_figure(_builder(*_args, **_kwargs).to_dict())
+
+def get_cached_figure(builder, key, *args, **kwargs):
+    """
+    차트 생성 함수의 결과를 figure 딕셔너리로 캐시합니다.
+
+    key에는 데이터 버전, 선수 ID, 지표, 테마 등 그림 내용을 결정하는 값을 모두 넣어야 합니다. (언어는 제외)
+    같은 키로 다시 보면 차트 생성을 건너뛰고 캐시 복사본을 반환하며,
+    언어별 제목과 레이블은 localize_figure로 덮어씁니다.
+
+    Args:
+        builder: Plotly Figure를 반환하는 차트 생성 함수
+        key: 해시 가능한 캐시 키 튜플
+        *args, **kwargs: 차트 생성 함수 인자 (캐시 키에 포함되지 않음)
+    """
+    return _cached_figure_dict(f"{builder.__module__}.{builder.__qualname__}", key, builder, args, kwargs)
+
+def get_chart_labels(metrics, lang="ko"):
+    """차트의 지표 키와 공통 한국어 레이블을 선택한 언어로 바꾸는 {원래 레이블: 표시 레이블} 딕셔너리를 반환합니다."""
+    labels = {metric: get_metric_name(metric, lang) for metric in metrics}
+    labels.update({'시즌': get_text('season', lang), '리그 평균': get_text('league_average', lang)})
+    return labels
+
+# 호버 템플릿의 "<b>레이블</b>", "<br>레이블:" 부분
+_HOVER_LABEL_PATTERN = re.compile(r'(?<=<b>)[^<>]+(?=</b>)|(?<=<br>)[^<>:]+(?=:)')
+
+def localize_figure(fig, labels=None, title=None):
+    """
+    캐시된 figure 딕셔너리에 언어별 레이블을 덮어씁니다. (캐시 복사본을 직접 수정하여 반환)
+    제목, 서브플롯 제목, 축 제목, 범례 이름, 범주형 x/theta 값, 호버 레이블 중 labels에 있는 문자열을 바꿉니다.
+    """
+    labels = labels or {}
+    swap = lambda text: labels.get(text, text) if isinstance(text, str) else text
+
+    layout = fig.setdefault('layout', {})
+    if title is not None:
+        layout.setdefault('title', {})['text'] = title
+    for annotation in layout.get('annotations', []):
+        annotation['text'] = swap(annotation.get('text'))
+    for name, axis in layout.items():
+        if name.startswith(('xaxis', 'yaxis')) and isinstance(axis.get('title'), dict):
+            axis['title']['text'] = swap(axis['title'].get('text'))
+
+    for trace in fig.get('data', []):
+        if 'name' in trace:
+            trace['name'] = swap(trace['name'])
+        for dim in ('x', 'theta'):
+            # 숫자 배열은 {'dtype', 'bdata'} 딕셔너리로 인코딩되어 있으므로 문자열 리스트/튜플만 변환
+            values = trace.get(dim)
+            if isinstance(values, (list, tuple)) and values and all(isinstance(v, str) for v in values):
+                trace[dim] = [swap(v) for v in values]
+        if 'hovertemplate' in trace:
+            trace['hovertemplate'] = _HOVER_LABEL_PATTERN.sub(lambda m: swap(m.group(0)), trace['hovertemplate'])
+    return fig
+
+# 차트 전송량 최적화
+_INT_DTYPES = (np.int8, np.uint8, np.int16, np.uint16, np.int32, np.uint32)
+
+def _decode_array(values):
+    """trace의 숫자 배열(Plotly 이진 인코딩 딕셔너리 또는 숫자 리스트)을 1차원 NumPy 배열로 변환합니다. 숫자 배열이 아니면 None"""
+    if isinstance(values, dict):
+        if set(values) != {'dtype', 'bdata'}:
+            return None
+        return np.frombuffer(base64.b64decode(values['bdata']), dtype=np.dtype(values['dtype']))
+    if isinstance(values, (list, tuple, np.ndarray)) and len(values):
+        array = np.asarray(values)
+        if array.ndim == 1 and array.dtype.kind in 'iuf':
+            return array
+    return None
+
+def _encode_array(array, decimals):
+    """반올림한 값을 표현할 수 있는 가장 작은 형식(정수 또는 float32)으로 Plotly 이진 인코딩합니다."""
+    array = np.round(array.astype(np.float64), decimals)
+    if np.isfinite(array).all() and (array == np.round(array)).all():
+        for dtype in _INT_DTYPES:
+            info = np.iinfo(dtype)
+            if array.min() >= info.min and array.max() <= info.max:
+                array = array.astype(dtype)
+                break
+    if array.dtype.kind == 'f':
+        array = array.astype(np.float32)
+    return {'dtype': array.dtype.str.lstrip('<|'), 'bdata': base64.b64encode(array.tobytes()).decode('ascii')}
+
+def optimize_figure(fig, decimals=CHART_DECIMALS, webgl_threshold=CHART_WEBGL_THRESHOLD):
+    """
+    브라우저로 보낼 figure 딕셔너리의 전송량을 줄입니다. (딕셔너리를 직접 수정하여 반환)
+
+    - x, y, r 숫자 배열을 표시 정밀도(decimals)로 반올림하여 정수 또는 float32로 인코딩
+    - 등간격 x 배열(시즌 등)은 x0/dx로 바꾸어 trace마다 같은 x 배열을 반복하지 않음
+    - 점 수가 webgl_threshold를 넘는 scatter trace는 Scattergl로 전환 (애니메이션 프레임/채우기가 없는 경우)
+    """
+    animated = bool(fig.get('frames'))
+    for trace in fig.get('data', []):
+        trace_type = trace.get('type', 'scatter')
+        for dim in ('x', 'y', 'r'):
+            array = _decode_array(trace.get(dim))
+            if array is None or array.size == 0:
+                continue
+            steps = np.diff(array)
+            if (dim == 'x' and trace_type in ('scatter', 'scattergl') and len(array) >= 3
+                    and np.isfinite(array).all() and np.allclose(steps, steps[0]) and steps[0] != 0):
+                del trace['x']
+                trace['x0'], trace['dx'] = array[0].item(), round(steps[0].item(), decimals)
+                continue
+            trace[dim] = _encode_array(array, decimals)
+            if (dim == 'y' and trace_type == 'scatter' and len(array) > webgl_threshold
+                    and not animated and 'fill' not in trace):
+                trace['type'] = 'scattergl'
+    return fig
+
+def lttb_indices(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets 다운샘플링으로 남길 점의 인덱스를 반환합니다.
+
+    첫 점과 마지막 점은 유지하고, 나머지 점을 n_out - 2개 구간으로 나누어 구간마다
+    (직전 선택 점, 구간 점, 다음 구간 평균점)이 이루는 삼각형 넓이가 가장 큰 점 하나를 고릅니다.
+    구간 평균은 한 번에 계산하고, 순차 의존성이 있는 선택만 구간 단위로 반복합니다.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)  # 내부 점 [1, n - 1)을 나누는 구간 경계
+    counts = np.diff(edges)
+    y_filled = np.where(np.isnan(y), np.nanmean(y), y)
+    # 구간 b의 다음 점 = 구간 b + 1의 평균점 (마지막 구간은 마지막 점)
+    next_x = np.append((np.add.reduceat(x[:n - 1], edges[:-1]) / counts)[1:], x[-1])
+    next_y = np.append((np.add.reduceat(y_filled[:n - 1], edges[:-1]) / counts)[1:], y_filled[-1])
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        area = np.abs((x[a] - next_x[b]) * (y_filled[lo:hi] - y_filled[a])
+                      - (x[a] - x[lo:hi]) * (next_y[b] - y_filled[a]))
+        a = lo + int(np.argmax(area))
+        selected[b + 1] = a
+    return selected
+
+def _trace_x(trace, n):
+    """trace의 x 배열 (x0/dx로 표현된 경우 복원)"""
+    if 'x' in trace:
+        return _decode_array(trace['x'])
+    return trace.get('x0', 0) + trace.get('dx', 1) * np.arange(n)
+
+def downsample_figure(fig, point_budget=CHART_POINT_BUDGET, decimals=CHART_DECIMALS):
+    """
+    점 수가 point_budget을 넘는 선 차트 trace를 LTTB로 줄입니다. (딕셔너리를 직접 수정)
+
+    Returns:
+        (figure 딕셔너리, 표시 점 수, 전체 점 수) - 줄인 trace가 없으면 두 점 수가 같음
+    """
+    shown = total = 0
+    for trace in fig.get('data', []):
+        y = _decode_array(trace.get('y'))
+        if trace.get('type', 'scatter') not in ('scatter', 'scattergl') or y is None:
+            continue
+        total += len(y)
+        x = _trace_x(trace, len(y))
+        if x is None or len(y) <= point_budget or len(x) != len(y):
+            shown += len(y)
+            continue
+
+        keep = lttb_indices(x, y, point_budget)
+        trace.pop('x0', None)
+        trace.pop('dx', None)
+        trace['x'] = _encode_array(x[keep], decimals)
+        trace['y'] = _encode_array(y[keep], decimals)
+        # 점별 부가 데이터도 같은 점만 남김
+        for key in ('customdata', 'text', 'hovertext'):
+            values = trace.get(key)
+            if isinstance(values, (list, tuple)) and len(values) == len(y):
+                trace[key] = [values[i] for i in keep]
+        shown += len(keep)
+    return fig, shown, total
+
+def show_chart(fig, chart_name, point_budget=CHART_POINT_BUDGET, **kwargs):
+    """
+    차트를 전송량 최적화 후 표시하고, 직렬화된 크기를 앱 메트릭에 기록합니다.
+
+    Args:
+        fig: Plotly Figure 또는 figure 딕셔너리 (get_cached_figure 결과는 이미 최적화됨)
+        chart_name: 메트릭에 기록할 차트 이름 (전체 해상도 토글의 위젯 키로도 사용)
+        point_budget: trace당 표시 점 수 상한 (초과하는 선 차트는 LTTB로 다운샘플링, None이면 사용 안 함)
+        **kwargs: st.plotly_chart 인자 (기본값: use_container_width=True, config=get_plotly_config())
+
+    다운샘플링된 경우 차트 아래의 '전체 해상도' 토글을 켜면 원본 점 전체로 다시 그립니다.
+    (확대해서 세부 구간을 보거나 이미지로 내보낼 때 사용)
+    """
+    import plotly.io as pio
+
+    if not isinstance(fig, dict):
+        fig = optimize_figure(fig.to_dict())
+    full_key = f"{chart_name}_full_resolution"
+    if point_budget and not st.session_state.get(full_key, False):
+        fig, shown, total = downsample_figure(fig, point_budget)
+        downsampled_charts = st.session_state.setdefault('_downsampled_charts', {})
+        if shown < total:
+            downsampled_charts[chart_name] = (shown, total)
+        else:
+            downsampled_charts.pop(chart_name, None)
+    tracker = st.session_state.get('metric_tracker')
+    if tracker is not None and hasattr(tracker, 'log_chart_payload'):
+        tracker.log_chart_payload(chart_name, len(pio.to_json(fig, validate=False)))
+
+    kwargs.setdefault('use_container_width', True)
+    kwargs.setdefault('config', get_plotly_config())
+    st.plotly_chart(fig, **kwargs)
+
+    downsampled = st.session_state.get('_downsampled_charts', {}).get(chart_name)
+    if downsampled:
+        shown, total = downsampled
+        st.toggle("전체 해상도", key=full_key,
+                  help=f"점 {total:,}개 중 {shown:,}개(LTTB)로 줄여 표시 중입니다. "
+                       "확대하거나 이미지로 내보낼 때 켜면 전체 점으로 다시 그립니다.")